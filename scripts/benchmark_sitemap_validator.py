@@ -0,0 +1,422 @@
+#!/usr/bin/env python3
+"""
+Sitemap Validator Benchmarks
+
+Measures the resource usage of validate_sitemap_urls.py on synthetic sitemaps,
+without any network access.
+
+Benchmarks:
+- memory: bytes retained per validated URL after a full validation run
+  against the in-process mock origin (report, result memo and hreflang
+  graph), comparing the slotted URLResult with the previous dict/list
+  layout
+- throughput: full validation runs against an in-process mock origin (served
+  through an httpx transport) with configurable latency, redirect chains,
+  404s and 429s; reports URLs/sec, peak RSS and event-loop lag for each
+  --concurrency value, every run in a fresh process
+
+Usage:
+    python scripts/benchmark_sitemap_validator.py memory
+    python scripts/benchmark_sitemap_validator.py memory --urls 200000
+    python scripts/benchmark_sitemap_validator.py throughput
+    python scripts/benchmark_sitemap_validator.py throughput --urls 20000 --concurrency 10,50,200
+    python scripts/benchmark_sitemap_validator.py throughput --latency uniform:5:120 --throttle-rate 0.05 --adaptive
+"""
+
+import argparse
+import asyncio
+import contextlib
+import gc
+import io
+import math
+import multiprocessing
+import random
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import MISSING, asdict, dataclass, field, fields, make_dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Set
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows; peak RSS is then not reported
+    resource = None
+
+import httpx
+
+import validate_sitemap_urls
+from validate_sitemap_urls import (
+    LOCALES,
+    NAMESPACES,
+    SITEMAP_INDEX_PATH,
+    SITEMAP_SEGMENTS,
+    SitemapValidator,
+    URLResult,
+    ValidatorOptions,
+)
+
+BASE_URL = 'https://bench.example'
+DEFAULT_MEMORY_URLS = 50_000  # Results are retained, so the bounded result memo plays no part
+CONTENT_TYPE = 'text/html; charset=utf-8'
+
+# Throughput benchmark defaults
+DEFAULT_THROUGHPUT_URLS = 5_000
+DEFAULT_CONCURRENCY_LEVELS = '10,50,100'
+DEFAULT_LATENCY = 'lognormal:20:0.6'  # Median 20ms with a long tail
+DEFAULT_REDIRECT_RATE = 0.05
+DEFAULT_NOT_FOUND_RATE = 0.01
+DEFAULT_THROTTLE_RATE = 0.01
+REDIRECT_HOP_SUFFIXES = ['~hop', '~final']  # A redirected URL answers 301 -> 308 -> 200
+LAG_SAMPLE_INTERVAL = 0.01  # Seconds between event-loop lag probes
+
+
+def parse_latency(spec: str) -> Callable[[random.Random], float]:
+    """Parse a latency distribution: fixed:MS, uniform:MIN_MS:MAX_MS or lognormal:MEDIAN_MS:SIGMA"""
+    kind, _, params = spec.partition(':')
+    try:
+        values = [float(value) for value in params.split(':')] if params else []
+    except ValueError:
+        raise ValueError(f"invalid latency distribution: {spec!r}")
+    
+    if kind == 'fixed' and len(values) == 1:
+        return lambda rng: values[0] / 1000
+    if kind == 'uniform' and len(values) == 2:
+        return lambda rng: rng.uniform(values[0], values[1]) / 1000
+    if kind == 'lognormal' and len(values) == 2 and values[0] > 0:
+        return lambda rng: rng.lognormvariate(math.log(values[0]), values[1]) / 1000
+    raise ValueError(f"invalid latency distribution: {spec!r}")
+
+
+@dataclass
+class OriginProfile:
+    """Size and behaviour of the synthetic origin"""
+    urls: int = DEFAULT_THROUGHPUT_URLS
+    latency: str = DEFAULT_LATENCY
+    redirect_rate: float = DEFAULT_REDIRECT_RATE
+    not_found_rate: float = DEFAULT_NOT_FOUND_RATE
+    throttle_rate: float = DEFAULT_THROTTLE_RATE  # Share of URLs answering 429 on their first request
+    seed: int = 1
+
+
+class SyntheticOrigin:
+    """In-process stand-in for the site, served through httpx.MockTransport
+    
+    Pages are spread over SITEMAP_SEGMENTS with one URL per locale, all
+    declaring each other as hreflang alternates. Sitemaps are answered
+    immediately; pages wait for a sampled latency first.
+    """
+
+    def __init__(self, profile: OriginProfile):
+        self.rng = random.Random(profile.seed)
+        self.latency = parse_latency(profile.latency)
+        self.sitemaps: Dict[str, bytes] = {}
+        self.redirects: Set[str] = set()
+        self.not_found: Set[str] = set()
+        self.throttled: Set[str] = set()
+        self.requests: Counter = Counter()
+        
+        paths_by_segment: Dict[str, List[Dict[str, str]]] = {segment: [] for segment in SITEMAP_SEGMENTS}
+        pages = math.ceil(profile.urls / len(LOCALES))
+        for page in range(pages):
+            segment = SITEMAP_SEGMENTS[page % len(SITEMAP_SEGMENTS)]
+            cluster = {locale: f"/{locale}/{segment}/page-{page}" for locale in LOCALES}
+            paths_by_segment[segment].append(cluster)
+            for path in cluster.values():
+                roll = self.rng.random()
+                if roll < profile.redirect_rate:
+                    self.redirects.add(path)
+                elif roll < profile.redirect_rate + profile.not_found_rate:
+                    self.not_found.add(path)
+                if self.rng.random() < profile.throttle_rate:
+                    self.throttled.add(path)
+        
+        for segment, clusters in paths_by_segment.items():
+            self.sitemaps[f"/sitemap-{segment}.xml"] = self._urlset(clusters)
+        self.sitemaps[SITEMAP_INDEX_PATH] = self._sitemap_index()
+
+    def _urlset(self, clusters: List[Dict[str, str]]) -> bytes:
+        lines = [
+            '<?xml version="1.0" encoding="UTF-8"?>',
+            f'<urlset xmlns="{NAMESPACES["ns"]}" xmlns:xhtml="{NAMESPACES["xhtml"]}">'
+        ]
+        for cluster in clusters:
+            alternates = ''.join(
+                f'<xhtml:link rel="alternate" hreflang="{locale}" href="{BASE_URL}{path}"/>'
+                for locale, path in [*cluster.items(), ('x-default', cluster[LOCALES[0]])]
+            )
+            for path in cluster.values():
+                lines.append(f'<url><loc>{BASE_URL}{path}</loc><lastmod>2024-06-01</lastmod>{alternates}</url>')
+        lines.append('</urlset>')
+        return '\n'.join(lines).encode('utf-8')
+
+    def _sitemap_index(self) -> bytes:
+        entries = ''.join(
+            f'<sitemap><loc>{BASE_URL}/sitemap-{segment}.xml</loc></sitemap>' for segment in SITEMAP_SEGMENTS
+        )
+        return f'<?xml version="1.0" encoding="UTF-8"?><sitemapindex xmlns="{NAMESPACES["ns"]}">{entries}</sitemapindex>'.encode('utf-8')
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handle)
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path in self.sitemaps:
+            return httpx.Response(200, content=self.sitemaps[path], headers={'Content-Type': 'application/xml'})
+        
+        await asyncio.sleep(self.latency(self.rng))
+        self.requests[request.method] += 1
+        
+        page, _, hop = path.partition('~')
+        if page in self.throttled:
+            self.throttled.discard(page)
+            self.requests['429'] += 1
+            return httpx.Response(429)
+        if page in self.not_found:
+            return httpx.Response(404, text='Not Found', headers={'Content-Type': 'text/html'})
+        if page in self.redirects and not hop:
+            return httpx.Response(301, headers={'Location': f"{BASE_URL}{page}{REDIRECT_HOP_SUFFIXES[0]}"})
+        if page in self.redirects and f"~{hop}" == REDIRECT_HOP_SUFFIXES[0]:
+            return httpx.Response(308, headers={'Location': f"{BASE_URL}{page}{REDIRECT_HOP_SUFFIXES[1]}"})
+        
+        html = f'<!DOCTYPE html><html><head><title>{page}</title></head><body>{page}</body></html>'
+        return httpx.Response(200, text=html, headers={'Content-Type': CONTENT_TYPE})
+
+
+class LoopLagMonitor:
+    """Measures event-loop lag: how much later than asked a short sleep wakes up"""
+
+    def __init__(self, interval: float = LAG_SAMPLE_INTERVAL):
+        self.interval = interval
+        self.samples: List[float] = []
+        self._task: Optional[asyncio.Task] = None
+
+    async def _probe(self):
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, time.perf_counter() - started - self.interval))
+
+    def start(self):
+        self._task = asyncio.create_task(self._probe())
+
+    async def stop(self):
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+
+    def percentile(self, percent: float) -> float:
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, math.ceil(len(ordered) * percent / 100) - 1)]
+
+
+async def validate_quietly(validator: SitemapValidator):
+    """Run a full validation with the validator's own progress output discarded"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return await validator.validate_all_sitemaps()
+
+
+def legacy_result_class() -> type:
+    """URLResult with its layout before results were slotted: a per-instance __dict__ and fresh lists"""
+    legacy_fields = []
+    for result_field in fields(URLResult):
+        if result_field.default == ():
+            spec = field(default_factory=list)
+        else:
+            spec = field(default=result_field.default, default_factory=result_field.default_factory)
+        legacy_fields.append((result_field.name, result_field.type, spec))
+    return make_dataclass('LegacyURLResult', legacy_fields)
+
+
+@contextlib.contextmanager
+def result_layout(result_class: type) -> Iterator[None]:
+    """Make the validator create its URL results as ``result_class``"""
+    validate_sitemap_urls.URLResult = result_class
+    try:
+        yield
+    finally:
+        validate_sitemap_urls.URLResult = URLResult
+
+
+def measure_retained_bytes(total_urls: int, result_class: type = URLResult) -> int:
+    """Bytes still allocated after validating ``total_urls`` URLs, with the report and validator alive"""
+    # Instant, error-free pages: only what the validator keeps per URL is measured
+    profile = OriginProfile(urls=total_urls, latency='fixed:0', redirect_rate=0.0,
+                            not_found_rate=0.0, throttle_rate=0.0)
+    origin = SyntheticOrigin(profile)
+    validator = SitemapValidator(BASE_URL, ValidatorOptions(concurrency=50), transport=origin.transport())
+    gc.collect()
+    tracemalloc.start()
+    with result_layout(result_class):
+        report = asyncio.run(validate_quietly(validator))
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert report.valid_urls == total_urls
+    return current
+
+
+def run_memory_benchmark(total_urls: int) -> Dict[str, float]:
+    """Bytes per URL of the same real run with the previous and the current result layout"""
+    # Warm-up run, so modules imported lazily during the first run are not counted
+    measure_retained_bytes(min(total_urls, 100))
+    return {
+        'legacy': measure_retained_bytes(total_urls, legacy_result_class()) / total_urls,
+        'compact': measure_retained_bytes(total_urls) / total_urls,
+    }
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """Peak resident set size of this process"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+async def measure_throughput(profile: OriginProfile, concurrency: int, options: Dict) -> Dict:
+    """Validate the synthetic site once and collect throughput, lag and request counts"""
+    origin = SyntheticOrigin(profile)
+    validator = SitemapValidator(
+        BASE_URL,
+        ValidatorOptions(concurrency=concurrency, retain_results=False, **options),
+        transport=origin.transport()
+    )
+    
+    lag = LoopLagMonitor()
+    lag.start()
+    started = time.perf_counter()
+    # The validator's own progress output would drown the benchmark table
+    report = await validate_quietly(validator)
+    elapsed = time.perf_counter() - started
+    await lag.stop()
+    
+    return {
+        'concurrency': concurrency,
+        'urls': report.total_urls,
+        'seconds': elapsed,
+        'urls_per_second': report.total_urls / elapsed if elapsed else 0.0,
+        'peak_rss': peak_rss_bytes(),
+        'lag_p99': lag.percentile(99),
+        'lag_max': max(lag.samples, default=0.0),
+        'failed': report.failed_urls,
+        'redirects': report.redirect_urls,
+        'retries': validator.result_counts['retries'],
+        'requests': sum(origin.requests[method] for method in ('HEAD', 'GET'))
+    }
+
+
+def run_throughput_isolated(profile: Dict, concurrency: int, options: Dict) -> Dict:
+    """Process entry point, so peak RSS belongs to a single run"""
+    return asyncio.run(measure_throughput(OriginProfile(**profile), concurrency, options))
+
+
+def run_throughput_benchmark(profile: OriginProfile, concurrency_levels: List[int], options: Dict) -> List[Dict]:
+    """One fresh process per concurrency level"""
+    context = multiprocessing.get_context('spawn')
+    results = []
+    for concurrency in concurrency_levels:
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            results.append(executor.submit(run_throughput_isolated, asdict(profile), concurrency, options).result())
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the sitemap URL validator on synthetic sitemaps')
+    subparsers = parser.add_subparsers(dest='benchmark', required=True)
+    
+    memory_parser = subparsers.add_parser('memory', help='Bytes retained per validated URL')
+    memory_parser.add_argument(
+        '--urls',
+        type=int,
+        default=DEFAULT_MEMORY_URLS,
+        help=f'Number of synthetic sitemap URLs (default: {DEFAULT_MEMORY_URLS})'
+    )
+    
+    throughput_parser = subparsers.add_parser('throughput', help='URLs/sec, peak RSS and loop lag per concurrency')
+    throughput_parser.add_argument(
+        '--urls',
+        type=int,
+        default=DEFAULT_THROUGHPUT_URLS,
+        help=f'Number of synthetic sitemap URLs (default: {DEFAULT_THROUGHPUT_URLS})'
+    )
+    throughput_parser.add_argument(
+        '--concurrency',
+        default=DEFAULT_CONCURRENCY_LEVELS,
+        help=f'Comma-separated --concurrency values to compare (default: {DEFAULT_CONCURRENCY_LEVELS})'
+    )
+    throughput_parser.add_argument(
+        '--latency',
+        default=DEFAULT_LATENCY,
+        help=f'Page latency distribution: fixed:MS, uniform:MIN_MS:MAX_MS or lognormal:MEDIAN_MS:SIGMA '
+             f'(default: {DEFAULT_LATENCY})'
+    )
+    throughput_parser.add_argument(
+        '--redirect-rate',
+        type=float,
+        default=DEFAULT_REDIRECT_RATE,
+        help=f'Share of URLs behind a two-hop redirect chain (default: {DEFAULT_REDIRECT_RATE})'
+    )
+    throughput_parser.add_argument(
+        '--not-found-rate',
+        type=float,
+        default=DEFAULT_NOT_FOUND_RATE,
+        help=f'Share of URLs answering 404 (default: {DEFAULT_NOT_FOUND_RATE})'
+    )
+    throughput_parser.add_argument(
+        '--throttle-rate',
+        type=float,
+        default=DEFAULT_THROTTLE_RATE,
+        help=f'Share of URLs answering 429 on their first request (default: {DEFAULT_THROTTLE_RATE})'
+    )
+    throughput_parser.add_argument('--seed', type=int, default=1, help='Seed of the synthetic site (default: 1)')
+    throughput_parser.add_argument('--parallel-segments', action='store_true', help='Validate segments in parallel')
+    throughput_parser.add_argument('--stream', action='store_true', help='Validate URLs while sitemaps download')
+    throughput_parser.add_argument('--adaptive', action='store_true', help='Use adaptive concurrency')
+    
+    args = parser.parse_args()
+    
+    if args.benchmark == 'memory':
+        print(f"Validating {args.urls:,} synthetic URLs ({len(LOCALES)} locales per page) against the mock origin...")
+        per_url = run_memory_benchmark(args.urls)
+        print(f"{'layout':<10} {'bytes/URL':>10}")
+        for layout, bytes_per_url in per_url.items():
+            print(f"{layout:<10} {bytes_per_url:>10.0f}")
+        saved = 1 - per_url['compact'] / per_url['legacy']
+        print(f"Compact layout saves {per_url['legacy'] - per_url['compact']:.0f} bytes/URL ({saved:.0%})")
+    
+    elif args.benchmark == 'throughput':
+        try:
+            parse_latency(args.latency)
+            concurrency_levels = [int(value) for value in args.concurrency.split(',') if value.strip()]
+        except ValueError as e:
+            parser.error(str(e))
+        
+        profile = OriginProfile(
+            urls=args.urls,
+            latency=args.latency,
+            redirect_rate=args.redirect_rate,
+            not_found_rate=args.not_found_rate,
+            throttle_rate=args.throttle_rate,
+            seed=args.seed
+        )
+        options = {'parallel_segments': args.parallel_segments, 'stream': args.stream, 'adaptive': args.adaptive}
+        print(f"Validating {args.urls:,} synthetic URLs (latency {args.latency}, {args.redirect_rate:.0%} redirects, "
+              f"{args.not_found_rate:.0%} 404s, {args.throttle_rate:.0%} 429s)...")
+        
+        print(f"{'concurrency':>11} {'URLs/s':>9} {'time':>8} {'peak RSS':>9} {'lag p99':>8} {'lag max':>8} "
+              f"{'requests':>9} {'retries':>8} {'failed':>7}")
+        for result in run_throughput_benchmark(profile, concurrency_levels, options):
+            peak_rss = f"{result['peak_rss'] / 2**20:.0f}MB" if result['peak_rss'] is not None else '-'
+            print(f"{result['concurrency']:>11} {result['urls_per_second']:>9.0f} {result['seconds']:>7.2f}s "
+                  f"{peak_rss:>9} {result['lag_p99'] * 1000:>6.1f}ms {result['lag_max'] * 1000:>6.1f}ms "
+                  f"{result['requests']:>9} {result['retries']:>8} {result['failed']:>7}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,585 @@
+"""Tests for validate_sitemap_urls.py against an in-process origin (httpx.MockTransport)
+
+Run with: python -m pytest scripts/test_validate_sitemap_urls.py
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+import validate_sitemap_urls as v
+
+BASE_URL = 'http://test'
+
+
+def urlset(locs):
+    """Sitemap XML listing ``locs``"""
+    entries = ''.join(f'<url><loc>{loc}</loc></url>' for loc in locs)
+    return f'<?xml version="1.0" encoding="UTF-8"?><urlset xmlns="{v.SITEMAP_NAMESPACE}">{entries}</urlset>'
+
+
+def make_origin(pages, routes=None, segments=None):
+    """Transport serving ``pages`` from sitemap-pages.xml (other segments empty)
+
+    ``segments`` maps other segment names to their pages. ``routes`` maps a
+    path to a ``(status, headers, body)`` response or a ``request ->
+    response`` function; every other page is a small HTML document.
+    """
+    routes = routes or {}
+    sitemaps = {f'/sitemap-{name}.xml': locs for name, locs in {**(segments or {}), 'pages': pages}.items()}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path in sitemaps:
+            return httpx.Response(200, text=urlset(f'{BASE_URL}{page}' for page in sitemaps[path]),
+                                  headers={'Content-Type': 'application/xml'})
+        if path.startswith('/sitemap-'):
+            return httpx.Response(200, text=urlset([]), headers={'Content-Type': 'application/xml'})
+        if path in routes and callable(routes[path]):
+            return routes[path](request)
+        if path in routes:
+            status, headers, body = routes[path]
+            return httpx.Response(status, headers=headers, content=body)
+        return httpx.Response(200, text='<html><head><title>t</title></head><body>ok</body></html>',
+                              headers={'Content-Type': 'text/html; charset=utf-8'})
+
+    return httpx.MockTransport(handler)
+
+
+def make_validator(pages, routes=None, segments=None, **arguments):
+    """Validator of the mock origin; ``arguments`` are ValidatorOptions fields or SitemapValidator arguments"""
+    options = {name: arguments.pop(name) for name in list(arguments) if name in v.ValidatorOptions.__dataclass_fields__}
+    validator = v.SitemapValidator(BASE_URL, v.ValidatorOptions(**options),
+                                   transport=make_origin(pages, routes, segments), **arguments)
+    validator.console = None
+    return validator
+
+
+def run(validator):
+    return asyncio.run(validator.validate_all_sitemaps())
+
+
+def test_url_cache_is_bounded_when_results_are_streamed(monkeypatch):
+    monkeypatch.setattr(v, 'URL_MEMO_SIZE', 50)
+    pages = [f'/page-{i}' for i in range(400)]
+
+    streamed = make_validator(pages, retain_results=False)
+    report = run(streamed)
+    assert report.valid_urls == 400
+    assert len(streamed.url_cache) == 50
+
+    retained = make_validator(pages)
+    run(retained)
+    assert len(retained.url_cache) == 400
+
+
+def test_failing_listener_does_not_stop_the_run():
+    seen = []
+
+    def broken(segment, url_result):
+        raise RuntimeError('listener bug')
+
+    validator = make_validator([f'/page-{i}' for i in range(30)])
+    validator.subscribe(broken)
+    validator.subscribe(lambda segment, url_result: seen.append(url_result.url))
+    report = asyncio.run(asyncio.wait_for(validator.validate_all_sitemaps(), 10))
+
+    assert report.valid_urls == 30
+    assert len(seen) == 30
+    assert sum(validator._listener_errors.values()) == 30
+
+
+def test_recording_failure_is_raised_instead_of_hanging():
+    validator = make_validator([f'/page-{i}' for i in range(200)], concurrency=2)
+
+    def broken(result, url_data, url_result):
+        raise RuntimeError('recording bug')
+
+    validator._record_url_result = broken
+    with pytest.raises(RuntimeError, match='recording bug'):
+        asyncio.run(asyncio.wait_for(validator.validate_all_sitemaps(), 10))
+
+
+class BrokenReporter(v.Reporter):
+    def __init__(self):
+        self.calls = 0
+
+    def on_result(self, segment, url_result):
+        self.calls += 1
+        raise ValueError('cannot write')
+
+    def finish(self, report):
+        raise ValueError('cannot finish')
+
+
+def test_raising_reporter_is_reported_not_fatal():
+    reporter = BrokenReporter()
+    validator = make_validator([f'/page-{i}' for i in range(10)])
+    validator.add_reporter(reporter)
+    report = asyncio.run(asyncio.wait_for(validator.validate_all_sitemaps(), 10))
+
+    assert report.valid_urls == 10
+    assert reporter.calls == 10
+    assert report.plugin_errors == [
+        'BrokenReporter.on_result failed 10 time(s), first: ValueError: cannot write',
+        'BrokenReporter.finish failed 1 time(s), first: ValueError: cannot finish',
+    ]
+
+
+def test_url_check_must_implement_check():
+    class Incomplete(v.URLCheck):
+        name = 'incomplete'
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_raising_check_becomes_a_warning():
+    class Broken(v.URLCheck):
+        name = 'broken'
+
+        def check(self, result, context):
+            raise KeyError('missing')
+
+    validator = make_validator(['/a'], checks=[*v.default_checks(), Broken()])
+    report = run(validator)
+
+    [url_result] = report.sitemap_results[0].url_results
+    assert url_result.is_valid
+    assert url_result.warnings == ("Check broken failed: KeyError: 'missing'",)
+
+
+def test_onpage_check_skips_non_html_responses():
+    png = (200, {'Content-Type': 'image/png'}, b'\x89PNG\r\n\x1a\n' + bytes(64))
+    validator = make_validator(['/logo.png', '/about'], routes={'/logo.png': png}, check_onpage=True)
+    report = run(validator)
+
+    warnings = {url_result.url: url_result.warnings for url_result in report.sitemap_results[0].url_results}
+    assert warnings[f'{BASE_URL}/logo.png'] == ('Unexpected content type: image/png',)
+    assert 'No canonical link on page' in warnings[f'{BASE_URL}/about']
+
+
+def html_page(size, content_length=True):
+    """Route answering a ``size``-byte page; without Content-Length unless ``content_length``"""
+    body = b'<html><head><link rel="canonical" href="x"></head><body>' + b'x' * size + b'</body></html>'
+
+    def respond(request):
+        headers = {'Content-Type': 'text/html'}
+        if request.method == 'HEAD':
+            return httpx.Response(200, headers=headers, stream=httpx.ByteStream(b''))
+        if content_length:
+            return httpx.Response(200, headers=headers, content=body)
+        return httpx.Response(200, headers=headers, stream=httpx.ByteStream(body))
+
+    return respond
+
+
+def bytes_budget_run(page, baseline=None, **options):
+    budget = v.PerformanceBudget(bytes=0.1) if baseline is not None else v.PerformanceBudget()
+    validator = make_validator(['/page'], routes={'/page': page}, baseline=baseline, budget=budget, **options)
+    return run(validator)
+
+
+def test_bytes_budget_flags_growth_of_same_source_sizes():
+    baseline = bytes_budget_run(html_page(1000), request_strategy='get', content_hash=True)
+    report = bytes_budget_run(html_page(2000), baseline, request_strategy='get', content_hash=True)
+
+    assert report.sitemap_results[0].bytes_by_source.keys() == {'header'}
+    assert len(report.performance_regressions) == 1
+    assert '(header sizes)' in report.performance_regressions[0]
+
+
+def test_bytes_budget_not_evaluated_without_comparable_sizes():
+    # HEAD without Content-Length: no size at all
+    baseline = bytes_budget_run(html_page(1000, content_length=False))
+    report = bytes_budget_run(html_page(5000, content_length=False), baseline)
+    assert report.performance_regressions == []
+    assert report.performance_notes == [
+        'pages: bytes budget not evaluated, no full page sizes of the same source in both runs '
+        '(this run: none; baseline: none)'
+    ]
+
+    # A head-only read (--check-onpage) is never compared with a full body
+    baseline = bytes_budget_run(html_page(1000, content_length=False), check_onpage=True)
+    report = bytes_budget_run(html_page(5000, content_length=False), baseline, content_hash=True)
+    assert baseline.sitemap_results[0].bytes_by_source.keys() == {'partial'}
+    assert report.sitemap_results[0].bytes_by_source.keys() == {'body'}
+    assert report.performance_regressions == []
+    assert 'this run: body; baseline: partial' in report.performance_notes[0]
+
+
+def redirect_chain(hops, loop=False):
+    """Routes /r0 -> /r1 -> ... -> /r<hops> (a 200 page), or back to /r0 when ``loop``"""
+    routes = {}
+    for i in range(hops):
+        target = '/r0' if loop and i == hops - 1 else f'/r{i + 1}'
+        routes[f'/r{i}'] = (301, {'Location': f'{BASE_URL}{target}'}, b'')
+    return routes
+
+
+@pytest.mark.parametrize('hops, valid', [(v.MAX_REDIRECTS, True), (v.MAX_REDIRECTS + 1, False)])
+def test_traced_redirects_follow_up_to_max_redirects_hops(hops, valid):
+    validator = make_validator(['/r0'], routes=redirect_chain(hops), trace_redirects=True)
+    report = run(validator)
+
+    [url_result] = report.sitemap_results[0].url_results
+    assert url_result.is_valid is valid
+    assert len(url_result.redirect_hops) == hops
+    assert not url_result.redirect_loop
+    if not valid:
+        assert url_result.error.startswith('Too many redirects')
+    assert report.redirect_loops == [f'{BASE_URL}/r0: Long redirect chain ({hops} redirects)']
+
+
+def test_redirect_loop_is_flagged_on_the_result():
+    validator = make_validator(['/r0'], routes=redirect_chain(3, loop=True), trace_redirects=True)
+    report = run(validator)
+
+    [url_result] = report.sitemap_results[0].url_results
+    assert url_result.redirect_loop and not url_result.is_valid
+    assert report.redirect_loops == [f'{BASE_URL}/r0: {url_result.error}']
+
+
+def run_interrupted(validator, after):
+    """Run until ``after`` URL results are recorded, then cancel the run like Ctrl-C"""
+    async def interrupt():
+        validation = asyncio.create_task(validator.validate_all_sitemaps())
+        recorded = []
+
+        def listener(segment, url_result):
+            recorded.append(url_result)
+            if len(recorded) == after:
+                validation.cancel()
+
+        validator.subscribe(listener)
+        with pytest.raises(asyncio.CancelledError):
+            await validation
+
+    asyncio.run(interrupt())
+
+
+def test_resumed_run_counts_match_a_fresh_run(tmp_path):
+    pages = [f'/page-{i}' for i in range(60)]
+    routes = {f'/page-{i}': (404, {}, b'') for i in range(0, 60, 7)}
+    fresh = run(make_validator(pages, routes))
+    path = str(tmp_path / 'run.ckpt')
+
+    checkpoint = v.ValidationCheckpoint(path)
+    checkpoint.open(BASE_URL)
+    run_interrupted(make_validator(pages, routes, checkpoint=checkpoint, concurrency=4), after=25)
+    checkpoint.close()
+
+    checkpoint = v.ValidationCheckpoint(path)
+    checkpoint.open(BASE_URL, resume=True)
+    assert 25 <= len(checkpoint.completed) < 60
+    resumed = run(make_validator(pages, routes, checkpoint=checkpoint, concurrency=4))
+    checkpoint.complete()
+
+    assert (resumed.total_urls, resumed.valid_urls, resumed.failed_urls) == (60, 51, 9)
+    assert (fresh.total_urls, fresh.valid_urls, fresh.failed_urls) == (60, 51, 9)
+    assert resumed.timestamp == checkpoint.timestamp
+
+
+def test_resume_refuses_checkpoint_of_another_site(tmp_path):
+    path = tmp_path / 'run.ckpt'
+    checkpoint = v.ValidationCheckpoint(str(path))
+    checkpoint.open('https://other.example')
+    checkpoint.close()
+    saved = path.read_text()
+
+    with pytest.raises(v.CheckpointError, match='a checkpoint of https://other.example'):
+        v.ValidationCheckpoint(str(path)).open(BASE_URL, resume=True)
+    assert path.read_text() == saved
+
+    resumed = v.ValidationCheckpoint(str(path))
+    resumed.open('https://other.example', resume=True)
+    resumed.close()
+    assert path.read_text().startswith(saved)
+
+
+def test_url_in_several_segments_is_ranked_once_among_the_slowest():
+    validator = make_validator(['/a', '/b'], segments={'works': ['/a'], 'legal': ['/a']})
+    report = run(validator)
+
+    assert [segment.total_urls for segment in report.sitemap_results] == [2, 0, 1, 1]
+    assert sorted(entry['url'] for entry in report.slowest_urls) == [f'{BASE_URL}/a', f'{BASE_URL}/b']
+
+
+def test_page_in_several_segments_is_listed_once_among_the_heaviest():
+    page = (200, {'Content-Type': 'text/html'}, b'<html><body><img src="/hero.png"></body></html>')
+    image = (200, {'Content-Type': 'image/png', 'Content-Length': '5000'}, b'')
+    validator = make_validator(['/a'], routes={'/a': page, '/hero.png': image}, segments={'works': ['/a']},
+                               check_assets=True)
+    report = run(validator)
+
+    assert [entry['url'] for entry in report.heaviest_pages] == [f'{BASE_URL}/a']
+    assert report.heaviest_pages[0]['asset_bytes'] == 5000
+
+
+VOLATILE_TOKENS = [b'nonce="r4nd0m-N0nce+/="', b'"buildId":"aB3_dE6-gH9"', b'\\"buildId\\":\\"aB3_dE6-gH9',
+                   b'/_next/static/aB3dE6gH9jK2mN5p/']
+
+
+def page_body(tokens):
+    """A page mixing real content with ``tokens``, each after some filler"""
+    parts = [b'<html><head><script ' + tokens[0] + b'>init()</script>']
+    for i, token in enumerate(tokens):
+        parts.append(b'x' * (100 * i + 37) + b'<p>' + token + b'</p>')
+    return b''.join(parts) + b'<main>' + b'content ' * 200 + b'</main></html>'
+
+
+def content_digest(*chunks):
+    hasher = v.ContentHasher()
+    for chunk in chunks:
+        hasher.update(chunk)
+    return hasher.finish()
+
+
+def test_content_hash_does_not_depend_on_chunk_boundaries():
+    body = page_body(VOLATILE_TOKENS)
+    digest = content_digest(body)
+
+    for size in (1, 7, 64, v.CONTENT_HASH_CARRY - 1, v.CONTENT_HASH_CARRY, v.CONTENT_HASH_CARRY + 1, 1000):
+        assert content_digest(*(body[i:i + size] for i in range(0, len(body), size))) == digest, size
+    for token in VOLATILE_TOKENS:
+        start = body.index(token)
+        for offset in range(1, len(token)):
+            split = start + offset
+            assert content_digest(body[:split], body[split:]) == digest, (token, offset)
+
+
+def test_content_hash_ignores_volatile_tokens_only():
+    other_tokens = [b'nonce="0therNonce"', b'"buildId":"zz-99"', b'\\"buildId\\":\\"zz-99',
+                    b'/_next/static/QwErTyUiOp123456789/']
+    digest = content_digest(page_body(VOLATILE_TOKENS))
+
+    assert content_digest(page_body(other_tokens)) == digest
+    assert content_digest(page_body(VOLATILE_TOKENS).replace(b'content', b'changed')) != digest
+
+
+def test_url_in_several_segments_is_one_content_change():
+    validator = make_validator(['/a', '/b'], segments={'works': ['/a']}, content_hash=True)
+    report = run(validator)
+
+    assert report.sitemap_results[2].total_urls == 1
+    assert sorted(report.content_changes['new']) == [f'{BASE_URL}/a', f'{BASE_URL}/b']
+
+
+ES = f'{BASE_URL}/trabajos/foo'
+EN = f'{BASE_URL}/en/works/foo'
+OTHER = f'{BASE_URL}/trabajos/bar'
+
+
+def cluster(es=(('es', ES), ('en', EN), ('x-default', ES)), en=(('es', ES), ('en', EN), ('x-default', ES))):
+    """Sitemap alternates of the es and en pages of one translation cluster"""
+    return {ES: tuple(v.Alternate(*link) for link in es), EN: tuple(v.Alternate(*link) for link in en)}
+
+
+def hreflang_issues(alternates, url_results=None):
+    graph = v.HreflangGraph()
+    for url, links in alternates.items():
+        graph.add(url, links)
+    return graph.find_issues(url_results or {})
+
+
+def test_hreflang_graph_of_a_complete_cluster_has_no_issues():
+    assert hreflang_issues(cluster()) == []
+
+
+def test_hreflang_graph_reports_non_reciprocal_alternates():
+    alternates = cluster(en=(('es', OTHER), ('en', EN), ('x-default', OTHER)))
+    alternates[OTHER] = ()
+
+    issues = hreflang_issues(alternates)
+
+    assert f'{ES}: Alternate [en] {EN} does not link back' in issues
+    assert f'{EN}: Alternate [es] {OTHER} does not link back' in issues
+
+
+def test_hreflang_graph_reports_x_default_mismatches():
+    issues = hreflang_issues(cluster(en=(('es', ES), ('en', EN), ('x-default', EN))))
+
+    assert issues == [
+        f'{ES}: x-default differs from alternate [en] {EN}',
+        f'{EN}: x-default differs from alternate [es] {ES}',
+    ]
+
+
+def test_hreflang_graph_reports_missing_locales():
+    issues = hreflang_issues(cluster(en=(('en', EN), ('x-default', ES))))
+
+    assert issues == [f'{EN}: Missing hreflang tags: es']
+
+
+@pytest.fixture
+def build_index(tmp_path):
+    """BuildIndex of a small `next build` output with one on-demand route"""
+    build = tmp_path / '.next'
+    app = build / 'server' / 'app'
+    for page in ('es.html', 'en.html', 'es/works/foo.html', 'en/works/foo.html'):
+        (app / page).parent.mkdir(parents=True, exist_ok=True)
+        (app / page).write_text(f'<html>{page}</html>')
+    (build / v.BUILD_ID_FILE).write_text('build-1')
+    (build / 'app-path-routes-manifest.json').write_text(
+        '{"/[locale]/articles/[slug]/page": "/[locale]/articles/[slug]"}'
+    )
+    (tmp_path / 'public').mkdir()
+    (tmp_path / 'public' / 'robots.txt').write_text('User-agent: *')
+    return v.BuildIndex(build)
+
+
+@pytest.mark.parametrize('path, internal', [
+    ('/', '/es'),
+    ('/en', '/en'),
+    ('/trabajos/foo', '/es/works/foo'),
+    ('/en/works/foo', '/en/works/foo'),
+    ('/articulos/new-post', '/es/articles/new-post'),
+    ('/privacidad', '/es/privacy'),
+    ('/en/privacy', '/en/privacy'),
+])
+def test_build_index_maps_public_paths_to_internal_routes(build_index, path, internal):
+    assert build_index.internal_path(path) == internal
+
+
+@pytest.mark.parametrize('path, status, location, page', [
+    ('/trabajos/foo', 200, None, 'es/works/foo.html'),
+    ('/en/works/foo', 200, None, 'en/works/foo.html'),
+    ('/', 200, None, 'es.html'),
+    ('/es/works/foo', 307, '/works/foo', None),
+    ('/es', 307, '/', None),
+    ('/trabajos/foo/', 308, '/trabajos/foo', None),
+    ('/trabajos/missing', 404, None, None),
+])
+def test_build_index_lookup(build_index, path, status, location, page):
+    found_status, headers, source = build_index.lookup(path)
+
+    assert found_status == status
+    assert headers.get('Location') == location
+    assert (source.relative_to(build_index.build_dir / 'server' / 'app').as_posix() if source else None) == page
+
+
+def test_build_index_matches_dynamic_routes_on_demand(build_index):
+    assert build_index.lookup('/articulos/new-post') == (200, {'Content-Type': 'text/html; charset=utf-8'}, None)
+    assert build_index.lookup('/en/articles/other')[0] == 200
+    assert build_index.on_demand == {'/articulos/new-post', '/en/articles/other'}
+    assert build_index.lookup('/en/articles')[0] == 404
+
+
+def test_build_dir_transport_answers_from_the_build(build_index):
+    async def fetch():
+        async with httpx.AsyncClient(transport=v.BuildDirTransport(build_index), base_url=BASE_URL) as client:
+            return [await client.get('/trabajos/foo'), await client.head('/trabajos/foo'),
+                    await client.get('/es/works/foo'), await client.get('/robots.txt')]
+
+    page, head, redirect, robots = asyncio.run(fetch())
+    assert page.text == '<html>es/works/foo.html</html>'
+    assert head.content == b'' and head.headers['Content-Length'] == str(len(page.content))
+    assert (redirect.status_code, redirect.headers['Location']) == (307, '/works/foo')
+    assert robots.headers['Content-Type'] == 'text/plain' and robots.text == 'User-agent: *'
+
+
+def cached_page(requests, status=200):
+    """Route counting its requests; answers 304 to a matching If-None-Match"""
+    def respond(request):
+        requests.append(request.method)
+        if status == 200 and request.headers.get('If-None-Match') == '"v1"':
+            return httpx.Response(304, headers={'ETag': '"v1"'})
+        return httpx.Response(status, headers={'Content-Type': 'text/html', 'ETag': '"v1"'}, content=b'<html></html>')
+
+    return respond
+
+
+def test_cache_is_revalidated_when_stale_and_trusted_when_fresh(tmp_path):
+    cache = v.ValidationCache(tmp_path, ttl=0)
+    requests = []
+
+    def validate():
+        return run(make_validator(['/a'], routes={'/a': cached_page(requests)}, cache=cache))
+
+    assert validate().sitemap_results[0].url_results[0].cache_status is None
+    [revalidated] = validate().sitemap_results[0].url_results
+    assert (revalidated.cache_status, revalidated.status_code, revalidated.is_valid) == ('revalidated', 200, True)
+    assert len(requests) == 2
+
+    cache.ttl = 3600
+    [hit] = validate().sitemap_results[0].url_results
+    assert (hit.cache_status, hit.is_valid) == ('hit', True)
+    assert len(requests) == 2
+
+
+def test_retried_overload_responses_are_not_cached(tmp_path):
+    cache = v.ValidationCache(tmp_path, ttl=0)
+    run(make_validator(['/a'], routes={'/a': cached_page([])}, cache=cache))
+
+    requests = []
+    report = run(make_validator(['/a'], routes={'/a': cached_page(requests, status=503)}, cache=cache,
+                                max_retries=2, retry_backoff=0))
+    assert report.failed_urls == 1 and len(requests) == 3
+    assert cache.get(f'{BASE_URL}/a').status_code == 200
+    cache.close()
+
+
+class ChunkedBody(httpx.AsyncByteStream):
+    """Response body delivered in ``size``-byte chunks, like a slow download"""
+
+    def __init__(self, body, size):
+        self.body = body
+        self.size = size
+
+    async def __aiter__(self):
+        for i in range(0, len(self.body), self.size):
+            yield self.body[i:i + self.size]
+
+
+def sitemap_documents():
+    """A sitemap index and a urlset with lastmod, changefreq, priority and hreflang alternates"""
+    index = (f'<?xml version="1.0" encoding="UTF-8"?><sitemapindex xmlns="{v.SITEMAP_NAMESPACE}">'
+             + ''.join(f'<sitemap><loc> {BASE_URL}/part-{i}.xml </loc></sitemap>' for i in range(3))
+             + '<sitemap><loc></loc></sitemap></sitemapindex>')
+    entries = ''.join(
+        f'<url><loc>{BASE_URL}/trabajos/w{i}</loc><lastmod>2024-06-0{i % 9 + 1}</lastmod>'
+        f'<changefreq>weekly</changefreq><priority>0.{i % 10}</priority>'
+        f'<xhtml:link rel="alternate" hreflang="es" href="{BASE_URL}/trabajos/w{i}"/>'
+        f'<xhtml:link rel="alternate" hreflang="en" href="{BASE_URL}/en/works/w{i}"/>'
+        f'<xhtml:link rel="alternate" hreflang="x-default" href="{BASE_URL}/trabajos/w{i}"/></url>'
+        for i in range(40)
+    )
+    urls = (f'<?xml version="1.0" encoding="UTF-8"?><urlset xmlns="{v.SITEMAP_NAMESPACE}" '
+            f'xmlns:xhtml="http://www.w3.org/1999/xhtml">{entries}<url><loc></loc></url></urlset>')
+    return {'/index.xml': index.encode(), '/urls.xml': urls.encode()}
+
+
+def sitemap_entries(path, stream, chunk_size=None):
+    documents = sitemap_documents()
+
+    def respond(request):
+        body = documents[request.url.path]
+        stream_body = ChunkedBody(body, chunk_size or len(body))
+        return httpx.Response(200, headers={'Content-Type': 'application/xml'}, stream=stream_body)
+
+    validator = make_validator([], routes={path: respond for path in documents}, stream=stream)
+
+    async def collect():
+        entries = [entry async for entry in validator.iter_sitemap_entries(f'{BASE_URL}{path}')]
+        await validator._close_client()
+        return entries
+
+    return asyncio.run(collect())
+
+
+@pytest.mark.parametrize('path', ['/index.xml', '/urls.xml'])
+def test_streamed_sitemap_parsing_matches_buffered_parsing(path):
+    buffered = sitemap_entries(path, stream=False)
+
+    assert len(buffered) == (3 if path == '/index.xml' else 40)
+    for chunk_size in (None, 1, 7, 100):
+        assert sitemap_entries(path, stream=True, chunk_size=chunk_size) == buffered, chunk_size
+
+
+def test_streamed_run_validates_the_same_urls():
+    pages = [f'/page-{i}' for i in range(50)]
+    urls = [[url_result.url for url_result in run(make_validator(pages, stream=stream)).sitemap_results[0].url_results]
+            for stream in (False, True)]
+
+    assert sorted(urls[0]) == sorted(urls[1]) == sorted(f'{BASE_URL}{page}' for page in pages)
@@ -13,6 +13,28 @@ Features:
 - Checks for 404s and other HTTP errors
 - Generates detailed reports for Google Search Console submission
 - Optimized with async/await for parallel processing
+- Optional streaming mode that validates URLs while the sitemap is still downloading
+- Optional recursive discovery of (nested, paginated) sitemaps from the sitemap index
+- Optional persistent cache with conditional (ETag/Last-Modified) revalidation
+- Incremental mode that only re-checks new, changed or previously failed URLs
+- HEAD-first requests with GET fallback, so page bodies are only downloaded when needed
+- Optional hop-by-hop redirect tracing with loop detection and per-hop timing
+- Optional HTTP/2 multiplexing with a connection pool sized from the concurrency
+- Retries with exponential backoff (honouring Retry-After) and optional adaptive concurrency
+- Optional on-page hreflang/canonical check that streams only each page's <head>
+- Streaming JSON Lines reports written as URLs are validated
+- Checkpointing so interrupted runs can be resumed with --resume
+- Compact slotted results with interned strings and shared hreflang alternates
+- Connect/TTFB/body timing with per-segment latency percentiles and the slowest URLs
+- Performance budgets (p95, bytes, TTFB) gated against a baseline report
+- Multi-process mode that shards URLs by hash across worker processes
+- Normalized content hashing to report changed, unchanged and new pages between runs
+- Optional crawl of the internal links found on pages, each unique target checked once
+- Optional image/asset checks with per-page asset bytes and oversized image warnings
+- Offline mode that checks sitemap URLs against a local Next.js build without a server
+- Python API: pluggable per-URL checks, streaming reporters and ``async for`` over results
+- Live telemetry (req/s, in-flight, queue depth, event-loop lag, error rate, bytes/s) with
+  optional Prometheus textfile or JSON Lines export
 
 Usage:
     python scripts/validate_sitemap_urls.py                           # localhost:3000
@@ -21,20 +43,49 @@ Usage:
     python scripts/validate_sitemap_urls.py --url https://yoursite.com --verbose
     python scripts/validate_sitemap_urls.py --url https://yoursite.com --output report.json
     python scripts/validate_sitemap_urls.py --url https://yoursite.com --concurrency 20
+    python scripts/validate_sitemap_urls.py --url https://yoursite.com --stream
+    python scripts/validate_sitemap_urls.py --url https://yoursite.com --parallel-segments
+    python scripts/validate_sitemap_urls.py --url https://yoursite.com --discover --stream
+    python scripts/validate_sitemap_urls.py --url https://yoursite.com --cache-dir .sitemap-cache
+    python scripts/validate_sitemap_urls.py --url https://yoursite.com --since-report previous.json
+    python scripts/validate_sitemap_urls.py --url https://yoursite.com --output report.jsonl --output-format jsonl
+    python scripts/validate_sitemap_urls.py --url https://yoursite.com --checkpoint run.ckpt --resume
+    python scripts/validate_sitemap_urls.py --url https://yoursite.com --baseline report.json --budget ttfb=800ms
+    python scripts/validate_sitemap_urls.py --url https://yoursite.com --workers 4 --concurrency 64
+    python scripts/validate_sitemap_urls.py --url https://yoursite.com --content-hash --cache-dir .sitemap-cache
+    python scripts/validate_sitemap_urls.py --url https://yoursite.com --crawl --crawl-depth 2
+    python scripts/validate_sitemap_urls.py --url https://yoursite.com --check-assets --max-image-kb 300
+    python scripts/validate_sitemap_urls.py --build-dir .next --sitemap-dir sitemaps/
+    python scripts/validate_sitemap_urls.py --url https://yoursite.com --telemetry --telemetry-file run.prom
 """
 
 import argparse
 import asyncio
+import codecs
+import contextlib
+import hashlib
+import heapq
 import json
+import math
+import mimetypes
+import multiprocessing
+import random
+import re
+import sqlite3
 import sys
 import time
 import xml.etree.ElementTree as ET
-from collections import defaultdict
-from dataclasses import dataclass, field, asdict
-from datetime import datetime
+import zlib
+from abc import ABC, abstractmethod
+from collections import Counter, OrderedDict, defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, asdict, replace
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from html.parser import HTMLParser
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
-from urllib.parse import urljoin, urlparse
+from typing import AsyncIterator, Awaitable, Callable, Deque, Dict, List, NamedTuple, Optional, Pattern, Set, Tuple
+from urllib.parse import quote, unquote, urljoin, urlparse, urlsplit, urlunsplit
 
 try:
     import httpx
@@ -48,6 +99,7 @@ try:
     from rich.table import Table
     from rich.progress import Progress, SpinnerColumn, TextColumn
     from rich.panel import Panel
+    from rich.markup import escape
     from rich import print as rprint
     HAS_RICH = True
 except ImportError:
@@ -60,78 +112,1978 @@ SITEMAP_SEGMENTS = ["pages", "articles", "works", "legal"]
 LOCALES = ["en", "es"]
 DEFAULT_LOCALE = "es"
 TIMEOUT = 30
+CONNECT_TIMEOUT = 10.0
+KEEPALIVE_EXPIRY = 5.0  # Seconds an idle pooled connection is kept open
 MAX_REDIRECTS = 10
 USER_AGENT = "Mozilla/5.0 (compatible; SitemapValidator/1.0)"
 DEFAULT_CONCURRENCY = 20  # Number of concurrent requests
+QUEUE_SIZE_PER_WORKER = 2  # Bounded queue slots per worker (backpressure on the sitemap producer)
+URL_MEMO_SIZE = 10000  # Recent results kept for repeated URLs when results are streamed, not retained
+SITEMAP_NAMESPACE = 'http://www.sitemaps.org/schemas/sitemap/0.9'
+XHTML_NAMESPACE = 'http://www.w3.org/1999/xhtml'
+NAMESPACES = {'ns': SITEMAP_NAMESPACE, 'xhtml': XHTML_NAMESPACE}
+URL_TAG = f'{{{SITEMAP_NAMESPACE}}}url'
+SITEMAP_TAG = f'{{{SITEMAP_NAMESPACE}}}sitemap'
+SITEMAPINDEX_TAG = f'{{{SITEMAP_NAMESPACE}}}sitemapindex'
+SITEMAP_INDEX_PATH = '/sitemap.xml'
+MAX_SITEMAP_DEPTH = 5  # Maximum nesting of sitemap indexes when discovering
+SITEMAP_FETCH_CONCURRENCY = 4  # Child sitemaps downloaded at the same time
+CACHE_FILENAME = 'validation-cache.sqlite3'
+DEFAULT_CACHE_TTL = 24 * 3600  # Seconds a cached successful result is trusted without a request
+CACHE_COMMIT_INTERVAL = 200  # Cache writes batched per SQLite commit
+CACHE_BUSY_TIMEOUT = 30.0  # Seconds to wait for another process holding the cache write lock
+DEFAULT_RESAMPLE_RATE = 0.1  # Fraction of unchanged URLs re-checked in incremental mode
+REQUEST_STRATEGIES = ['head-first', 'get']
+DEFAULT_REQUEST_STRATEGY = 'head-first'
+HEAD_FALLBACK_STATUSES = {405, 501}  # HEAD not supported, retry with GET
+HTML_CONTENT_TYPES = ('text/html', 'application/xhtml')
+LONG_REDIRECT_CHAIN = 5  # Hops after which a chain is reported as a redirect issue
+REDIRECT_LOOP_ERROR = "Redirect loop"
+MAX_HEAD_BYTES = 512 * 1024  # Stop scanning for </head> after this many body bytes
+OUTPUT_FORMATS = ['json', 'jsonl']
+
+# Content hashing (--content-hash)
+CONTENT_HASH_CARRY = 256  # Bytes held back between chunks, longer than any volatile token
+CONTENT_CHANGES = ['changed', 'unchanged', 'new']
+VOLATILE_CONTENT_PATTERNS = [
+    # CSP nonces differ on every response
+    (re.compile(rb'nonce="[^"]{0,128}"'), b'nonce=""'),
+    # Next.js build IDs differ on every deploy (plain and inside escaped RSC payloads)
+    (re.compile(rb'(\\?"buildId\\?":\\?")[\w-]{1,64}'), rb'\1'),
+    (re.compile(rb'/_next/static/[\w-]{16,64}/'), b'/_next/static/-/'),
+]
+
+# Link crawling (--crawl)
+CRAWL_SEGMENT = 'crawl'
+DEFAULT_CRAWL_DEPTH = 2  # Link levels followed beyond the sitemap pages
+DEFAULT_CRAWL_LIMIT = 10000  # Unique URLs checked beyond the sitemap entries
+MAX_CRAWL_BYTES = 2 * 1024 * 1024  # Stop collecting links after this many body bytes
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+URL_PATH_SAFE = "/:@!$&'()*+,;=-._~%"  # Left as-is when percent-encoding link paths
+
+# Asset checks (--check-assets)
+DEFAULT_MAX_IMAGE_BYTES = 500 * 1024  # Images above this size are flagged as oversized
+HEAVIEST_PAGES = 10  # Pages listed by total asset bytes
+SOCIAL_IMAGE_META = {'og:image', 'og:image:url', 'og:image:secure_url', 'twitter:image'}
+
+# Offline validation (--build-dir)
+BUILD_ID_FILE = 'BUILD_ID'  # Present in `next build` output, absent from static exports
+# Localized pathnames of the internal routes (mirrors src/i18n/pathnames.ts and src/lib/structure.ts)
+PATHNAMES = {
+    '/': {'en': '/', 'es': '/'},
+    '/works': {'en': '/works', 'es': '/trabajos'},
+    '/articles': {'en': '/articles', 'es': '/articulos'},
+    '/bio': {'en': '/bio', 'es': '/bio'},
+    '/privacy': {'en': '/privacy', 'es': '/privacidad'},
+    '/terms': {'en': '/terms', 'es': '/terminos'},
+    '/imprint': {'en': '/imprint', 'es': '/aviso'},
+    '/works/[slug]': {'en': '/works/[slug]', 'es': '/trabajos/[slug]'},
+    '/articles/[slug]': {'en': '/articles/[slug]', 'es': '/articulos/[slug]'},
+}
+
+# Live telemetry (--telemetry, --telemetry-file)
+TELEMETRY_FORMATS = ['jsonl', 'prometheus']
+DEFAULT_TELEMETRY_INTERVAL = 10.0  # Seconds between telemetry file writes (and plain-output lines)
+TELEMETRY_REFRESH = 1.0  # Seconds between updates of the live progress row
+LOOP_LAG_PROBE = 0.1  # Seconds between event-loop lag probes
+TELEMETRY_METRIC_PREFIX = 'sitemap_validator'
+
+# Latency instrumentation
+LATENCY_PHASES = ['total', 'connect', 'ttfb', 'body']
+LATENCY_MIN = 0.0001  # Upper bound of the first histogram bucket (0.1ms)
+LATENCY_BUCKET_GROWTH = 1.02  # Bucket width ratio, i.e. max. relative percentile error
+DEFAULT_SLOWEST_URLS = 10
+
+# Performance budgets (--baseline/--budget)
+BUDGET_KEYS = ['p95', 'bytes', 'ttfb']
+DEFAULT_BUDGETS = {'p95': 0.2, 'bytes': 0.1}  # Allowed increase over the baseline when --baseline is set
+LATENCY_REGRESSION_FLOOR = 0.05  # p95 increases below this many seconds are treated as noise
+# Where a page size came from: Content-Length, the whole body, or a body read only up to </head> or a limit
+SIZE_SOURCES = ['header', 'body', 'partial']
+FULL_SIZE_SOURCES = ('header', 'body')  # Only these are compared against the baseline bytes budget
+EXIT_BUDGET_EXCEEDED = 3  # Exit code when URLs are valid but performance budgets failed
+
+# Multi-process mode (--workers)
+SHARD_BATCH_SIZE = 100  # Sitemap entries per batch sent to a worker process
+SHARD_BATCHES_IN_FLIGHT = 2  # Batches queued per worker, so it never idles while results travel back
+CONNECT_TRACE_EVENTS = {'connection.connect_tcp', 'connection.connect_unix_socket', 'connection.start_tls'}
+DEFAULT_CHECKPOINT_FILE = '.sitemap-validation-checkpoint.jsonl'
+CHECKPOINT_INTERVAL = 5.0  # Seconds between checkpoint flushes
+
+# __slots__ on per-URL records (dataclass slots need Python 3.10+)
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+RETRY_STATUSES = {429, 502, 503, 504}  # Overload responses retried with backoff
+DEFAULT_MAX_RETRIES = 2
+DEFAULT_RETRY_BACKOFF = 0.5  # Base delay in seconds, doubled on every retry
+MAX_BACKOFF = 30.0
+MAX_RETRY_AFTER = 60.0  # Upper bound for server-requested Retry-After waits
+ADAPTIVE_DECREASE_FACTOR = 0.5  # Multiplicative decrease on timeouts and overload responses
+ADAPTIVE_LATENCY_TOLERANCE = 3.0  # Latency above this multiple of the fastest response counts as congestion
+ADAPTIVE_MIN_LATENCY_TARGET = 0.05  # Seconds; keeps very fast origins from shrinking the limit
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds or as an HTTP date"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class AdaptiveLimiter:
+    """AIMD concurrency limiter, used like an asyncio.Semaphore (``async with limiter:``)
+    
+    The number of in-flight requests grows by roughly one per round of
+    fast, successful responses and is halved on timeouts, overload responses
+    or latency far above the fastest response seen. Only one decrease is
+    applied per congestion event: responses started before the last
+    decrease are ignored.
+    """
+
+    def __init__(self, maximum: int, minimum: int = 1, initial: Optional[int] = None,
+                 latency_target: Optional[float] = None):
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = float(initial if initial is not None else max(self.minimum, self.maximum // 4))
+        self.latency_target = latency_target
+        self.in_flight = 0
+        self._fastest: Optional[float] = None
+        self._last_decrease = 0.0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @property
+    def capacity(self) -> int:
+        """Current number of request slots"""
+        return int(self.limit)
+
+    async def __aenter__(self):
+        while self.in_flight >= self.capacity:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # Pass the wake-up on to the next waiter
+                    self._wake()
+                raise
+        self.in_flight += 1
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.in_flight -= 1
+        self._wake()
+
+    def _wake(self):
+        """Wake as many waiters as there are free slots"""
+        free = self.capacity - self.in_flight
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+    def record(self, latency: float, started_at: float, overloaded: bool = False):
+        """Feed back one request outcome (perf_counter timestamps)"""
+        if not overloaded:
+            self._fastest = latency if self._fastest is None else min(self._fastest, latency)
+            target = self.latency_target or max(self._fastest * ADAPTIVE_LATENCY_TOLERANCE,
+                                                ADAPTIVE_MIN_LATENCY_TARGET)
+            overloaded = latency > target
+        
+        if overloaded:
+            if started_at >= self._last_decrease:
+                self.limit = max(float(self.minimum), self.limit * ADAPTIVE_DECREASE_FACTOR)
+                self._last_decrease = time.perf_counter()
+        else:
+            self.limit = min(float(self.maximum), self.limit + 1.0 / self.limit)
+            self._wake()
+
+
+class Alternate(NamedTuple):
+    """One xhtml:link hreflang alternate of a sitemap <url> entry"""
+    hreflang: str
+    href: str
+
+
+class LatencyHistogram:
+    """Streaming HDR-style latency histogram
+    
+    Samples are counted in logarithmic buckets whose bounds grow by
+    LATENCY_BUCKET_GROWTH, so percentiles are accurate to that relative
+    error and memory depends on the dynamic range, not the sample count.
+    Histograms of different segments or runs can be merged.
+    """
+
+    def __init__(self):
+        self.buckets: Counter = Counter()
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float):
+        """Add one sample"""
+        if seconds <= LATENCY_MIN:
+            index = 0
+        else:
+            index = math.ceil(math.log(seconds / LATENCY_MIN, LATENCY_BUCKET_GROWTH))
+        self.buckets[index] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def merge(self, other: "LatencyHistogram"):
+        """Fold another histogram into this one"""
+        self.buckets.update(other.buckets)
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def percentile(self, percent: float) -> Optional[float]:
+        """Upper bound of the bucket holding the given percentile (None when empty)"""
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(self.count * percent / 100))
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return min(LATENCY_MIN * LATENCY_BUCKET_GROWTH ** index, self.max)
+        return self.max
+
+    def to_dict(self) -> Dict:
+        """Summary percentiles plus the raw buckets, so reports can be merged and compared"""
+        return {
+            'count': self.count,
+            'mean': self.total / self.count if self.count else None,
+            'p50': self.percentile(50),
+            'p90': self.percentile(90),
+            'p95': self.percentile(95),
+            'p99': self.percentile(99),
+            'max': self.max,
+            'buckets': {str(index): n for index, n in sorted(self.buckets.items())}
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "LatencyHistogram":
+        histogram = cls()
+        histogram.buckets = Counter({int(index): n for index, n in (data.get('buckets') or {}).items()})
+        histogram.count = data.get('count', 0)
+        histogram.total = (data.get('mean') or 0.0) * histogram.count
+        histogram.max = data.get('max') or 0.0
+        return histogram
+
+
+class RequestTimer:
+    """Monotonic phase timing of one URL check
+    
+    ``connect`` (DNS, TCP and TLS; zero on a reused connection) is collected
+    through the httpx 'trace' request extension. TTFB ends when the final
+    response headers arrive and the body phase covers whatever was read
+    after that. Redirect hops and GET fallbacks are part of TTFB.
+    """
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.connect = 0.0
+        self.headers_at: Optional[float] = None
+        self._connect_started: Dict[str, float] = {}
+        self.extensions = {'trace': self.trace}
+
+    async def trace(self, event_name: str, info: Dict):
+        """httpcore trace callback"""
+        name, _, stage = event_name.rpartition('.')
+        if name not in CONNECT_TRACE_EVENTS:
+            return
+        if stage == 'started':
+            self._connect_started[name] = time.perf_counter()
+        elif name in self._connect_started:
+            self.connect += time.perf_counter() - self._connect_started.pop(name)
+
+    def headers_received(self):
+        self.headers_at = time.perf_counter()
+
+    def finish(self, result: "URLResult"):
+        """Store the total and per-phase times on ``result``"""
+        finished_at = time.perf_counter()
+        headers_at = self.headers_at or finished_at
+        result.response_time = finished_at - self.started_at
+        result.connect_time = self.connect
+        result.ttfb = headers_at - self.started_at
+        result.body_time = finished_at - headers_at
+
+
+@dataclass
+class PerformanceBudget:
+    """Performance limits checked at the end of a run"""
+    p95: Optional[float] = None  # Max relative increase of a segment's p95 response time over the baseline
+    bytes: Optional[float] = None  # Max relative increase of a segment's total bytes over the baseline
+    ttfb: Optional[float] = None  # Absolute per-URL TTFB limit in seconds
+
+
+def parse_budget(text: str) -> Tuple[str, float]:
+    """Parse a --budget KEY=VALUE option
+    
+    p95 and bytes take the allowed increase over the baseline ('20%' or
+    '0.2'); ttfb takes an absolute limit in milliseconds ('800', '800ms')
+    or seconds ('0.8s').
+    """
+    key, sep, value = text.partition('=')
+    key = key.strip().lower()
+    value = value.strip().lower()
+    if not sep or key not in BUDGET_KEYS:
+        raise argparse.ArgumentTypeError(f"expected KEY=VALUE with KEY one of: {', '.join(BUDGET_KEYS)}")
+    
+    try:
+        if key == 'ttfb':
+            if value.endswith('ms'):
+                limit = float(value[:-2]) / 1000
+            elif value.endswith('s'):
+                limit = float(value[:-1])
+            else:
+                limit = float(value) / 1000
+        elif value.endswith('%'):
+            limit = float(value[:-1]) / 100
+        else:
+            limit = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid {key} budget: {value!r}")
+    
+    if limit < 0:
+        raise argparse.ArgumentTypeError(f"{key} budget must not be negative")
+    return key, limit
+
+
+def response_size(response: httpx.Response, body_complete: bool = False) -> Tuple[Optional[int], Optional[str]]:
+    """Page size and its SIZE_SOURCES entry: Content-Length, else the bytes read of the body
+    
+    HEAD and header-only GETs without Content-Length have no known size.
+    """
+    content_length = response.headers.get('Content-Length', '')
+    if content_length.isdigit():
+        return int(content_length), 'header'
+    if not response.num_bytes_downloaded:
+        return None, None
+    return response.num_bytes_downloaded, ('body' if body_complete else 'partial')
+
+
+class ContentHasher:
+    """Streaming BLAKE2b hash of a page body with volatile tokens blanked out
+    
+    Nonces and build IDs change on every response or deploy while the page
+    itself does not, so VOLATILE_CONTENT_PATTERNS are replaced chunk by
+    chunk. The last CONTENT_HASH_CARRY bytes (or more, when a token crosses
+    that point) are held back so a token split between chunks still
+    matches. Only that carry is buffered, never the whole body.
+    """
+
+    def __init__(self):
+        self._hash = hashlib.blake2b(digest_size=16)
+        self._carry = b''
+        self.digest: Optional[str] = None
+
+    def update(self, chunk: bytes):
+        buffer = self._carry + chunk
+        cut = max(0, len(buffer) - CONTENT_HASH_CARRY)
+        for pattern, _ in VOLATILE_CONTENT_PATTERNS:
+            for match in pattern.finditer(buffer, max(0, cut - CONTENT_HASH_CARRY)):
+                if match.start() < cut < match.end():
+                    cut = match.start()
+        self._hash.update(self._normalize(buffer[:cut]))
+        self._carry = buffer[cut:]
+
+    def finish(self) -> str:
+        """Hash the held-back tail; call once the whole body was read"""
+        self._hash.update(self._normalize(self._carry))
+        self._carry = b''
+        self.digest = self._hash.hexdigest()
+        return self.digest
+
+    @staticmethod
+    def _normalize(data: bytes) -> bytes:
+        for pattern, replacement in VOLATILE_CONTENT_PATTERNS:
+            data = pattern.sub(replacement, data)
+        return data
+
+
+def shard_for(url: str, shards: int) -> int:
+    """Stable shard index of a URL (hash() is randomized per process)"""
+    return zlib.crc32(url.encode('utf-8')) % shards
+
+
+class HreflangGraph:
+    """Site-wide hreflang index built once from every sitemap <url> entry
+    
+    URLs are nodes and their xhtml:link alternates are edges labelled with
+    the hreflang code. All checks run in a single O(V+E) pass over it.
+    
+    Every page of a translation cluster usually declares the same set of
+    alternates, so identical sets share one tuple, edge dict and target set.
+    """
+
+    def __init__(self):
+        self.alternates: Dict[str, Dict[str, str]] = {}
+        self._targets: Dict[str, frozenset] = {}
+        self._shared: Dict[Tuple[Alternate, ...], Tuple[Tuple[Alternate, ...], Dict[str, str], frozenset]] = {}
+
+    def add(self, url: str, alternates: Tuple[Alternate, ...]) -> Tuple[Alternate, ...]:
+        """Add a URL node with its hreflang alternates and return the shared alternates tuple"""
+        shared = self._shared.get(alternates)
+        if shared is None:
+            edges = {alt.hreflang: alt.href for alt in alternates if alt.hreflang and alt.href}
+            shared = (alternates, edges, frozenset(edges.values()))
+            self._shared[alternates] = shared
+        
+        alternates, self.alternates[url], self._targets[url] = shared
+        return alternates
+
+    def find_issues(self, url_results: Dict[str, "URLResult"]) -> List[str]:
+        """Check completeness, self-references, reachability, reciprocity and x-default consistency"""
+        issues = []
+        expected_hreflangs = set(LOCALES + ['x-default'])
+        
+        for url, edges in self.alternates.items():
+            if not edges:
+                continue
+            
+            missing = expected_hreflangs - set(edges)
+            if missing:
+                issues.append(f"{url}: Missing hreflang tags: {', '.join(sorted(missing))}")
+            
+            if url not in self._targets[url]:
+                issues.append(f"{url}: No self-referencing hreflang alternate")
+            
+            x_default = edges.get('x-default')
+            for hreflang, href in edges.items():
+                if href == url:
+                    continue
+                
+                alt_result = url_results.get(href)
+                if alt_result is not None and not alt_result.is_valid:
+                    issues.append(f"{url}: Alternate [{hreflang}] {href} is not accessible: {alt_result.error}")
+                
+                if hreflang == 'x-default':
+                    continue
+                
+                alt_edges = self.alternates.get(href)
+                if alt_edges is None:
+                    issues.append(f"{url}: Alternate [{hreflang}] {href} is not listed in any sitemap")
+                    continue
+                
+                # Reciprocity: the alternate must link back to this page
+                if url not in self._targets[href]:
+                    issues.append(f"{url}: Alternate [{hreflang}] {href} does not link back")
+                elif alt_edges.get(hreflang) != href:
+                    issues.append(f"{url}: Alternate [{hreflang}] {href} declares a different [{hreflang}] URL")
+                
+                if alt_edges and alt_edges.get('x-default') != x_default:
+                    issues.append(f"{url}: x-default differs from alternate [{hreflang}] {href}")
+        
+        return issues
+
+
+class HeadScanner(HTMLParser):
+    """Incremental <head> scanner for hreflang alternates and the canonical link
+    
+    Fed decoded chunks as they stream in; ``done`` turns true at </head> (or
+    the first <body> tag) so the caller can stop reading. Only the head is
+    ever parsed, which keeps the work small enough to run on the event loop.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.alternates: Dict[str, str] = {}
+        self.canonical: Optional[str] = None
+        self.done = False
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]):
+        if self.done:
+            return
+        if tag == 'body':
+            self.done = True
+            return
+        if tag != 'link':
+            return
+        
+        attributes = dict(attrs)
+        rel = (attributes.get('rel') or '').lower().split()
+        href = attributes.get('href')
+        if not href:
+            return
+        if 'canonical' in rel:
+            self.canonical = href
+        elif 'alternate' in rel and attributes.get('hreflang'):
+            self.alternates[attributes['hreflang']] = href
+
+    def handle_endtag(self, tag: str):
+        if tag == 'head':
+            self.done = True
+
+
+def srcset_urls(srcset: str) -> List[str]:
+    """Candidate URLs of a srcset attribute
+    
+    Candidates are split on the comma that ends a descriptor (or a URL),
+    never inside a URL, so Cloudinary transformations such as
+    ``w_400,c_fill`` stay intact.
+    """
+    urls = []
+    expect_url = True
+    for token in srcset.split():
+        if expect_url and token.rstrip(','):
+            urls.append(token.rstrip(','))
+        expect_url = token.endswith(',')
+    return urls
+
+
+class LinkExtractor(HTMLParser):
+    """Incremental collector of the <a href> links and asset references of a page
+    
+    Assets are <img>/<source> src and srcset candidates, <link rel=preload>
+    targets and Open Graph/Twitter images; the <base> URL is kept to
+    resolve both.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.hrefs: Dict[str, None] = {}  # Insertion-ordered, deduplicated per page
+        self.assets: Dict[str, None] = {}
+        self.base: Optional[str] = None
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]):
+        attributes = dict(attrs)
+        if tag == 'a':
+            references = [attributes.get('href')]
+            target = self.hrefs
+        elif tag in ('img', 'source'):
+            references = [attributes.get('src'), *srcset_urls(attributes.get('srcset') or '')]
+            target = self.assets
+        elif tag == 'link' and 'preload' in (attributes.get('rel') or '').lower().split():
+            references = [attributes.get('href'), *srcset_urls(attributes.get('imagesrcset') or '')]
+            target = self.assets
+        elif tag == 'meta' and (attributes.get('property') or attributes.get('name')) in SOCIAL_IMAGE_META:
+            references = [attributes.get('content')]
+            target = self.assets
+        else:
+            if tag == 'base' and self.base is None:
+                self.base = attributes.get('href')
+            return
+        
+        for reference in references:
+            if reference and reference.strip():
+                target[reference.strip()] = None
+
+    def internal_links(self, page_url: str, site_url: str) -> Tuple[str, ...]:
+        """Normalized links of the page that stay on ``site_url``'s host"""
+        base = urljoin(page_url, self.base) if self.base else page_url
+        site = urlsplit(normalize_link(site_url, site_url) or site_url).netloc
+        links = {}
+        for href in self.hrefs:
+            link = normalize_link(href, base)
+            if link is not None and urlsplit(link).netloc == site:
+                links[link] = None
+        return tuple(links)
+
+    def asset_urls(self, page_url: str) -> Tuple[str, ...]:
+        """Normalized asset URLs of the page, on any host"""
+        base = urljoin(page_url, self.base) if self.base else page_url
+        return tuple(dict.fromkeys(url for url in (normalize_link(asset, base) for asset in self.assets) if url))
+
+
+def normalize_link(href: str, page_url: str) -> Optional[str]:
+    """Absolute http(s) form of a link, without fragment or default port, or None
+    
+    The scheme and host are lowercased and unencoded path characters are
+    percent-encoded, so the spellings of one page compare equal. Query
+    strings and trailing slashes are kept, as they may be distinct pages.
+    """
+    try:
+        parts = urlsplit(urljoin(page_url, href))
+        port = parts.port
+    except ValueError:
+        return None
+    scheme = parts.scheme.lower()
+    if scheme not in DEFAULT_PORTS or not parts.hostname:
+        return None
+    
+    netloc = parts.hostname
+    if port is not None and port != DEFAULT_PORTS[scheme]:
+        netloc = f'{netloc}:{port}'
+    return urlunsplit((scheme, netloc, quote(parts.path or '/', safe=URL_PATH_SAFE), parts.query, ''))
+
+
+class SeenUrls:
+    """Compact set of URLs kept as 64-bit BLAKE2b digests instead of strings
+    
+    A digest costs a fraction of a full URL string, which keeps the crawl
+    seen-set small on large sites; collisions are negligible at 2**64.
+    """
+
+    def __init__(self):
+        self._digests: Set[int] = set()
+
+    @staticmethod
+    def _digest(url: str) -> int:
+        return int.from_bytes(hashlib.blake2b(url.encode('utf-8'), digest_size=8).digest(), 'big')
+
+    def add(self, url: str) -> bool:
+        """Add ``url`` and return whether it was new"""
+        digest = self._digest(url)
+        if digest in self._digests:
+            return False
+        self._digests.add(digest)
+        return True
+
+    def __contains__(self, url: str) -> bool:
+        return self._digest(url) in self._digests
+
+    def __len__(self) -> int:
+        return len(self._digests)
+
+
+class ResultMemo(OrderedDict):
+    """URL -> result map for repeated URLs, evicting the least recently used beyond ``maxsize``
+    
+    Unbounded (``maxsize=None``) when results are retained anyway; bounded
+    when they are streamed, so memory stays flat however large the sitemap.
+    """
+
+    def __init__(self, maxsize: Optional[int] = None):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def get(self, url: str) -> Optional["URLResult"]:
+        """The memoized result for ``url``, marking it recently used"""
+        if url not in self:
+            return None
+        self.move_to_end(url)
+        return self[url]
+
+    def __setitem__(self, url: str, result: "URLResult"):
+        super().__setitem__(url, result)
+        self.move_to_end(url)
+        if self.maxsize is not None and len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
+def route_pattern(route: str) -> Pattern:
+    """Regex for a Next.js route template such as /works/[slug] or /docs/[...path]
+    
+    Route groups like (legal) are not part of the URL and are dropped.
+    """
+    parts = []
+    for segment in route.strip('/').split('/'):
+        if not segment or (segment.startswith('(') and segment.endswith(')')):
+            continue
+        optional = re.fullmatch(r'\[\[\.\.\.(\w+)\]\]', segment)
+        catch_all = re.fullmatch(r'\[\.\.\.(\w+)\]', segment)
+        dynamic = re.fullmatch(r'\[(\w+)\]', segment)
+        if optional:
+            parts.append(f'(?:/(?P<{optional.group(1)}>.+))?')
+        elif catch_all:
+            parts.append(f'/(?P<{catch_all.group(1)}>.+)')
+        elif dynamic:
+            parts.append(f'/(?P<{dynamic.group(1)}>[^/]+)')
+        else:
+            parts.append('/' + re.escape(segment))
+    return re.compile(''.join(parts) or '/')
+
+
+class BuildIndex:
+    """Path index of a local Next.js build, built once to answer URLs without a server
+    
+    Indexes a `next build` directory (prerendered pages and route handler
+    bodies under server/app, the prerender and app route manifests, static
+    chunks and the sibling public/ directory) or a static export (out/).
+    Public URLs are mapped to the internal [locale] routes the build is
+    keyed by, using the "as-needed" prefix rules of LOCALES and
+    DEFAULT_LOCALE and the localized PATHNAMES.
+    """
+
+    def __init__(self, build_dir: Path, sitemap_dir: Optional[Path] = None):
+        self.build_dir = build_dir
+        self.pages: Dict[str, Optional[Path]] = {}  # Internal page path -> prerendered HTML, if on disk
+        self.files: Dict[str, Path] = {}  # Other files by URL path (sitemaps, static assets)
+        self.dynamic_routes: List[Pattern] = []  # Pages rendered on demand, matched by route only
+        self.on_demand: Set[str] = set()  # Looked-up paths that only matched a dynamic route
+        self._localized = [
+            (locale, route_pattern(localized), internal)
+            for internal, localized_paths in PATHNAMES.items()
+            for locale, localized in localized_paths.items()
+        ]
+        
+        if (build_dir / BUILD_ID_FILE).is_file():
+            self._index_next_build()
+        else:
+            self._index_files(build_dir, '/')
+        if sitemap_dir is not None:
+            # Sitemaps are force-dynamic route handlers, so builds usually lack them
+            for file in sitemap_dir.glob('*.xml'):
+                self.files[f'/{file.name}'] = file
+
+    def _index_next_build(self):
+        app_dir = self.build_dir / 'server' / 'app'
+        for file in app_dir.rglob('*'):
+            if file.suffix == '.html':
+                self.pages[self._page_path(file, app_dir)] = file
+            elif file.suffix == '.body':
+                # Prerendered route handler output, e.g. sitemap.xml.body
+                self.files['/' + file.relative_to(app_dir).with_suffix('').as_posix()] = file
+        
+        prerender_manifest = self.build_dir / 'prerender-manifest.json'
+        if prerender_manifest.is_file():
+            for route in json.loads(prerender_manifest.read_text(encoding='utf-8')).get('routes', {}):
+                self.pages.setdefault(route, None)
+        
+        routes_manifest = self.build_dir / 'app-path-routes-manifest.json'
+        if routes_manifest.is_file():
+            for entry, route in json.loads(routes_manifest.read_text(encoding='utf-8')).items():
+                if entry.endswith('/page') and '[' in route:
+                    self.dynamic_routes.append(route_pattern(route))
+        
+        self._index_files(self.build_dir / 'static', '/_next/static/')
+        self._index_files(self.build_dir.parent / 'public', '/')
+
+    def _index_files(self, directory: Path, prefix: str):
+        if not directory.is_dir():
+            return
+        for file in directory.rglob('*'):
+            if not file.is_file():
+                continue
+            if file.suffix == '.html' and prefix == '/':
+                self.pages[self._page_path(file, directory)] = file
+            else:
+                self.files[prefix + file.relative_to(directory).as_posix()] = file
+
+    @staticmethod
+    def _page_path(file: Path, root: Path) -> str:
+        """URL path of a prerendered HTML file: es.html, es/index.html -> /es"""
+        path = '/' + file.relative_to(root).with_suffix('').as_posix()
+        if path == '/index' or path.endswith('/index'):
+            path = path[:-len('index')].rstrip('/') or '/'
+        return path
+
+    def internal_path(self, path: str) -> str:
+        """Internal [locale] route path of a public URL path: /trabajos/x -> /es/works/x"""
+        locale, rest = DEFAULT_LOCALE, path
+        for candidate in LOCALES:
+            if path == f'/{candidate}' or path.startswith(f'/{candidate}/'):
+                locale, rest = candidate, path[len(candidate) + 1:] or '/'
+                break
+        
+        for route_locale, pattern, internal in self._localized:
+            if route_locale != locale:
+                continue
+            match = pattern.fullmatch(rest)
+            if match:
+                rest = re.sub(r'\[+(?:\.\.\.)?(\w+)\]+', lambda m: match.group(m.group(1)) or '', internal)
+                break
+        return f'/{locale}' + ('' if rest == '/' else rest.rstrip('/'))
+
+    def lookup(self, path: str) -> Tuple[int, Dict[str, str], Optional[Path]]:
+        """Status, headers and body file the deployed server would answer ``path`` with"""
+        html = {'Content-Type': 'text/html; charset=utf-8'}
+        if path in self.files:
+            file = self.files[path]
+            content_type = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+            return 200, {'Content-Type': content_type, 'Content-Length': str(file.stat().st_size)}, file
+        if path != '/' and path.endswith('/'):
+            # Next.js redirects trailing slashes away (trailingSlash: false)
+            return 308, {'Location': path.rstrip('/')}, None
+        prefix = f'/{DEFAULT_LOCALE}'
+        if path == prefix or path.startswith(prefix + '/'):
+            # as-needed prefixes: the default locale is served without one
+            return 307, {'Location': path[len(prefix):] or '/'}, None
+        
+        internal = self.internal_path(path)
+        if internal in self.pages:
+            page = self.pages[internal]
+            if page is not None:
+                html['Content-Length'] = str(page.stat().st_size)
+            return 200, html, page
+        if any(pattern.fullmatch(internal) for pattern in self.dynamic_routes):
+            self.on_demand.add(path)
+            return 200, html, None
+        return 404, html, None
+
+
+class BuildDirTransport(httpx.AsyncBaseTransport):
+    """In-process origin answering every request from a BuildIndex (--build-dir)"""
+
+    def __init__(self, index: BuildIndex):
+        self.index = index
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        status, headers, source = self.index.lookup(unquote(request.url.path) or '/')
+        content = source.read_bytes() if source is not None and request.method != 'HEAD' else b''
+        return httpx.Response(status, headers=headers, content=content)
+
+
+class SitemapFetchError(Exception):
+    """Raised when a sitemap document cannot be downloaded"""
+
+
+class CheckpointError(Exception):
+    """Raised when --resume finds a checkpoint that belongs to another run"""
+
+
+class RedirectTraceError(Exception):
+    """Raised when manual redirect following hits a loop (``loop``) or the hop limit"""
+
+    def __init__(self, message: str, loop: bool = False):
+        super().__init__(message)
+        self.loop = loop
+
+
+def sitemap_segment_name(sitemap_url: str) -> str:
+    """Derive a report segment name from a sitemap URL
+    
+    /sitemap-works.xml and its paginated siblings /sitemap-works-2.xml or
+    /sitemap-works.xml?page=2 all map to "works".
+    """
+    name = Path(urlparse(sitemap_url).path).name
+    name = re.sub(r'\.xml(\.gz)?$', '', name)
+    name = re.sub(r'^sitemap[-_]?', '', name)
+    name = re.sub(r'[-_](page[-_]?)?\d+$', '', name)
+    return name or 'sitemap'
 
 
 @dataclass
+class ClientSettings:
+    """HTTP client transport settings
+    
+    Pool limits left as None are sized from the validator concurrency, so
+    raising --concurrency never makes requests queue inside httpx.
+    """
+    http2: bool = False
+    max_connections: Optional[int] = None
+    max_keepalive_connections: Optional[int] = None
+    keepalive_expiry: float = KEEPALIVE_EXPIRY
+    connect_timeout: float = CONNECT_TIMEOUT
+    read_timeout: float = TIMEOUT
+
+    def limits(self, concurrency: int) -> httpx.Limits:
+        """Connection pool limits for the given number of in-flight requests"""
+        # Sitemap downloads hold connections alongside the URL checks
+        pool_size = concurrency + SITEMAP_FETCH_CONCURRENCY
+        max_connections = self.max_connections or pool_size
+        return httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=min(self.max_keepalive_connections or pool_size, max_connections),
+            keepalive_expiry=self.keepalive_expiry
+        )
+
+    def timeout(self) -> httpx.Timeout:
+        """Request timeouts"""
+        return httpx.Timeout(self.read_timeout, connect=self.connect_timeout)
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class RedirectHop:
+    """One redirect response observed while tracing a redirect chain"""
+    url: str
+    status_code: int
+    location: str
+    elapsed: float  # Seconds spent on this hop's request
+    memoized: bool = False  # Reused from an identical hop of another URL, no request sent
+
+
+@dataclass(**DATACLASS_SLOTS)
 class URLResult:
-    """Result of URL validation"""
+    """Result of URL validation
+    
+    Kept compact for million-URL runs: slotted, with immutable tuples (empty
+    ones are shared) instead of per-result lists, interned content types and
+    the hreflang alternates tuple shared by the whole translation cluster.
+    """
     url: str
     status_code: Optional[int] = None
     final_url: Optional[str] = None
-    redirect_chain: List[str] = field(default_factory=list)
+    redirect_chain: Tuple[str, ...] = ()
     response_time: Optional[float] = None
     error: Optional[str] = None
     content_type: Optional[str] = None
-    hreflang_links: List[Dict[str, str]] = field(default_factory=list)
+    hreflang_links: Tuple[Alternate, ...] = ()
     is_valid: bool = False
-    warnings: List[str] = field(default_factory=list)
+    warnings: Tuple[str, ...] = ()
+    cache_status: Optional[str] = None  # 'hit' (within TTL), 'revalidated' (304) or 'report' (previous run)
+    lastmod: Optional[str] = None
+    method: Optional[str] = None  # HTTP method of the request that produced the result
+    redirect_hops: Tuple[RedirectHop, ...] = ()  # Only filled with --trace-redirects
+    redirect_loop: bool = False  # The redirect chain revisits a URL (--trace-redirects)
+    retries: int = 0  # Extra attempts after timeouts or overload responses
+    connect_time: Optional[float] = None  # DNS + TCP + TLS, 0 on a reused connection
+    ttfb: Optional[float] = None  # Until the final response headers, redirects included
+    body_time: Optional[float] = None  # Body read after the headers (on-page checks only)
+    content_length: Optional[int] = None  # Content-Length, or bytes read without one
+    size_source: Optional[str] = None  # One of SIZE_SOURCES, when content_length is known
+    content_hash: Optional[str] = None  # Normalized body hash (--content-hash)
+    content_change: Optional[str] = None  # One of CONTENT_CHANGES, for pages fetched with a known previous hash
+    found_on: Optional[str] = None  # Page whose link led to a crawled URL (--crawl)
+    outlinks: Tuple[str, ...] = ()  # Internal links of the page, cleared once queued for the crawl
+    asset_bytes: Optional[int] = None  # Known size of the page's assets (--check-assets)
+    assets: Tuple[str, ...] = ()  # Asset URLs of the page, cleared once checked
+
+
+@dataclass(**DATACLASS_SLOTS)
+class AssetResult:
+    """Result of checking one asset referenced by pages"""
+    url: str
+    status_code: Optional[int] = None
+    content_type: Optional[str] = None
+    content_length: Optional[int] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class CacheEntry:
+    """Persisted outcome of the last request for a URL"""
+    url: str
+    status_code: int
+    final_url: Optional[str]
+    content_type: Optional[str]
+    etag: Optional[str]
+    last_modified: Optional[str]
+    lastmod: Optional[str]
+    checked_at: float
+    content_hash: Optional[str] = None
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Build If-None-Match / If-Modified-Since headers for revalidation"""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class ValidationCache:
+    """SQLite-backed HTTP validation cache that survives between runs
+    
+    Successful results younger than ``ttl`` seconds are trusted as long as the
+    sitemap lastmod has not changed. Older entries are revalidated with a
+    conditional request, and a 304 keeps them valid.
+    
+    With ``shared`` set (--workers processes using one database), the WAL
+    journal is used and every write is committed at once, so no process
+    holds the write lock while it waits on the network.
+    """
+
+    def __init__(self, cache_dir: Path, ttl: float = DEFAULT_CACHE_TTL, shared: bool = False):
+        self.path = Path(cache_dir) / CACHE_FILENAME
+        self.ttl = ttl
+        self.shared = shared
+        self.commit_interval = 1 if shared else CACHE_COMMIT_INTERVAL
+        self._connection: Optional[sqlite3.Connection] = None
+        self._pending_writes = 0
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Open the database lazily, creating the schema on first use"""
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(str(self.path), timeout=CACHE_BUSY_TIMEOUT)
+            if self.shared:
+                self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS url_cache (
+                    url TEXT PRIMARY KEY,
+                    status_code INTEGER NOT NULL,
+                    final_url TEXT,
+                    content_type TEXT,
+                    etag TEXT,
+                    last_modified TEXT,
+                    lastmod TEXT,
+                    checked_at REAL NOT NULL,
+                    content_hash TEXT
+                )
+                """
+            )
+            columns = {row[1] for row in self._connection.execute('PRAGMA table_info(url_cache)')}
+            if 'content_hash' not in columns:
+                # Databases created before content hashing
+                self._connection.execute('ALTER TABLE url_cache ADD COLUMN content_hash TEXT')
+        return self._connection
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        """Look up the cached entry for a URL"""
+        row = self.connection.execute(
+            'SELECT url, status_code, final_url, content_type, etag, last_modified, lastmod, checked_at, content_hash '
+            'FROM url_cache WHERE url = ?',
+            (url,)
+        ).fetchone()
+        return CacheEntry(*row) if row else None
+
+    def put(self, entry: CacheEntry):
+        """Insert or replace the entry for its URL"""
+        self.connection.execute(
+            'INSERT OR REPLACE INTO url_cache '
+            '(url, status_code, final_url, content_type, etag, last_modified, lastmod, checked_at, content_hash) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            (entry.url, entry.status_code, entry.final_url, entry.content_type,
+             entry.etag, entry.last_modified, entry.lastmod, entry.checked_at, entry.content_hash)
+        )
+        self._pending_writes += 1
+        if self._pending_writes >= self.commit_interval:
+            self.commit()
+
+    def is_fresh(self, entry: CacheEntry, lastmod: Optional[str]) -> bool:
+        """Whether a successful entry can be trusted without any request"""
+        if not (200 <= entry.status_code < 300):
+            return False
+        if lastmod and lastmod != entry.lastmod:
+            return False
+        return time.time() - entry.checked_at < self.ttl
+
+    def commit(self):
+        """Flush batched writes to disk"""
+        if self._connection is not None and self._pending_writes:
+            self._connection.commit()
+            self._pending_writes = 0
+
+    def close(self):
+        """Commit pending writes and close the database"""
+        if self._connection is not None:
+            self.commit()
+            self._connection.close()
+            self._connection = None
+
+
+@dataclass
+class SitemapResult:
+    """Result of sitemap validation"""
+    segment: str
+    total_urls: int
+    valid_urls: int
+    failed_urls: int
+    redirect_urls: int
+    url_results: List[URLResult] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+    latency: Dict[str, LatencyHistogram] = field(default_factory=dict)  # Per LATENCY_PHASES, fetched URLs only
+    total_bytes: int = 0  # Sum of the known page sizes
+    asset_bytes: int = 0  # Sum of the pages' asset bytes (--check-assets)
+    bytes_by_source: Dict[str, int] = field(default_factory=dict)  # total_bytes split by SIZE_SOURCES
+
+
+@dataclass
+class ValidationReport:
+    """Complete validation report"""
+    base_url: str
+    timestamp: str
+    total_urls: int
+    valid_urls: int
+    failed_urls: int
+    redirect_urls: int
+    sitemap_results: List[SitemapResult] = field(default_factory=list)
+    hreflang_issues: List[str] = field(default_factory=list)
+    redirect_loops: List[str] = field(default_factory=list)
+    execution_time: Optional[float] = None
+    slowest_urls: List[Dict] = field(default_factory=list)
+    heaviest_pages: List[Dict] = field(default_factory=list)
+    performance_regressions: List[str] = field(default_factory=list)
+    plugin_errors: List[str] = field(default_factory=list)  # Failing listeners and reporters (the run went on)
+    performance_notes: List[str] = field(default_factory=list)  # Budgets that could not be evaluated
+    content_changes: Dict[str, List[str]] = field(default_factory=dict)  # CONTENT_CHANGES -> URLs
+
+
+def intern_optional(value: Optional[str]) -> Optional[str]:
+    """Intern a frequently repeated string (content type, hreflang code, lastmod)"""
+    return sys.intern(value) if value else value
+
+
+def url_result_to_dict(url_result: URLResult) -> Dict:
+    """Serialize a URL result for JSON reports"""
+    return {
+        'url': url_result.url,
+        'status_code': url_result.status_code,
+        'final_url': url_result.final_url,
+        'redirect_chain': url_result.redirect_chain,
+        'response_time': url_result.response_time,
+        'connect_time': url_result.connect_time,
+        'ttfb': url_result.ttfb,
+        'body_time': url_result.body_time,
+        'content_length': url_result.content_length,
+        'size_source': url_result.size_source,
+        'content_hash': url_result.content_hash,
+        'content_change': url_result.content_change,
+        'found_on': url_result.found_on,
+        'asset_bytes': url_result.asset_bytes,
+        'error': url_result.error,
+        'content_type': url_result.content_type,
+        'is_valid': url_result.is_valid,
+        'warnings': url_result.warnings,
+        'hreflang_links': [alt._asdict() for alt in url_result.hreflang_links],
+        'cache_status': url_result.cache_status,
+        'lastmod': url_result.lastmod,
+        'method': url_result.method,
+        'redirect_hops': [asdict(hop) for hop in url_result.redirect_hops],
+        'redirect_loop': url_result.redirect_loop,
+        'retries': url_result.retries
+    }
+
+
+def url_result_from_dict(data: Dict) -> URLResult:
+    """Rebuild a URL result from its JSON report form"""
+    return URLResult(
+        url=data['url'],
+        status_code=data.get('status_code'),
+        final_url=data.get('final_url'),
+        redirect_chain=tuple(data.get('redirect_chain') or ()),
+        response_time=data.get('response_time'),
+        connect_time=data.get('connect_time'),
+        ttfb=data.get('ttfb'),
+        body_time=data.get('body_time'),
+        content_length=data.get('content_length'),
+        size_source=data.get('size_source'),
+        content_hash=data.get('content_hash'),
+        content_change=data.get('content_change'),
+        found_on=data.get('found_on'),
+        asset_bytes=data.get('asset_bytes'),
+        error=data.get('error'),
+        content_type=intern_optional(data.get('content_type')),
+        hreflang_links=tuple(Alternate(alt['hreflang'], alt['href']) for alt in data.get('hreflang_links') or ()),
+        is_valid=bool(data.get('is_valid')),
+        warnings=tuple(data.get('warnings') or ()),
+        cache_status=data.get('cache_status'),
+        lastmod=data.get('lastmod'),
+        method=data.get('method'),
+        redirect_hops=tuple(RedirectHop(**hop) for hop in data.get('redirect_hops') or ()),
+        redirect_loop=data.get('redirect_loop', False),
+        retries=data.get('retries', 0)
+    )
+
+
+def format_ms(seconds: Optional[float]) -> str:
+    """Seconds as milliseconds for report tables"""
+    return f"{seconds * 1000:.1f}" if seconds is not None else "-"
+
+
+def format_bytes(size: Optional[int]) -> str:
+    """Byte count as KB or MB for report tables"""
+    if size is None:
+        return "-"
+    if size >= 1024 * 1024:
+        return f"{size / (1024 * 1024):.1f} MB"
+    return f"{size / 1024:.1f} KB"
+
+
+def format_telemetry(sample: "TelemetrySample") -> str:
+    """One-line summary of a telemetry sample for the live display"""
+    return (f"{sample.requests_per_sec:.1f} req/s, {sample.in_flight} in flight, queue {sample.queue_depth}, "
+            f"loop lag {sample.loop_lag * 1000:.0f}ms, errors {sample.error_rate:.1%}, "
+            f"{format_bytes(int(sample.bytes_per_sec))}/s")
+
+
+def latency_to_dict(latency: Dict[str, LatencyHistogram]) -> Dict:
+    """Serialize per-phase latency histograms"""
+    return {phase: histogram.to_dict() for phase, histogram in latency.items()}
+
+
+def latency_from_dict(data: Optional[Dict]) -> Dict[str, LatencyHistogram]:
+    """Rebuild per-phase latency histograms (empty for reports that predate them)"""
+    return {phase: LatencyHistogram.from_dict(histogram) for phase, histogram in (data or {}).items()}
+
+
+def report_to_dict(report: ValidationReport) -> Dict:
+    """Serialize a validation report for JSON output"""
+    report_dict = {
+        'base_url': report.base_url,
+        'timestamp': report.timestamp,
+        'total_urls': report.total_urls,
+        'valid_urls': report.valid_urls,
+        'failed_urls': report.failed_urls,
+        'redirect_urls': report.redirect_urls,
+        'execution_time': report.execution_time,
+        'sitemap_results': [],
+        'hreflang_issues': report.hreflang_issues,
+        'redirect_loops': report.redirect_loops,
+        'slowest_urls': report.slowest_urls,
+        'heaviest_pages': report.heaviest_pages,
+        'performance_regressions': report.performance_regressions,
+        'performance_notes': report.performance_notes,
+        'plugin_errors': report.plugin_errors,
+        'content_changes': report.content_changes
+    }
+    
+    for seg_result in report.sitemap_results:
+        report_dict['sitemap_results'].append({
+            'segment': seg_result.segment,
+            'total_urls': seg_result.total_urls,
+            'valid_urls': seg_result.valid_urls,
+            'failed_urls': seg_result.failed_urls,
+            'redirect_urls': seg_result.redirect_urls,
+            'total_bytes': seg_result.total_bytes,
+            'asset_bytes': seg_result.asset_bytes,
+            'bytes_by_source': seg_result.bytes_by_source,
+            'errors': seg_result.errors,
+            'latency': latency_to_dict(seg_result.latency),
+            'url_results': [url_result_to_dict(url_result) for url_result in seg_result.url_results]
+        })
+    
+    return report_dict
+
+
+def report_from_dict(data: Dict) -> ValidationReport:
+    """Rebuild a validation report from its JSON form"""
+    report = ValidationReport(
+        base_url=data['base_url'],
+        timestamp=data['timestamp'],
+        total_urls=data['total_urls'],
+        valid_urls=data['valid_urls'],
+        failed_urls=data['failed_urls'],
+        redirect_urls=data['redirect_urls'],
+        hreflang_issues=list(data.get('hreflang_issues') or []),
+        redirect_loops=list(data.get('redirect_loops') or []),
+        execution_time=data.get('execution_time'),
+        slowest_urls=list(data.get('slowest_urls') or []),
+        heaviest_pages=list(data.get('heaviest_pages') or []),
+        performance_regressions=list(data.get('performance_regressions') or []),
+        performance_notes=list(data.get('performance_notes') or []),
+        plugin_errors=list(data.get('plugin_errors') or []),
+        content_changes={change: list(urls) for change, urls in (data.get('content_changes') or {}).items()}
+    )
+    
+    for seg_data in data.get('sitemap_results', []):
+        report.sitemap_results.append(SitemapResult(
+            segment=seg_data['segment'],
+            total_urls=seg_data['total_urls'],
+            valid_urls=seg_data['valid_urls'],
+            failed_urls=seg_data['failed_urls'],
+            redirect_urls=seg_data['redirect_urls'],
+            url_results=[url_result_from_dict(item) for item in seg_data.get('url_results', [])],
+            errors=list(seg_data.get('errors') or []),
+            latency=latency_from_dict(seg_data.get('latency')),
+            total_bytes=seg_data.get('total_bytes', 0),
+            asset_bytes=seg_data.get('asset_bytes', 0),
+            bytes_by_source=dict(seg_data.get('bytes_by_source') or {})
+        ))
+    
+    return report
+
+
+def load_report(input_file: str) -> ValidationReport:
+    """Load a report written by SitemapValidator.save_report or JsonlReportWriter"""
+    if str(input_file).endswith('.jsonl'):
+        return read_jsonl_report(input_file)
+    with open(input_file, 'r', encoding='utf-8') as f:
+        return report_from_dict(json.load(f))
+
+
+class Reporter:
+    """Output sink fed while a validation runs
+    
+    Registered with ``SitemapValidator.add_reporter``: ``on_result`` gets
+    every URL result as soon as it is recorded and ``finish`` the final
+    report. ``close`` is left to the owner and must be safe to call twice.
+    Exceptions from ``on_result`` and ``finish`` do not stop the run; they
+    are listed in the report's ``plugin_errors``.
+    """
+
+    def on_result(self, segment: str, url_result: URLResult):
+        pass
+
+    def finish(self, report: ValidationReport):
+        pass
+
+    def close(self):
+        pass
+
+
+class ConsoleReporter(Reporter):
+    """Rich (or plain) summary of the finished run"""
+
+    def __init__(self, validator: "SitemapValidator"):
+        self.validator = validator
+
+    def finish(self, report: ValidationReport):
+        self.validator.print_report(report)
+
+
+class JsonReportWriter(Reporter):
+    """Single JSON document written once the run is finished"""
+
+    def __init__(self, output_file: str):
+        self.output_file = output_file
+
+    def finish(self, report: ValidationReport):
+        with open(self.output_file, 'w', encoding='utf-8') as f:
+            json.dump(report_to_dict(report), f, indent=2, ensure_ascii=False)
+
+
+class JsonlReportWriter(Reporter):
+    """Streaming report writer: one compact JSON record per line
+    
+    A header record is written up front, a 'url' record as soon as each
+    validation finishes, and 'segment' and 'summary' records at the end.
+    Lines are flushed as they are written, so an interrupted run keeps
+    everything validated so far.
+    """
+
+    def __init__(self, output_file: str, base_url: str):
+        self.output_file = output_file
+        self._file = open(output_file, 'w', encoding='utf-8', buffering=1)
+        self._write({'type': 'header', 'base_url': base_url, 'timestamp': datetime.now().isoformat()})
+
+    def _write(self, record: Dict):
+        self._file.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n')
+
+    def on_result(self, segment: str, url_result: URLResult):
+        """Append one URL record"""
+        self._write({'type': 'url', 'segment': segment, **url_result_to_dict(url_result)})
+
+    def finish(self, report: ValidationReport):
+        """Append segment and summary records and close the file"""
+        for seg_result in report.sitemap_results:
+            self._write({
+                'type': 'segment',
+                'segment': seg_result.segment,
+                'total_urls': seg_result.total_urls,
+                'valid_urls': seg_result.valid_urls,
+                'failed_urls': seg_result.failed_urls,
+                'redirect_urls': seg_result.redirect_urls,
+                'total_bytes': seg_result.total_bytes,
+                'asset_bytes': seg_result.asset_bytes,
+                'bytes_by_source': seg_result.bytes_by_source,
+                'errors': seg_result.errors,
+                'latency': latency_to_dict(seg_result.latency)
+            })
+        
+        summary = report_to_dict(report)
+        del summary['sitemap_results']
+        self._write({'type': 'summary', **summary})
+        self.close()
+
+    def close(self):
+        """Close the file; safe to call more than once"""
+        if not self._file.closed:
+            self._file.close()
+
+
+def read_jsonl_report(input_file: str) -> ValidationReport:
+    """Rebuild a ValidationReport from a JsonlReportWriter stream
+    
+    Works on truncated streams too: without segment and summary records the
+    counts are recomputed from the URL records.
+    """
+    header: Dict = {}
+    summary: Optional[Dict] = None
+    segments: Dict[str, SitemapResult] = {}
+    segment_records: Dict[str, Dict] = {}
+    
+    def segment_for(name: str) -> SitemapResult:
+        if name not in segments:
+            segments[name] = SitemapResult(segment=name, total_urls=0, valid_urls=0,
+                                           failed_urls=0, redirect_urls=0)
+        return segments[name]
+    
+    with open(input_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # A crash can leave a partial last line
+                continue
+            
+            record_type = record.pop('type', None)
+            if record_type == 'header':
+                header = record
+            elif record_type == 'url':
+                seg_result = segment_for(record.pop('segment'))
+                url_result = url_result_from_dict(record)
+                seg_result.url_results.append(url_result)
+                seg_result.total_urls += 1
+                if url_result.is_valid:
+                    seg_result.valid_urls += 1
+                else:
+                    seg_result.failed_urls += 1
+                if url_result.redirect_chain:
+                    seg_result.redirect_urls += 1
+                seg_result.total_bytes += url_result.content_length or 0
+                seg_result.asset_bytes += url_result.asset_bytes or 0
+                if url_result.size_source:
+                    seg_result.bytes_by_source[url_result.size_source] = (
+                        seg_result.bytes_by_source.get(url_result.size_source, 0) + (url_result.content_length or 0)
+                    )
+            elif record_type == 'segment':
+                segment_for(record['segment'])
+                segment_records[record['segment']] = record
+            elif record_type == 'summary':
+                summary = record
+    
+    # Final segment records are authoritative (URL records may be partial)
+    for name, record in segment_records.items():
+        seg_result = segments[name]
+        seg_result.total_urls = record['total_urls']
+        seg_result.valid_urls = record['valid_urls']
+        seg_result.failed_urls = record['failed_urls']
+        seg_result.redirect_urls = record['redirect_urls']
+        seg_result.errors = list(record.get('errors') or [])
+        seg_result.latency = latency_from_dict(record.get('latency'))
+        seg_result.total_bytes = record.get('total_bytes', seg_result.total_bytes)
+        seg_result.asset_bytes = record.get('asset_bytes', seg_result.asset_bytes)
+        seg_result.bytes_by_source = dict(record.get('bytes_by_source') or seg_result.bytes_by_source)
+    
+    if summary is not None:
+        summary['sitemap_results'] = []
+        report = report_from_dict(summary)
+    else:
+        report = ValidationReport(
+            base_url=header.get('base_url', ''),
+            timestamp=header.get('timestamp', ''),
+            total_urls=sum(seg.total_urls for seg in segments.values()),
+            valid_urls=sum(seg.valid_urls for seg in segments.values()),
+            failed_urls=sum(seg.failed_urls for seg in segments.values()),
+            redirect_urls=sum(seg.redirect_urls for seg in segments.values())
+        )
+    report.sitemap_results = list(segments.values())
+    
+    return report
+
+
+class ValidationCheckpoint:
+    """Append-only checkpoint of a validation run for --resume
+    
+    Completed URL results are appended as 'result' records and the URLs
+    queued but not yet finished as periodic 'pending' snapshots, flushed
+    every CHECKPOINT_INTERVAL seconds. Resuming loads the completed results
+    so they are replayed instead of re-requested; new results are appended
+    to the same file. A checkpoint of another site is never overwritten on
+    --resume.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.timestamp: Optional[str] = None
+        self.completed: Dict[str, URLResult] = {}
+        self.pending: Set[str] = set()
+        self.previously_pending = 0
+        self._restored: Set[str] = set()
+        self._file = None
+        self._last_flush = time.monotonic()
+
+    def open(self, base_url: str, resume: bool = False):
+        """Start a fresh checkpoint, or load and continue an unfinished one"""
+        if resume and self.path.exists() and self._load(base_url):
+            self._file = open(self.path, 'a', encoding='utf-8')
+            return
+        
+        self.timestamp = datetime.now().isoformat()
+        self._file = open(self.path, 'w', encoding='utf-8')
+        self._write({'type': 'header', 'base_url': base_url, 'timestamp': self.timestamp})
+        self.flush()
+
+    def _load(self, base_url: str) -> bool:
+        """Load an unfinished checkpoint for ``base_url``; False if that run finished
+        
+        Raises CheckpointError if the file is not a checkpoint of ``base_url``.
+        """
+        completed: Dict[str, URLResult] = {}
+        pending: List[str] = []
+        header: Dict = {}
+        
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A crash can leave a partial last line
+                    continue
+                record_type = record.pop('type', None)
+                if record_type == 'header':
+                    header = record
+                elif record_type == 'result':
+                    url_result = url_result_from_dict(record)
+                    completed[url_result.url] = url_result
+                elif record_type == 'pending':
+                    pending = record['urls']
+                elif record_type == 'complete':
+                    return False
+        
+        if header.get('base_url') != base_url:
+            found = f"a checkpoint of {header['base_url']}" if header.get('base_url') else 'not a checkpoint'
+            raise CheckpointError(
+                f"{self.path} is {found}, not of {base_url}; "
+                f"pass another --checkpoint file or remove it to start over"
+            )
+        
+        self.timestamp = header.get('timestamp')
+        self.completed = completed
+        self._restored = set(completed)
+        self.previously_pending = len(set(pending) - self._restored)
+        return True
+
+    def _write(self, record: Dict):
+        self._file.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n')
+
+    def take(self, url: str) -> Optional[URLResult]:
+        """Pop the checkpointed result for a URL, if the interrupted run finished it"""
+        return self.completed.pop(url, None)
+
+    def queued(self, url: str):
+        """Track a URL that entered the validation queue"""
+        self.pending.add(url)
+
+    def record(self, segment: str, url_result: URLResult):
+        """Append a completed result (used as a SitemapValidator result listener)"""
+        self.pending.discard(url_result.url)
+        if url_result.url not in self._restored:
+            self._write({'type': 'result', 'segment': segment, **url_result_to_dict(url_result)})
+        if time.monotonic() - self._last_flush >= CHECKPOINT_INTERVAL:
+            self.flush()
+
+    def flush(self):
+        """Write the pending-queue snapshot and flush everything to disk"""
+        if self._file is None or self._file.closed:
+            return
+        self._write({'type': 'pending', 'urls': sorted(self.pending)})
+        self._file.flush()
+        self._last_flush = time.monotonic()
+
+    def complete(self):
+        """Mark the run finished so a later --resume starts fresh"""
+        if self._file is not None and not self._file.closed:
+            self._write({'type': 'complete'})
+            self._file.close()
+
+    def close(self):
+        """Flush and close; safe to call more than once"""
+        if self._file is not None and not self._file.closed:
+            self.flush()
+            self._file.close()
+
+
+class TelemetrySample(NamedTuple):
+    """Counters of a run at one point in time; rates cover the window since the previous sample"""
+    timestamp: str
+    elapsed: float  # Seconds since the run started
+    requests: int
+    urls: int
+    failed_urls: int
+    bytes_received: int
+    in_flight: int
+    queue_depth: int
+    requests_per_sec: float
+    urls_per_sec: float
+    bytes_per_sec: float
+    error_rate: float  # Failed share of the URLs recorded in the window
+    loop_lag: float  # Worst event-loop lag seen in the window, in seconds
+
+
+class RunTelemetry:
+    """Live counters of a validation run, turned into TelemetrySamples
+    
+    Requests, in-flight requests and received bytes are counted by a
+    TelemetryTransport around this process's client, so with --workers they
+    stay at zero and only URL outcomes, queue depth and loop lag are live.
+    Steady loop lag with few requests in flight points at the validator
+    (CPU-bound parsing or reporting), many in-flight requests with low
+    throughput at the origin.
+    """
+
+    def __init__(self, interval: float = DEFAULT_TELEMETRY_INTERVAL, writers: Optional[List] = None,
+                 live: bool = True):
+        self.interval = interval
+        self.writers = writers or []
+        self.live = live  # Show samples in the progress display (or as plain lines)
+        self.started = time.perf_counter()
+        self.requests = 0
+        self.in_flight = 0
+        self.bytes_received = 0
+        self.urls = 0
+        self.failed_urls = 0
+        self.queues: List[asyncio.Queue] = []  # Worker-pool queues currently being drained
+        # (elapsed, lag) probes, enough to cover the longest sample window
+        self._lags: Deque[Tuple[float, float]] = deque(
+            maxlen=int(max(interval, TELEMETRY_REFRESH) / LOOP_LAG_PROBE) + 1
+        )
+
+    def elapsed(self) -> float:
+        """Seconds since the telemetry was created"""
+        return time.perf_counter() - self.started
+
+    def record_result(self, segment: str, url_result: URLResult):
+        """Count a recorded URL result (used as a SitemapValidator result listener)"""
+        self.urls += 1
+        if not url_result.is_valid:
+            self.failed_urls += 1
+
+    def record_lag(self, lag: float):
+        """Add one event-loop lag probe"""
+        self._lags.append((self.elapsed(), lag))
+
+    def sample(self, previous: Optional[TelemetrySample] = None) -> TelemetrySample:
+        """Snapshot the counters, with rates since ``previous`` (or since the start)"""
+        elapsed = self.elapsed()
+        since = previous.elapsed if previous is not None else 0.0
+        window = max(elapsed - since, 1e-9)
+        requests = self.requests - (previous.requests if previous is not None else 0)
+        urls = self.urls - (previous.urls if previous is not None else 0)
+        failed = self.failed_urls - (previous.failed_urls if previous is not None else 0)
+        received = self.bytes_received - (previous.bytes_received if previous is not None else 0)
+        return TelemetrySample(
+            timestamp=datetime.now().isoformat(),
+            elapsed=elapsed,
+            requests=self.requests,
+            urls=self.urls,
+            failed_urls=self.failed_urls,
+            bytes_received=self.bytes_received,
+            in_flight=self.in_flight,
+            queue_depth=sum(queue.qsize() for queue in self.queues),
+            requests_per_sec=requests / window,
+            urls_per_sec=urls / window,
+            bytes_per_sec=received / window,
+            error_rate=failed / urls if urls else 0.0,
+            loop_lag=max((lag for at, lag in self._lags if at > since), default=0.0)
+        )
+
+    def publish(self, sample: TelemetrySample):
+        """Hand a sample to every writer"""
+        for writer in self.writers:
+            writer.write(sample)
+
+    def close(self):
+        """Close the writers; safe to call more than once"""
+        for writer in self.writers:
+            writer.close()
+
+
+class TelemetryStream(httpx.AsyncByteStream):
+    """Response body stream that counts received bytes and ends the request's in-flight span"""
+
+    def __init__(self, stream: httpx.AsyncByteStream, telemetry: RunTelemetry):
+        self.stream = stream
+        self.telemetry = telemetry
+        self._open = True
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self.stream:
+            self.telemetry.bytes_received += len(chunk)
+            yield chunk
+
+    async def aclose(self):
+        if self._open:
+            self._open = False
+            self.telemetry.in_flight -= 1
+        await self.stream.aclose()
+
+
+class TelemetryTransport(httpx.AsyncBaseTransport):
+    """Transport wrapper counting requests, in-flight requests and bytes received on the wire
+    
+    A request is in flight from the moment it is sent until its response is
+    closed, redirects and HEAD requests included.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, telemetry: RunTelemetry):
+        self.transport = transport
+        self.telemetry = telemetry
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        telemetry = self.telemetry
+        telemetry.requests += 1
+        telemetry.in_flight += 1
+        try:
+            response = await self.transport.handle_async_request(request)
+        except BaseException:
+            telemetry.in_flight -= 1
+            raise
+        if response.is_closed:
+            # In-memory responses (e.g. BuildDirTransport) arrive already read
+            telemetry.bytes_received += len(response.content)
+            telemetry.in_flight -= 1
+        else:
+            response.stream = TelemetryStream(response.stream, telemetry)
+        return response
+
+    async def aclose(self):
+        await self.transport.aclose()
+
+
+class JsonlTelemetryWriter:
+    """Telemetry sink appending one compact 'telemetry' record per sample"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'w', encoding='utf-8', buffering=1)
+
+    def write(self, sample: TelemetrySample):
+        record = {'type': 'telemetry', **sample._asdict()}
+        self._file.write(json.dumps(record, separators=(',', ':')) + '\n')
+
+    def close(self):
+        """Close the file; safe to call more than once"""
+        if not self._file.closed:
+            self._file.close()
+
+
+class PrometheusTextfileWriter:
+    """Telemetry sink rewriting a Prometheus textfile (node_exporter textfile collector)
+    
+    Each sample replaces the file atomically, so a scrape never reads a
+    partial write.
+    """
+    # (metric suffix, sample field, type, help)
+    METRICS = [
+        ('requests_total', 'requests', 'counter', 'HTTP requests sent'),
+        ('urls_total', 'urls', 'counter', 'URLs validated'),
+        ('failed_urls_total', 'failed_urls', 'counter', 'URLs that failed validation'),
+        ('received_bytes_total', 'bytes_received', 'counter', 'Response bytes received'),
+        ('in_flight_requests', 'in_flight', 'gauge', 'HTTP requests currently in flight'),
+        ('queue_depth', 'queue_depth', 'gauge', 'Sitemap entries waiting for a worker'),
+        ('requests_per_second', 'requests_per_sec', 'gauge', 'HTTP requests per second'),
+        ('urls_per_second', 'urls_per_sec', 'gauge', 'URLs validated per second'),
+        ('received_bytes_per_second', 'bytes_per_sec', 'gauge', 'Response bytes received per second'),
+        ('error_ratio', 'error_rate', 'gauge', 'Failed share of the URLs validated in the last window'),
+        ('event_loop_lag_seconds', 'loop_lag', 'gauge', 'Worst event-loop lag in the last window'),
+        ('run_duration_seconds', 'elapsed', 'gauge', 'Seconds since the run started'),
+    ]
+
+    def __init__(self, path: str, base_url: str):
+        self.path = Path(path)
+        escaped = base_url.replace('\\', '\\\\').replace('"', '\\"')
+        self.labels = f'{{base_url="{escaped}"}}'
+
+    def write(self, sample: TelemetrySample):
+        lines = []
+        for suffix, field_name, metric_type, help_text in self.METRICS:
+            name = f'{TELEMETRY_METRIC_PREFIX}_{suffix}'
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} {metric_type}')
+            lines.append(f'{name}{self.labels} {getattr(sample, field_name)}')
+        temp_path = self.path.with_name(self.path.name + '.tmp')
+        temp_path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+        temp_path.replace(self.path)
+
+    def close(self):
+        pass
 
 
 @dataclass
-class SitemapResult:
-    """Result of sitemap validation"""
-    segment: str
-    total_urls: int
-    valid_urls: int
-    failed_urls: int
-    redirect_urls: int
-    url_results: List[URLResult] = field(default_factory=list)
-    errors: List[str] = field(default_factory=list)
+class CheckContext:
+    """What a URLCheck may inspect besides the result: the single request made for the URL"""
+    response: Optional[httpx.Response] = None  # Status and headers; None when served from the cache
+    head: Optional[HeadScanner] = None  # Scanned page <head>, for HTML pages read with a GET
+    alternates: Optional[Tuple[Alternate, ...]] = None  # The sitemap's hreflang alternates
+
+
+class URLCheck(ABC):
+    """A check run on every validated URL over the response already fetched for it
+    
+    Subclasses implement ``check(result, context)`` and record findings on
+    ``result``: ``is_valid``/``error`` for failures, ``warnings`` for the
+    rest. Checks never send requests of their own. ``needs_head`` makes
+    pages be read with a GET and their <head> scanned into ``context.head``
+    by that same request. With --workers, checks are pickled into the
+    worker processes, so they must be importable module-level classes. A
+    check that raises becomes a warning on the result.
+    """
+    name = 'check'
+    needs_head = False
+
+    @abstractmethod
+    def check(self, result: URLResult, context: CheckContext):
+        """Record findings on ``result``"""
+
+
+class StatusCheck(URLCheck):
+    """2xx responses are valid, anything else fails; also records the redirect chain"""
+    name = 'status'
+
+    def check(self, result: URLResult, context: CheckContext):
+        # Track redirect chain - if final URL differs, there was a redirect
+        if result.final_url and result.final_url != result.url and not result.redirect_chain:
+            # Without --trace-redirects we only know there was at least one redirect
+            result.redirect_chain = (result.url, result.final_url)
+        
+        if 200 <= result.status_code < 300:
+            result.is_valid = True
+        else:
+            result.is_valid = False
+            result.error = f"HTTP {result.status_code}"
+
+
+class ContentTypeCheck(URLCheck):
+    """Warn when a successful URL is not served as HTML"""
+    name = 'content-type'
+
+    def check(self, result: URLResult, context: CheckContext):
+        content_type = result.content_type or ''
+        if result.is_valid and not any(html_type in content_type for html_type in HTML_CONTENT_TYPES):
+            result.warnings += (f"Unexpected content type: {result.content_type}",)
+
+
+class RedirectCheck(URLCheck):
+    """Warn when a successful URL is only reached through a redirect"""
+    name = 'redirect'
+
+    def check(self, result: URLResult, context: CheckContext):
+        if result.is_valid and result.final_url != result.url:
+            result.warnings += (f"Redirects to: {result.final_url}",)
+
+
+def default_checks() -> List[URLCheck]:
+    """The built-in check pipeline; extend it with ``[*default_checks(), MyCheck()]``"""
+    return [StatusCheck(), ContentTypeCheck(), RedirectCheck()]
 
 
 @dataclass
-class ValidationReport:
-    """Complete validation report"""
-    base_url: str
-    timestamp: str
-    total_urls: int
-    valid_urls: int
-    failed_urls: int
-    redirect_urls: int
-    sitemap_results: List[SitemapResult] = field(default_factory=list)
-    hreflang_issues: List[str] = field(default_factory=list)
-    redirect_loops: List[str] = field(default_factory=list)
-    execution_time: Optional[float] = None
+class ValidatorOptions:
+    """Settings of a validation run, built from the command line by main_async
+    
+    New settings are added here as fields with a default; the objects a run
+    works with (cache, reports, checkpoint, checks, telemetry, transport)
+    stay SitemapValidator arguments.
+    """
+    verbose: bool = False
+    concurrency: int = DEFAULT_CONCURRENCY
+    stream: bool = False  # Parse sitemaps while they download
+    parallel_segments: bool = False
+    discover: bool = False  # Start at /sitemap.xml and follow (nested) sitemap indexes
+    workers: int = 1  # Processes the URL checks are sharded across
+    request_strategy: str = DEFAULT_REQUEST_STRATEGY
+    trace_redirects: bool = False
+    client_settings: ClientSettings = field(default_factory=ClientSettings)
+    adaptive: bool = False  # Concurrency becomes the ceiling of an adaptive limit
+    latency_target: Optional[float] = None
+    max_retries: int = DEFAULT_MAX_RETRIES
+    retry_backoff: float = DEFAULT_RETRY_BACKOFF
+    check_onpage: bool = False
+    content_hash: bool = False
+    crawl_depth: int = 0  # Link levels followed past the sitemap pages; 0 disables the crawl
+    crawl_limit: int = DEFAULT_CRAWL_LIMIT
+    check_assets: bool = False
+    max_image_bytes: int = DEFAULT_MAX_IMAGE_BYTES
+    resample_rate: float = DEFAULT_RESAMPLE_RATE  # Share of unchanged URLs re-checked with a previous report
+    retain_results: bool = True  # False keeps only failing or warning results (streamed reports)
+    slowest: int = DEFAULT_SLOWEST_URLS
+    budget: PerformanceBudget = field(default_factory=PerformanceBudget)
 
 
 class SitemapValidator:
     """Validates sitemap URLs with i18n support using async/await"""
 
-    def __init__(self, base_url: str, verbose: bool = False, concurrency: int = DEFAULT_CONCURRENCY):
+    def __init__(self, base_url: str, options: Optional[ValidatorOptions] = None,
+                 cache: Optional[ValidationCache] = None, previous_report: Optional[ValidationReport] = None,
+                 baseline: Optional[ValidationReport] = None, checkpoint: Optional[ValidationCheckpoint] = None,
+                 checks: Optional[List[URLCheck]] = None, telemetry: Optional[RunTelemetry] = None,
+                 transport: Optional[httpx.AsyncBaseTransport] = None):
+        options = options or ValidatorOptions()
+        self.options = options
         self.base_url = base_url.rstrip('/')
-        self.verbose = verbose
+        self.verbose = options.verbose
+        self.stream = options.stream
+        self.parallel_segments = options.parallel_segments
+        self.discover = options.discover
         self.console = Console() if HAS_RICH else None
-        self.concurrency = concurrency
-        self.semaphore = asyncio.Semaphore(concurrency)
-        self.url_cache: Dict[str, URLResult] = {}
+        self.concurrency = options.concurrency
+        self.adaptive = options.adaptive
+        if options.adaptive:
+            # --concurrency becomes the ceiling of the adaptive limit
+            self.semaphore = AdaptiveLimiter(options.concurrency, latency_target=options.latency_target)
+        else:
+            self.semaphore = asyncio.Semaphore(options.concurrency)
+        self.max_retries = options.max_retries
+        self.retry_backoff = options.retry_backoff
+        self.check_onpage = options.check_onpage
+        self.content_hash = options.content_hash
+        self.content_changes: Dict[str, List[str]] = {change: [] for change in CONTENT_CHANGES}
+        self._content_counted = SeenUrls()  # A URL listed in several segments is summarized once
+        # Link crawl: 0 disables it, otherwise links are followed this many levels past the sitemap pages
+        self.crawl_depth = options.crawl_depth
+        self.crawl_limit = options.crawl_limit
+        self._crawl_seen = SeenUrls()
+        self._crawl_frontier: Dict[str, Dict] = {}  # Next level, as crawl entries keyed by URL
+        self._crawl_queued = 0
+        self._crawl_dropped = 0
+        self.check_assets = options.check_assets
+        self.max_image_bytes = options.max_image_bytes
+        # One check per asset URL for the whole run, awaited by every page referencing it
+        self._asset_checks: Dict[str, asyncio.Task] = {}
+        self._heaviest: List[Tuple[int, str, Dict]] = []  # Min-heap of pages by asset bytes
+        # Without retention only failing or warning results stay in memory (streamed reports)
+        self.retain_results = options.retain_results
+        self._result_listeners: List[Callable[[str, URLResult], None]] = []
+        self._listener_errors: Counter = Counter()  # Listener/reporter name -> failed calls
+        self._listener_first_errors: Dict[str, str] = {}
+        self.reporters: List[Reporter] = []
+        # Per-URL checks, run in order over each fetched response
+        self.checks = list(checks) if checks is not None else default_checks()
+        self._checks_need_head = any(check.needs_head for check in self.checks)
+        self.report: Optional[ValidationReport] = None  # Set when a run finishes
+        self.telemetry = telemetry
+        self._telemetry_row: Optional[Tuple["Progress", int]] = None  # Live row of the current progress display
+        self._telemetry_status = "Live: starting..."
+        if telemetry is not None:
+            self.subscribe(telemetry.record_result)
+        self.result_counts: Counter = Counter()
+        self.hreflang_graph = HreflangGraph()
+        # Min-heap of the ``slowest`` fetched URLs: (response_time, url, report entry)
+        self.slowest = options.slowest
+        self._slowest: List[Tuple[float, str, Dict]] = []
+        self.baseline = baseline
+        self.budget = options.budget
+        self._ttfb_violations: List[str] = []
+        self.checkpoint = checkpoint
+        if checkpoint is not None:
+            self.subscribe(checkpoint.record)
+        # Results of URLs already validated in this run; only recent ones when results are streamed
+        self.url_cache = ResultMemo(None if options.retain_results else URL_MEMO_SIZE)
+        # With several workers, requests run in that many processes, each owning a hash shard of the URLs
+        self.workers = options.workers
+        self._shards: Optional[List[ProcessPoolExecutor]] = None
+        self._shard_slots: List[asyncio.Semaphore] = []
+        self.cache = cache
+        self.previous_report = previous_report
+        self.resample_rate = options.resample_rate
+        self.request_strategy = options.request_strategy
+        self.trace_redirects = options.trace_redirects
+        self.client_settings = options.client_settings
+        # Custom transport (in-process origins for benchmarks); only used by this process's client
+        self.transport = transport
+        # Redirect responses shared by many URLs (e.g. i18n prefixes), resolved once per run
+        self._redirect_memo: Dict[str, RedirectHop] = {}
+        # Results of the previous run, indexed by URL, for incremental validation
+        self.previous_results: Dict[str, URLResult] = {}
+        if previous_report is not None:
+            for seg_result in previous_report.sitemap_results:
+                for url_result in seg_result.url_results:
+                    self.previous_results[url_result.url] = url_result
         self._client: Optional[httpx.AsyncClient] = None
 
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create async HTTP client"""
         if self._client is None:
             # Configure connection limits and timeouts
-            limits = httpx.Limits(max_keepalive_connections=20, max_connections=100)
-            timeout = httpx.Timeout(TIMEOUT, connect=10.0)
+            settings = self.client_settings
+            transport = self.transport
+            if self.telemetry is not None:
+                # Wraps the same pooled transport httpx would otherwise create
+                transport = TelemetryTransport(
+                    transport or httpx.AsyncHTTPTransport(http2=settings.http2,
+                                                          limits=settings.limits(self.concurrency)),
+                    self.telemetry
+                )
             
             self._client = httpx.AsyncClient(
-                limits=limits,
-                timeout=timeout,
+                http2=settings.http2,
+                limits=settings.limits(self.concurrency),
+                timeout=settings.timeout(),
                 follow_redirects=True,
                 max_redirects=MAX_REDIRECTS,
-                headers={"User-Agent": USER_AGENT}
+                headers={"User-Agent": USER_AGENT},
+                transport=transport
             )
         return self._client
 
@@ -141,6 +2093,51 @@ class SitemapValidator:
             await self._client.aclose()
             self._client = None
 
+    def subscribe(self, listener: Callable[[str, URLResult], None]):
+        """Call ``listener(segment, url_result)`` as soon as each URL result is recorded"""
+        self._result_listeners.append(listener)
+
+    def unsubscribe(self, listener: Callable[[str, URLResult], None]):
+        """Stop calling a listener added with ``subscribe``"""
+        self._result_listeners.remove(listener)
+
+    def add_reporter(self, reporter: Reporter):
+        """Stream every URL result to ``reporter`` and hand it the final report"""
+        self.reporters.append(reporter)
+        self.subscribe(reporter.on_result)
+
+    async def iter_results(self) -> AsyncIterator[URLResult]:
+        """Run the validation and yield each URL result as soon as it is recorded
+        
+        ``async for result in validator.iter_results()`` is the embedding
+        API; results are buffered while the consumer is busy. The complete
+        report is in ``self.report`` once the loop ends, and an error of the
+        run is raised from the loop. Closing the iterator early (e.g. with
+        ``contextlib.aclosing``) cancels the run.
+        """
+        results: asyncio.Queue = asyncio.Queue()
+        finished = object()
+
+        def listener(segment: str, url_result: URLResult):
+            results.put_nowait(url_result)
+        
+        self.subscribe(listener)
+        run = asyncio.create_task(self.validate_all_sitemaps())
+        run.add_done_callback(lambda _: results.put_nowait(finished))
+        try:
+            while True:
+                item = await results.get()
+                if item is finished:
+                    break
+                yield item
+            await run
+        finally:
+            self.unsubscribe(listener)
+            if not run.done():
+                run.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await run
+
     def _log(self, message: str, style: str = ""):
         """Log message with optional Rich formatting"""
         if self.verbose:
@@ -166,314 +2163,1271 @@ class SitemapValidator:
             self._log(f"Error fetching sitemap {url}: {str(e)}", "red")
             return None
 
-    def parse_sitemap_index(self, xml_content: str) -> List[str]:
-        """Parse sitemap index to get sitemap URLs"""
-        try:
-            root = ET.fromstring(xml_content)
-            # Handle namespace
-            namespace = {'ns': 'http://www.sitemaps.org/schemas/sitemap/0.9'}
+    def _parse_sitemap_element(self, sitemap_elem: ET.Element) -> Optional[str]:
+        """Extract the child sitemap location from a <sitemap> element"""
+        loc = sitemap_elem.find('ns:loc', NAMESPACES)
+        if loc is not None and loc.text:
+            return loc.text.strip()
+        return None
+
+    def _parse_url_element(self, url_elem: ET.Element) -> Optional[Dict]:
+        """Extract loc, optional fields and hreflang alternates from a <url> element"""
+        loc = url_elem.find('ns:loc', NAMESPACES)
+        if loc is None or not loc.text:
+            return None
+        
+        url_data = {
+            'loc': loc.text,
+            'lastmod': None,
+            'changefreq': None,
+            'priority': None,
+            'alternates': ()
+        }
+        
+        # Extract optional fields
+        lastmod = url_elem.find('ns:lastmod', NAMESPACES)
+        if lastmod is not None and lastmod.text:
+            url_data['lastmod'] = sys.intern(lastmod.text)
+        
+        changefreq = url_elem.find('ns:changefreq', NAMESPACES)
+        if changefreq is not None and changefreq.text:
+            url_data['changefreq'] = changefreq.text
+        
+        priority = url_elem.find('ns:priority', NAMESPACES)
+        if priority is not None and priority.text:
+            url_data['priority'] = float(priority.text)
+        
+        # Extract hreflang alternates
+        url_data['alternates'] = tuple(
+            Alternate(sys.intern(link.get('hreflang', '')), link.get('href', ''))
+            for link in url_elem.findall('xhtml:link', NAMESPACES)
+            if link.get('rel') == 'alternate'
+        )
+        
+        return url_data
+
+    async def iter_sitemap_entries(self, url: str) -> AsyncIterator[Tuple[str, object]]:
+        """Yield ('sitemap', loc) for sitemap index entries and ('url', url_data) for urlset entries
+        
+        Uses the streaming parser in streaming mode, otherwise downloads and
+        parses the whole document. Raises SitemapFetchError, httpx.HTTPError
+        or ET.ParseError on failure.
+        """
+        if self.stream:
+            async for entry in self._stream_sitemap_entries(url):
+                yield entry
+            return
+        
+        xml_content = await self.fetch_sitemap_xml(url)
+        if xml_content is None:
+            raise SitemapFetchError(f"Failed to fetch sitemap: {url}")
+        
+        root = ET.fromstring(xml_content)
+        if root.tag == SITEMAPINDEX_TAG:
+            for sitemap_elem in root.findall('ns:sitemap', NAMESPACES):
+                loc = self._parse_sitemap_element(sitemap_elem)
+                if loc:
+                    yield 'sitemap', loc
+        else:
+            for url_elem in root.findall('ns:url', NAMESPACES):
+                url_data = self._parse_url_element(url_elem)
+                if url_data is not None:
+                    yield 'url', url_data
+
+    async def _stream_sitemap_entries(self, url: str) -> AsyncIterator[Tuple[str, object]]:
+        """Incrementally parse a sitemap or sitemap index with ET.XMLPullParser"""
+        self._log(f"Streaming sitemap: {url}", "cyan")
+        client = await self._get_client()
+        parser = ET.XMLPullParser(events=('start', 'end'))
+        root = None
+        
+        async with client.stream('GET', url) as response:
+            response.raise_for_status()
             
-            sitemap_locs = []
-            for sitemap in root.findall('ns:sitemap', namespace):
-                loc = sitemap.find('ns:loc', namespace)
-                if loc is not None and loc.text:
-                    sitemap_locs.append(loc.text)
+            content_type = response.headers.get('Content-Type', '')
+            if 'xml' not in content_type:
+                self._log(f"Warning: Unexpected content type: {content_type}", "yellow")
             
-            return sitemap_locs
-        except ET.ParseError as e:
-            self._log(f"Error parsing sitemap index XML: {str(e)}", "red")
-            return []
+            async for chunk in response.aiter_bytes():
+                parser.feed(chunk)
+                for event, elem in parser.read_events():
+                    if event == 'start':
+                        if root is None:
+                            root = elem
+                        continue
+                    
+                    if elem.tag == URL_TAG:
+                        entry = ('url', self._parse_url_element(elem))
+                    elif elem.tag == SITEMAP_TAG:
+                        entry = ('sitemap', self._parse_sitemap_element(elem))
+                    else:
+                        continue
+                    
+                    # Free the parsed element so the tree never grows
+                    elem.clear()
+                    if root is not None and root is not elem:
+                        root.remove(elem)
+                    if entry[1] is not None:
+                        yield entry
+        
+        parser.close()
+
+    async def validate_url(self, url: str, check_hreflang: bool = False,
+                           lastmod: Optional[str] = None,
+                           alternates: Optional[Tuple[Alternate, ...]] = None,
+                           extract_links: bool = False) -> URLResult:
+        """Validate a single URL (async)
+        
+        Sends HEAD first by default and only falls back to GET when needed.
+        ``check_hreflang`` streams the page <head> with a GET and compares its
+        hreflang and canonical links with the sitemap ``alternates``.
+        ``extract_links`` reads the page with a GET and sets its internal
+        links as ``outlinks``. With ``check_assets`` the page's images and
+        preloads are checked too and their sizes summed into ``asset_bytes``.
+        With a persistent cache, fresh successful entries are reused without a
+        request and stale ones are revalidated with a conditional request.
+        Timeouts and overload responses are retried with backoff.
+        """
+        # Check cache first
+        memoized = self.url_cache.get(url)
+        if memoized is not None:
+            return memoized
+        
+        cached = self.cache.get(url) if self.cache else None
+        if check_hreflang or extract_links or self.check_assets or self._checks_need_head:
+            # On-page checks need the body, which the cache does not keep
+            cached = None
+        if cached is not None and self.cache.is_fresh(cached, lastmod):
+            result = URLResult(
+                url=url,
+                status_code=cached.status_code,
+                final_url=cached.final_url,
+                content_type=cached.content_type,
+                content_hash=cached.content_hash,
+                cache_status='hit'
+            )
+            self._run_checks(result, CheckContext(alternates=alternates))
+            self.url_cache[url] = result
+            return result
+        
+        retries = 0
+        while True:
+            result = URLResult(url=url, retries=retries)
+            
+            # Use semaphore (or the adaptive limiter) to limit concurrent requests
+            async with self.semaphore:
+                started_at = time.perf_counter()
+                response, transient = await self._fetch_once(result, cached, lastmod, check_hreflang, alternates,
+                                                             extract_links)
+                if self.adaptive:
+                    self.semaphore.record(time.perf_counter() - started_at, started_at, overloaded=transient)
+            
+            if not transient or retries >= self.max_retries:
+                break
+            
+            # Back off outside the limiter so waiting never holds a request slot
+            delay = self._retry_delay(response, retries)
+            self._log(f"Retrying {url} in {delay:.2f}s ({result.error})", "yellow")
+            await asyncio.sleep(delay)
+            retries += 1
+        
+        if cached is not None:
+            self._classify_content(result, cached.content_hash)
+        if result.assets:
+            await self._check_page_assets(result)
 
-    def parse_sitemap_urls(self, xml_content: str) -> List[Dict]:
-        """Parse sitemap to extract URLs and hreflang links"""
+        # Cache the result
+        self.url_cache[url] = result
+        return result
+
+    async def _fetch_once(self, result: URLResult, cached: Optional[CacheEntry], lastmod: Optional[str],
+                          check_hreflang: bool,
+                          alternates: Optional[Tuple[Alternate, ...]],
+                          extract_links: bool = False) -> Tuple[Optional[httpx.Response], bool]:
+        """Send one request for ``result.url`` and evaluate it
+        
+        Returns the response (None when the request raised) and whether the
+        failure is transient (timeout, transport error or RETRY_STATUSES)
+        and worth retrying.
+        """
+        url = result.url
+        response = None
+        
         try:
-            root = ET.fromstring(xml_content)
-            namespace = {
-                'ns': 'http://www.sitemaps.org/schemas/sitemap/0.9',
-                'xhtml': 'http://www.w3.org/1999/xhtml'
-            }
-            
-            urls = []
-            for url_elem in root.findall('ns:url', namespace):
-                loc = url_elem.find('ns:loc', namespace)
-                if loc is None or not loc.text:
-                    continue
-                
-                url_data = {
-                    'loc': loc.text,
-                    'lastmod': None,
-                    'changefreq': None,
-                    'priority': None,
-                    'alternates': []
-                }
-                
-                # Extract optional fields
-                lastmod = url_elem.find('ns:lastmod', namespace)
-                if lastmod is not None and lastmod.text:
-                    url_data['lastmod'] = lastmod.text
-                
-                changefreq = url_elem.find('ns:changefreq', namespace)
-                if changefreq is not None and changefreq.text:
-                    url_data['changefreq'] = changefreq.text
+            timer = RequestTimer()
+            client = await self._get_client()
+            
+            scanner = HeadScanner() if check_hreflang or self._checks_need_head else None
+            hasher = ContentHasher() if self.content_hash else None
+            links = LinkExtractor() if extract_links or self.check_assets else None
+            body_reader = None
+            body_complete = False
+            if scanner is not None or hasher is not None or links is not None:
+                async def body_reader(body_response: httpx.Response):
+                    nonlocal body_complete
+                    body_complete = await self._read_body(body_response, scanner, hasher, links)
+            
+            headers = cached.conditional_headers() if cached is not None else {}
+            if self.trace_redirects:
+                response = await self._send_tracing_redirects(client, result, headers, body_reader, timer)
+            else:
+                # httpx automatically follows redirects
+                response = await self._send(client, url, headers, body_reader, timer=timer)
+            
+            timer.finish(result)
+            result.method = response.request.method
+            
+            if response.status_code == 304 and cached is not None:
+                # Unchanged since the cached check, which stays authoritative
+                result.status_code = cached.status_code
+                result.final_url = cached.final_url
+                result.content_type = cached.content_type
+                result.content_hash = cached.content_hash
+                result.cache_status = 'revalidated'
+                etag = cached.etag
+                last_modified = cached.last_modified
+            else:
+                result.status_code = response.status_code
+                result.final_url = str(response.url)
+                result.content_type = sys.intern(response.headers.get('Content-Type', ''))
+                result.content_length, result.size_source = response_size(response, body_complete)
+                if hasher is not None:
+                    result.content_hash = hasher.digest
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
+            
+            # Images, PDFs and feeds have no <head>: nothing to scan or compare
+            is_html = (result.content_type or '').startswith(HTML_CONTENT_TYPES)
+            head = scanner if is_html else None
+            self._run_checks(result, CheckContext(response=response, head=head, alternates=alternates))
+            if check_hreflang and is_html and result.is_valid:
+                self._compare_onpage_links(result, scanner, alternates)
+            if links is not None and result.is_valid:
+                if extract_links:
+                    result.outlinks = links.internal_links(result.final_url or url, self.base_url)
+                if self.check_assets:
+                    result.assets = links.asset_urls(result.final_url or url)
+            
+            transient = result.status_code in RETRY_STATUSES
+            if self.cache is not None and not transient:
+                # Overload responses are retried, and never replace the last real answer
+                self.cache.put(CacheEntry(
+                    url=url,
+                    status_code=result.status_code,
+                    final_url=result.final_url,
+                    content_type=result.content_type,
+                    etag=etag,
+                    last_modified=last_modified,
+                    lastmod=lastmod,
+                    checked_at=time.time(),
+                    content_hash=result.content_hash
+                ))
+            
+            return response, transient
                 
-                priority = url_elem.find('ns:priority', namespace)
-                if priority is not None and priority.text:
-                    url_data['priority'] = float(priority.text)
+        except httpx.TimeoutException:
+            result.error = "Request timeout"
+            result.is_valid = False
+            return response, True
+        except RedirectTraceError as e:
+            result.error = str(e)
+            result.redirect_loop = e.loop
+            result.is_valid = False
+        except httpx.TooManyRedirects:
+            result.error = "Too many redirects (possible redirect loop)"
+            result.is_valid = False
+            result.redirect_chain = (url,)  # At least we know it started here
+        except httpx.TransportError as e:
+            result.error = str(e) or type(e).__name__
+            result.is_valid = False
+            return response, True
+        except httpx.HTTPError as e:
+            result.error = str(e)
+            result.is_valid = False
+        
+        return response, False
+
+    def _retry_delay(self, response: Optional[httpx.Response], retries: int) -> float:
+        """Exponential backoff with full jitter, overridden by a Retry-After header"""
+        if response is not None:
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            if retry_after is not None:
+                return min(retry_after, MAX_RETRY_AFTER)
+        return random.uniform(0, min(self.retry_backoff * (2 ** retries), MAX_BACKOFF))
+
+    async def _send_tracing_redirects(self, client: httpx.AsyncClient, result: URLResult,
+                                      headers: Dict[str, str],
+                                      body_reader: Optional[Callable[[httpx.Response], Awaitable[None]]],
+                                      timer: Optional[RequestTimer] = None) -> httpx.Response:
+        """Follow redirects one hop at a time, recording each hop on ``result``
+        
+        Cycles are detected with a visited set and, like httpx, at most
+        MAX_REDIRECTS hops are followed. Redirect responses are memoized per URL, so hops
+        shared by many URLs are requested only once per run.
+        """
+        current = result.url
+        visited = {current}
+        result.redirect_chain = (current,)
+        
+        while True:
+            hop = self._redirect_memo.get(current)
+            if hop is not None:
+                hop = replace(hop, memoized=True)
+            else:
+                hop_start = time.perf_counter()
+                response = await self._send(client, current, headers, body_reader, follow_redirects=False,
+                                            timer=timer)
+                if not response.is_redirect:
+                    if len(result.redirect_chain) == 1:
+                        result.redirect_chain = ()
+                    return response
                 
-                # Extract hreflang alternates
-                for link in url_elem.findall('xhtml:link', namespace):
-                    if link.get('rel') == 'alternate':
-                        url_data['alternates'].append({
-                            'hreflang': link.get('hreflang', ''),
-                            'href': link.get('href', '')
-                        })
+                hop = RedirectHop(
+                    url=current,
+                    status_code=response.status_code,
+                    location=urljoin(current, response.headers['Location']),
+                    elapsed=time.perf_counter() - hop_start
+                )
+                self._redirect_memo[current] = hop
+            
+            result.redirect_hops += (hop,)
+            result.redirect_chain += (hop.location,)
+            
+            if hop.location in visited:
+                raise RedirectTraceError(f"{REDIRECT_LOOP_ERROR}: {' -> '.join(result.redirect_chain)}", loop=True)
+            if len(result.redirect_hops) > MAX_REDIRECTS:
+                raise RedirectTraceError(f"Too many redirects (more than {MAX_REDIRECTS} hops)")
+            
+            visited.add(hop.location)
+            current = hop.location
+
+    async def _send(self, client: httpx.AsyncClient, url: str, headers: Dict[str, str],
+                    body_reader: Optional[Callable[[httpx.Response], Awaitable[None]]] = None,
+                    follow_redirects: bool = True, timer: Optional[RequestTimer] = None) -> httpx.Response:
+        """Send the cheapest request that can answer the enabled checks
+        
+        Body-level checks get a streamed GET whose body is handed to
+        ``body_reader``, which reads only as much as it needs. Otherwise HEAD
+        is tried first (unless the strategy is 'get') and a GET follows on
+        405/501 or when the HEAD content type does not look like HTML.
+        Header-only GETs are closed before the body is read.
+        """
+        extensions = timer.extensions if timer is not None else None
+        if body_reader is not None:
+            async with client.stream('GET', url, headers=headers, follow_redirects=follow_redirects,
+                                     extensions=extensions) as response:
+                if timer is not None:
+                    timer.headers_received()
+                if not response.is_redirect:
+                    await body_reader(response)
+                return response
+        
+        if self.request_strategy == 'head-first':
+            response = await client.head(url, headers=headers, follow_redirects=follow_redirects,
+                                         extensions=extensions)
+            if timer is not None:
+                timer.headers_received()
+            if not self._needs_get_fallback(response):
+                return response
+            self._log(f"HEAD {url} returned {response.status_code} "
+                      f"({response.headers.get('Content-Type', 'no content type')}), retrying with GET", "dim")
+        
+        async with client.stream('GET', url, headers=headers, follow_redirects=follow_redirects,
+                                 extensions=extensions) as response:
+            if timer is not None:
+                timer.headers_received()
+            # Leaving the block closes the response without downloading the body
+            return response
+
+    async def _read_body(self, response: httpx.Response, scanner: Optional[HeadScanner],
+                         hasher: Optional[ContentHasher], links: Optional[LinkExtractor] = None) -> bool:
+        """Stream the body once into ``scanner``, ``hasher`` and/or ``links``; True if read to the end
+        
+        Each consumer stops as soon as it has what it needs: the scanner at
+        </head>, the link extractor after MAX_CRAWL_BYTES (or at once for
+        non-HTML bodies). The hasher needs the whole body and sets its digest
+        only when the body was read to the end.
+        """
+        if not (200 <= response.status_code < 300):
+            return False
+        if not response.headers.get('Content-Type', '').startswith(HTML_CONTENT_TYPES):
+            # Only HTML has a <head> to scan and links to follow
+            scanner = links = None
+        
+        decoder = None
+        if scanner is not None or links is not None:
+            try:
+                decoder = codecs.getincrementaldecoder(response.charset_encoding or 'utf-8')(errors='replace')
+            except LookupError:
+                decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        
+        received = 0
+        async for chunk in response.aiter_bytes():
+            if hasher is not None:
+                hasher.update(chunk)
+            received += len(chunk)
+            if scanner is not None or links is not None:
+                text = decoder.decode(chunk)
+                if scanner is not None:
+                    scanner.feed(text)
+                    if scanner.done or received >= MAX_HEAD_BYTES:
+                        scanner = None
+                if links is not None:
+                    links.feed(text)
+                    if received >= MAX_CRAWL_BYTES:
+                        links = None
+            if hasher is None and scanner is None and links is None:
+                # The rest of the body is never downloaded
+                return False
+        
+        if hasher is not None:
+            hasher.finish()
+        return True
+
+    def _classify_content(self, result: URLResult, previous_hash: Optional[str]):
+        """Mark a freshly fetched page as changed, unchanged or new against its previous hash"""
+        if result.content_hash is None or result.content_change is not None:
+            return
+        if result.cache_status in ('hit', 'report'):
+            return
+        if previous_hash is None:
+            result.content_change = 'new'
+        elif previous_hash == result.content_hash:
+            result.content_change = 'unchanged'
+        else:
+            result.content_change = 'changed'
+
+    async def _check_page_assets(self, result: URLResult):
+        """Check a page's assets, sum their known sizes and warn about broken or oversized ones"""
+        assets, result.assets = result.assets, ()
+        asset_results = await asyncio.gather(*(self._asset_check(url) for url in assets))
+        
+        result.asset_bytes = sum(asset.content_length or 0 for asset in asset_results)
+        for asset in asset_results:
+            if asset.error is not None:
+                result.warnings += (f"Broken asset {asset.url}: {asset.error}",)
+            elif (asset.content_type or '').startswith('image/') and (asset.content_length or 0) > self.max_image_bytes:
+                result.warnings += (
+                    f"Oversized image {asset.url}: {format_bytes(asset.content_length)} "
+                    f"(limit {format_bytes(self.max_image_bytes)})",
+                )
+
+    def _asset_check(self, url: str) -> "asyncio.Task[AssetResult]":
+        """The run-wide check of an asset URL, started on first use"""
+        task = self._asset_checks.get(url)
+        if task is None:
+            task = asyncio.ensure_future(self._check_asset(url))
+            self._asset_checks[url] = task
+        return task
+
+    async def _check_asset(self, url: str) -> AssetResult:
+        """HEAD an asset (GET headers when HEAD is not allowed) for its status, type and size"""
+        result = AssetResult(url=url)
+        try:
+            client = await self._get_client()
+            async with self.semaphore:
+                response = await client.head(url)
+                if response.status_code in HEAD_FALLBACK_STATUSES:
+                    async with client.stream('GET', url) as response:
+                        # Leaving the block closes the response without downloading the body
+                        pass
+        except httpx.HTTPError as e:
+            result.error = str(e) or type(e).__name__
+            return result
+        
+        result.status_code = response.status_code
+        result.content_type = sys.intern(response.headers.get('Content-Type', ''))
+        if response.headers.get('Content-Length', '').isdigit():
+            result.content_length = int(response.headers['Content-Length'])
+        if not (200 <= response.status_code < 300):
+            result.error = f"HTTP {response.status_code}"
+        return result
+
+    def _compare_onpage_links(self, result: URLResult, scanner: HeadScanner,
+                              alternates: Optional[Tuple[Alternate, ...]]):
+        """Warn where the rendered hreflang/canonical links disagree with the sitemap"""
+        page_url = result.final_url or result.url
+        onpage = {hreflang: urljoin(page_url, href) for hreflang, href in scanner.alternates.items()}
+        declared = {alt.hreflang: alt.href for alt in alternates or () if alt.hreflang}
+        
+        for hreflang in sorted(set(onpage) | set(declared)):
+            page_href = onpage.get(hreflang)
+            sitemap_href = declared.get(hreflang)
+            if page_href == sitemap_href:
+                continue
+            if page_href is None:
+                result.warnings += (f"On-page hreflang [{hreflang}] missing (sitemap: {sitemap_href})",)
+            elif sitemap_href is None:
+                result.warnings += (f"On-page hreflang [{hreflang}] {page_href} is not in the sitemap",)
+            else:
+                result.warnings += (
+                    f"On-page hreflang [{hreflang}] {page_href} differs from sitemap {sitemap_href}",
+                )
+        
+        if scanner.canonical is None:
+            result.warnings += ("No canonical link on page",)
+        else:
+            canonical = urljoin(page_url, scanner.canonical)
+            if canonical not in (result.url, result.final_url):
+                result.warnings += (f"Canonical points to {canonical}",)
+
+    def _needs_get_fallback(self, response: httpx.Response) -> bool:
+        """Whether a HEAD response cannot be trusted on its own"""
+        if response.status_code in HEAD_FALLBACK_STATUSES:
+            return True
+        if 200 <= response.status_code < 300:
+            content_type = response.headers.get('Content-Type', '')
+            return not any(html_type in content_type for html_type in HTML_CONTENT_TYPES)
+        return False
+
+    def _run_checks(self, result: URLResult, context: CheckContext):
+        """Run the check pipeline; a failing check becomes a warning instead of aborting the URL"""
+        for check in self.checks:
+            try:
+                check.check(result, context)
+            except Exception as e:
+                result.warnings += (f"Check {check.name} failed: {type(e).__name__}: {e}",)
+
+    def _create_progress(self) -> Optional["Progress"]:
+        """Create a Rich progress display, or None for plain output"""
+        if not (HAS_RICH and self.console):
+            return None
+        
+        from rich.progress import BarColumn, TaskProgressColumn
+        
+        progress = Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TaskProgressColumn(),
+            console=self.console
+        )
+        if self.telemetry is not None and self.telemetry.live:
+            # Later displays (one per segment) start from the last sample shown
+            self._telemetry_row = (progress, progress.add_task(self._telemetry_status, total=None))
+        return progress
+
+    async def _run_telemetry(self):
+        """Probe event-loop lag and publish telemetry samples until cancelled
+        
+        The live progress row refreshes every TELEMETRY_REFRESH seconds, the
+        writers (and plain-output lines) every ``telemetry.interval``; a last
+        sample is published when the run ends.
+        """
+        telemetry = self.telemetry
+        loop = asyncio.get_running_loop()
+        # Last sample shown and written; None until then, so the first window starts with the run
+        displayed: Optional[TelemetrySample] = None
+        written: Optional[TelemetrySample] = None
+
+        def due(previous: Optional[TelemetrySample], period: float) -> bool:
+            return telemetry.elapsed() - (previous.elapsed if previous is not None else 0.0) >= period
+        
+        try:
+            while True:
+                expected = loop.time() + LOOP_LAG_PROBE
+                await asyncio.sleep(LOOP_LAG_PROBE)
+                telemetry.record_lag(max(0.0, loop.time() - expected))
                 
-                urls.append(url_data)
+                if self._telemetry_row is not None and due(displayed, TELEMETRY_REFRESH):
+                    displayed = telemetry.sample(displayed)
+                    self._telemetry_status = f"Live: {format_telemetry(displayed)}"
+                    progress, task = self._telemetry_row
+                    progress.update(task, description=self._telemetry_status)
+                if due(written, telemetry.interval):
+                    written = telemetry.sample(written)
+                    self._publish_telemetry(written)
+        finally:
+            self._publish_telemetry(telemetry.sample(written))
+
+    def _publish_telemetry(self, sample: TelemetrySample):
+        """Hand a sample to the telemetry writers, and print it when there is no live display"""
+        self.telemetry.publish(sample)
+        if self.telemetry.live and not (HAS_RICH and self.console):
+            print(f"[telemetry] {format_telemetry(sample)}")
+
+    def _segment_sink(self, queue: asyncio.Queue, result: SitemapResult, progress: Optional["Progress"],
+                      label: Optional[str] = None) -> Callable[[Dict], Awaitable[None]]:
+        """Return a coroutine function that queues a sitemap entry for ``result``"""
+        label = label or result.segment
+        queued = 0
+        if progress is not None:
+            task = progress.add_task(f"{label}: Checking URLs...", total=None)
             
-            return urls
-        except ET.ParseError as e:
-            self._log(f"Error parsing sitemap XML: {str(e)}", "red")
-            return []
+            def on_result():
+                progress.update(task, advance=1)
+        else:
+            task = None
+            
+            def on_result():
+                pass
+        
+        async def enqueue(url_data: Dict):
+            nonlocal queued
+            if self.checkpoint is not None:
+                self.checkpoint.queued(url_data['loc'])
+            await queue.put((url_data, result, on_result))
+            result.total_urls += 1
+            queued += 1
+            if progress is not None:
+                progress.update(task, total=queued, description=f"{label}: Checking {queued} URLs...")
+        
+        return enqueue
 
-    async def validate_url(self, url: str, check_hreflang: bool = False) -> URLResult:
-        """Validate a single URL (async)"""
-        # Check cache first
-        if url in self.url_cache:
-            return self.url_cache[url]
+    async def _run_worker_pool(self, produce: Callable[[asyncio.Queue], Awaitable[None]]):
+        """Run ``produce`` against a bounded queue drained by a fixed pool of workers
         
-        # Use semaphore to limit concurrent requests
-        async with self.semaphore:
-            result = URLResult(url=url)
+        Task and memory overhead stay O(concurrency) no matter how many URLs
+        are produced, and a full queue pauses the producer. A worker that
+        fails cancels the producer and the error is raised here, rather than
+        leaving the producer blocked on a queue nobody drains.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.concurrency * QUEUE_SIZE_PER_WORKER)
+        if self.telemetry is not None:
+            self.telemetry.queues.append(queue)
+        if self.workers > 1:
+            workers = [asyncio.create_task(self._shard_dispatcher(queue))]
+        else:
+            workers = [asyncio.create_task(self._url_worker(queue)) for _ in range(self.concurrency)]
+
+        async def feed():
+            await produce(queue)
+            # One sentinel per worker, then the workers drain the queue
+            for _ in workers:
+                await queue.put(None)
+        
+        feeder = asyncio.create_task(feed())
+        try:
+            await asyncio.gather(feeder, *workers)
+        finally:
+            for task in (feeder, *workers):
+                task.cancel()
+            if self.telemetry is not None:
+                self.telemetry.queues.remove(queue)
+
+    async def validate_sitemap_segment(self, segment: str, progress: Optional["Progress"] = None) -> SitemapResult:
+        """Validate a single sitemap segment (async)
+        
+        Pass a shared, already running ``progress`` display when several
+        segments are validated at the same time.
+        """
+        sitemap_url = f"{self.base_url}/sitemap-{segment}.xml"
+        
+        if HAS_RICH and self.console:
+            self.console.print(f"\n[bold cyan]Validating {segment.upper()} sitemap[/bold cyan]")
+        else:
+            print(f"\nValidating {segment.upper()} sitemap")
+        
+        result = SitemapResult(segment=segment, total_urls=0, valid_urls=0, failed_urls=0, redirect_urls=0)
+        
+        owns_progress = progress is None
+        if owns_progress:
+            progress = self._create_progress()
+        if progress is None:
+            print(f"Checking URLs (concurrency: {self.concurrency})...")
+        
+        async def produce(queue: asyncio.Queue):
+            enqueue = self._segment_sink(queue, result, progress)
+            await self._produce_sitemap_urls(sitemap_url, result, enqueue)
+        
+        display = progress if owns_progress and progress is not None else contextlib.nullcontext()
+        with display:
+            await self._run_worker_pool(produce)
+        
+        if result.total_urls == 0 and not result.errors:
+            result.errors.append("No URLs found in sitemap")
+        
+        return result
+
+    async def validate_discovered_sitemaps(self, progress: Optional["Progress"] = None) -> List[SitemapResult]:
+        """Validate every URL reachable from the sitemap index (async)
+        
+        Starts at /sitemap.xml and follows nested sitemap indexes. Child
+        sitemaps are fetched concurrently and all of them feed one shared,
+        deduplicated validation pipeline. Paginated sitemaps such as
+        sitemap-works-2.xml are reported under their base segment name.
+        """
+        index_url = f"{self.base_url}{SITEMAP_INDEX_PATH}"
+        
+        if HAS_RICH and self.console:
+            self.console.print(f"\n[bold cyan]Discovering sitemaps from {index_url}[/bold cyan]")
+        else:
+            print(f"\nDiscovering sitemaps from {index_url}")
+            print(f"Checking URLs (concurrency: {self.concurrency})...")
+        
+        segments: Dict[str, SitemapResult] = {}
+        sinks: Dict[str, Callable[[Dict], Awaitable[None]]] = {}
+        seen_urls: Set[str] = set()
+        visited_sitemaps: Set[str] = set()
+        sitemap_slots = asyncio.Semaphore(SITEMAP_FETCH_CONCURRENCY)
+        
+        def segment_for(sitemap_url: str) -> SitemapResult:
+            name = sitemap_segment_name(sitemap_url)
+            if name not in segments:
+                segments[name] = SitemapResult(segment=name, total_urls=0, valid_urls=0,
+                                               failed_urls=0, redirect_urls=0)
+            return segments[name]
+        
+        async def produce(queue: asyncio.Queue):
+            async def enqueue_unique(sitemap_url: str, url_data: Dict):
+                if url_data['loc'] in seen_urls:
+                    self._log(f"Skipping duplicate URL {url_data['loc']} in {sitemap_url}", "dim")
+                    return
+                seen_urls.add(url_data['loc'])
+                
+                result = segment_for(sitemap_url)
+                if result.segment not in sinks:
+                    sinks[result.segment] = self._segment_sink(queue, result, progress)
+                await sinks[result.segment](url_data)
             
-            try:
-                start_time = time.time()
-                client = await self._get_client()
+            async def visit(sitemap_url: str, depth: int):
+                if sitemap_url in visited_sitemaps:
+                    self._log(f"Skipping already visited sitemap {sitemap_url}", "dim")
+                    return
+                visited_sitemaps.add(sitemap_url)
                 
-                # Use GET to also validate content rendering
-                # httpx automatically follows redirects
-                response = await client.get(url)
+                children: List[str] = []
+                url_count = 0
+                try:
+                    async with sitemap_slots:
+                        async for kind, entry in self.iter_sitemap_entries(sitemap_url):
+                            if kind == 'sitemap':
+                                children.append(entry)
+                            else:
+                                url_count += 1
+                                await enqueue_unique(sitemap_url, entry)
+                except (httpx.HTTPError, SitemapFetchError) as e:
+                    self._log(f"Error fetching sitemap {sitemap_url}: {str(e)}", "red")
+                    segment_for(sitemap_url).errors.append(f"Failed to fetch sitemap: {sitemap_url}")
+                except ET.ParseError as e:
+                    self._log(f"Error parsing sitemap XML: {str(e)}", "red")
+                    segment_for(sitemap_url).errors.append(f"Error parsing sitemap XML {sitemap_url}: {str(e)}")
+                else:
+                    if not children and not url_count:
+                        segment_for(sitemap_url).errors.append(f"No URLs found in sitemap: {sitemap_url}")
                 
-                result.response_time = time.time() - start_time
-                result.status_code = response.status_code
-                result.final_url = str(response.url)
-                result.content_type = response.headers.get('Content-Type', '')
+                if not children:
+                    return
+                if depth >= MAX_SITEMAP_DEPTH:
+                    segment_for(sitemap_url).errors.append(
+                        f"Sitemap index nesting deeper than {MAX_SITEMAP_DEPTH} levels: {sitemap_url}"
+                    )
+                    return
+                
+                self._log(f"Found {len(children)} child sitemaps in {sitemap_url}", "cyan")
+                await asyncio.gather(*(visit(child, depth + 1) for child in children))
+            
+            await visit(index_url, 0)
+        
+        await self._run_worker_pool(produce)
+        
+        return list(segments.values())
+
+    async def validate_crawl(self) -> SitemapResult:
+        """Validate the internal links found on the validated pages, level by level (async)
+        
+        Links on sitemap pages form depth 1. Each level runs through the
+        worker pool once the previous one is fully recorded, so every URL is
+        validated exactly once however many pages link to it, up to
+        ``crawl_depth`` levels and ``crawl_limit`` URLs.
+        """
+        if HAS_RICH and self.console:
+            self.console.print(f"\n[bold cyan]Crawling internal links (depth {self.crawl_depth})[/bold cyan]")
+        else:
+            print(f"\nCrawling internal links (depth {self.crawl_depth})")
+        
+        result = SitemapResult(segment=CRAWL_SEGMENT, total_urls=0, valid_urls=0, failed_urls=0, redirect_urls=0)
+        progress = self._create_progress()
+        
+        depth = 1
+        with progress if progress is not None else contextlib.nullcontext():
+            while self._crawl_frontier:
+                level, self._crawl_frontier = self._crawl_frontier, {}
+                for url in level:
+                    self._crawl_seen.add(url)
+                self._crawl_queued += len(level)
+                if progress is None:
+                    print(f"Depth {depth}: checking {len(level)} new URLs...")
                 
-                # Track redirect chain - if final URL differs, there was a redirect
-                if result.final_url != url:
-                    # Simple redirect detection - we know there was at least one redirect
-                    result.redirect_chain = [url, result.final_url]
+                async def produce(queue: asyncio.Queue):
+                    enqueue = self._segment_sink(queue, result, progress, label=f"{CRAWL_SEGMENT} depth {depth}")
+                    for url_data in level.values():
+                        await enqueue(url_data)
                 
-                # Check for success
-                if 200 <= response.status_code < 300:
-                    result.is_valid = True
-                    
-                    # Validate content type for HTML pages
-                    if 'text/html' not in result.content_type and 'application/xhtml' not in result.content_type:
-                        result.warnings.append(f"Unexpected content type: {result.content_type}")
-                    
-                    # Check if URL changed (redirect)
-                    if result.final_url != url:
-                        result.warnings.append(f"Redirects to: {result.final_url}")
-                    
-                    # Check for excessive redirects (we can't detect exact count easily with httpx)
-                    # but if the chain is long, it's already handled by httpx's max_redirects
-                    
-                else:
-                    result.is_valid = False
-                    result.error = f"HTTP {response.status_code}"
-                    
-            except httpx.TimeoutException:
-                result.error = "Request timeout"
-                result.is_valid = False
-            except httpx.TooManyRedirects:
-                result.error = "Too many redirects (possible redirect loop)"
-                result.is_valid = False
-                result.redirect_chain = [url]  # At least we know it started here
-            except httpx.HTTPError as e:
-                result.error = str(e)
-                result.is_valid = False
-            
-            # Cache the result
-            self.url_cache[url] = result
-            return result
+                await self._run_worker_pool(produce)
+                depth += 1
+        
+        if self._crawl_dropped:
+            result.errors.append(
+                f"Crawl limit of {self.crawl_limit} URLs reached, {self._crawl_dropped} linked URLs not checked"
+            )
+        return result
+
+    def _extracts_links(self, url_data: Dict) -> bool:
+        """Whether a page's links are followed: sitemap pages and crawled pages above the depth limit"""
+        return self.crawl_depth > 0 and url_data.get('depth', 0) < self.crawl_depth
+
+    def _queue_crawl_links(self, url_data: Dict, url_result: URLResult):
+        """Add a page's not yet seen internal links to the next crawl level"""
+        depth = url_data.get('depth', 0) + 1
+        for link in url_result.outlinks:
+            if link in self._crawl_frontier or link in self._crawl_seen:
+                continue
+            if self._crawl_queued + len(self._crawl_frontier) >= self.crawl_limit:
+                # Seen once so each dropped URL is counted once
+                self._crawl_seen.add(link)
+                self._crawl_dropped += 1
+                continue
+            self._crawl_frontier[link] = {'loc': link, 'depth': depth, 'found_on': url_result.url}
+        url_result.outlinks = ()
 
-    def validate_hreflang_links(self, url_data: Dict, url_results: Dict[str, URLResult]) -> List[str]:
-        """Validate hreflang alternate links"""
-        issues = []
-        url = url_data['loc']
-        alternates = url_data.get('alternates', [])
+    async def _produce_sitemap_urls(self, sitemap_url: str, result: SitemapResult,
+                                    enqueue: Callable[[Dict], Awaitable[None]]):
+        """Feed the URL entries of one sitemap into the validation queue"""
+        try:
+            # URLs already emitted are still validated after a partial failure
+            async for kind, entry in self.iter_sitemap_entries(sitemap_url):
+                if kind == 'url':
+                    await enqueue(entry)
+        except (httpx.HTTPError, SitemapFetchError) as e:
+            self._log(f"Error fetching sitemap {sitemap_url}: {str(e)}", "red")
+            result.errors.append(f"Failed to fetch sitemap: {sitemap_url}")
+        except ET.ParseError as e:
+            self._log(f"Error parsing sitemap XML: {str(e)}", "red")
+            result.errors.append(f"Error parsing sitemap XML: {str(e)}")
+
+    async def _url_worker(self, queue: asyncio.Queue):
+        """Validate queued URLs until a None sentinel arrives, aggregating as results land"""
+        while True:
+            item = await queue.get()
+            try:
+                if item is None:
+                    return
+                url_data, result, on_result = item
+                try:
+                    url_result = await self._validate_entry(url_data)
+                except Exception as e:
+                    url_result = e
+                self._record_url_result(result, url_data, url_result)
+                on_result()
+            finally:
+                queue.task_done()
+
+    async def _shard_dispatcher(self, queue: asyncio.Queue):
+        """Route queued entries to the worker processes until a None sentinel arrives
         
-        if not alternates:
-            return issues
+        Entries are batched per hash shard, so a URL always lands in the same
+        process (and its URL and redirect caches). Each shard has at most
+        SHARD_BATCHES_IN_FLIGHT batches outstanding, which pushes back on the
+        queue. Results are recorded here, so the hreflang graph, counters and
+        listeners see the merged, site-wide URL set.
+        """
+        executors = self._shard_executors()
+        loop = asyncio.get_running_loop()
+        batches: List[List[Tuple]] = [[] for _ in executors]
+        in_flight: Set[asyncio.Task] = set()
+        failures: List[BaseException] = []  # Errors recording a batch, raised from the dispatch loop
+
+        def batch_done(task: asyncio.Task):
+            in_flight.discard(task)
+            if not task.cancelled() and task.exception() is not None:
+                failures.append(task.exception())
         
-        # Check that alternates exist and are valid
-        hreflang_urls = {alt['hreflang']: alt['href'] for alt in alternates}
+        async def run_batch(shard: int, items: List[Tuple]):
+            try:
+                url_results = await loop.run_in_executor(
+                    executors[shard], _validate_shard_batch, [url_data for url_data, _, _ in items]
+                )
+            except Exception as e:
+                url_results = [e] * len(items)
+            finally:
+                self._shard_slots[shard].release()
+            
+            for (url_data, result, on_result), url_result in zip(items, url_results):
+                self._record_url_result(result, url_data, url_result)
+                on_result()
         
-        # Should have alternates for both locales plus x-default
-        expected_hreflangs = set(LOCALES + ['x-default'])
-        actual_hreflangs = set(hreflang_urls.keys())
+        async def submit(shard: int):
+            items, batches[shard] = batches[shard], []
+            await self._shard_slots[shard].acquire()
+            task = asyncio.create_task(run_batch(shard, items))
+            in_flight.add(task)
+            task.add_done_callback(batch_done)
         
-        if not actual_hreflangs:
-            issues.append(f"{url}: No hreflang alternates found")
-            return issues
+        while True:
+            item = await queue.get()
+            try:
+                if failures:
+                    raise failures[0]
+                if item is None:
+                    break
+                url_data, result, on_result = item
+                reused = self._reused_result(url_data)
+                if reused is not None:
+                    self._record_url_result(result, url_data, reused)
+                    on_result()
+                    continue
+                
+                shard = shard_for(url_data['loc'], len(executors))
+                batches[shard].append(item)
+                if len(batches[shard]) >= SHARD_BATCH_SIZE:
+                    await submit(shard)
+            finally:
+                queue.task_done()
         
-        missing = expected_hreflangs - actual_hreflangs
-        if missing:
-            issues.append(f"{url}: Missing hreflang tags: {', '.join(missing)}")
+        for shard, items in enumerate(batches):
+            if items:
+                await submit(shard)
+        await asyncio.gather(*list(in_flight))
+        if failures:
+            raise failures[0]
+
+    def _shard_executors(self) -> List[ProcessPoolExecutor]:
+        """Start one single-process pool per shard, shared by all segments of the run"""
+        if self._shards is None:
+            # Spawned (not forked) so no event loop, client or sockets leak into the workers
+            context = multiprocessing.get_context('spawn')
+            options = self._shard_worker_options()
+            self._shards = [
+                ProcessPoolExecutor(max_workers=1, mp_context=context,
+                                    initializer=_init_shard_worker, initargs=(options,))
+                for _ in range(self.workers)
+            ]
+            self._shard_slots = [asyncio.Semaphore(SHARD_BATCHES_IN_FLIGHT) for _ in self._shards]
+        return self._shards
+
+    def _shard_worker_options(self) -> Dict:
+        """SitemapValidator arguments for the worker processes; --concurrency is split between them"""
+        return {
+            'base_url': self.base_url,
+            'options': replace(
+                self.options,
+                concurrency=max(1, self.concurrency // self.workers),
+                latency_target=self.semaphore.latency_target if self.adaptive else None,
+                workers=1
+            ),
+            'checks': self.checks,
+            'cache_dir': str(self.cache.path.parent) if self.cache is not None else None,
+            'cache_ttl': self.cache.ttl if self.cache is not None else DEFAULT_CACHE_TTL
+        }
+
+    async def _close_shards(self):
+        """Let every worker process close its client and cache, then stop the pools"""
+        if self._shards is None:
+            return
+        loop = asyncio.get_running_loop()
+        for executor in self._shards:
+            try:
+                await loop.run_in_executor(executor, _close_shard_worker)
+            except Exception as e:
+                self._log(f"Error closing worker process: {str(e)}", "red")
+        # shutdown() joins the processes, so it runs off the event loop
+        await asyncio.gather(*(
+            asyncio.to_thread(executor.shutdown, cancel_futures=True) for executor in self._shards
+        ))
+        self._shards = None
+
+    async def validate_batch(self, entries: List[Dict]) -> List[URLResult]:
+        """Validate sitemap entries concurrently (the unit of work of a --workers process)"""
+        async def validate(url_data: Dict) -> URLResult:
+            try:
+                return await self._validate_entry(url_data)
+            except Exception as e:
+                return URLResult(url=url_data['loc'], error=str(e), is_valid=False)
         
-        # Validate that alternate URLs are accessible
-        for hreflang, href in hreflang_urls.items():
-            if href in url_results:
-                alt_result = url_results[href]
-                if not alt_result.is_valid:
-                    issues.append(f"{url}: Alternate [{hreflang}] {href} is not accessible: {alt_result.error}")
+        return await asyncio.gather(*(validate(url_data) for url_data in entries))
+
+    async def _validate_entry(self, url_data: Dict) -> URLResult:
+        """Validate a sitemap entry, reusing checkpointed or previous-run results where allowed"""
+        reused = self._reused_result(url_data)
+        if reused is not None:
+            return reused
+        return await self.validate_url(
+            url_data['loc'],
+            # Crawled pages have no sitemap alternates to compare with
+            check_hreflang=self.check_onpage and 'found_on' not in url_data,
+            lastmod=url_data.get('lastmod'),
+            alternates=url_data.get('alternates'),
+            extract_links=self._extracts_links(url_data)
+        )
+
+    def _reused_result(self, url_data: Dict) -> Optional[URLResult]:
+        """Checkpointed or previous-run result for a sitemap entry, when it may be reused"""
+        if self._extracts_links(url_data):
+            # Stored results carry no links to follow
+            return None
+        if self.checkpoint is not None:
+            resumed = self.checkpoint.take(url_data['loc'])
+            if resumed is not None:
+                return resumed
+        return self._reusable_previous_result(url_data)
+
+    def _reusable_previous_result(self, url_data: Dict) -> Optional[URLResult]:
+        """Return a copy of the previous result if the URL needs no re-check
         
-        # Check bidirectional links
-        for hreflang, href in hreflang_urls.items():
-            if hreflang == 'x-default':
-                continue
-            # The alternate page should link back
-            # This would require fetching and parsing the alternate page's hreflang tags
-            # For now, we just validate that the URL exists
-            pass
+        New URLs, URLs whose lastmod changed and URLs that failed last time are
+        always re-checked, plus a random ``resample_rate`` share of the rest.
+        """
+        previous = self.previous_results.get(url_data['loc'])
+        if previous is None or not previous.is_valid:
+            return None
+        if previous.lastmod != url_data.get('lastmod'):
+            return None
+        if random.random() < self.resample_rate:
+            return None
         
-        return issues
+        return replace(previous, cache_status='report')
 
-    async def validate_sitemap_segment(self, segment: str) -> SitemapResult:
-        """Validate a single sitemap segment (async)"""
-        sitemap_url = f"{self.base_url}/sitemap-{segment}.xml"
+    def _record_url_result(self, result: SitemapResult, url_data: Dict, url_result):
+        """Attach sitemap data to a URL result and update segment counters"""
+        if isinstance(url_result, Exception):
+            # Handle exceptions
+            url_result = URLResult(url=url_data['loc'], error=str(url_result), is_valid=False)
         
-        if HAS_RICH and self.console:
-            self.console.print(f"\n[bold cyan]Validating {segment.upper()} sitemap[/bold cyan]")
+        if 'found_on' in url_data:
+            # Crawled URLs are not sitemap nodes of the hreflang graph
+            url_result.found_on = url_data['found_on']
         else:
-            print(f"\nValidating {segment.upper()} sitemap")
+            url_result.hreflang_links = self.hreflang_graph.add(url_result.url, url_data.get('alternates', ()))
+            url_result.lastmod = url_data.get('lastmod')
+            if self.crawl_depth > 0:
+                link = normalize_link(url_result.url, url_result.url) or url_result.url
+                self._crawl_seen.add(link)
+                self._crawl_frontier.pop(link, None)
+        if url_result.outlinks:
+            self._queue_crawl_links(url_data, url_result)
+        if self.content_hash:
+            # Without a cache entry, the previous report (if any) holds the last hash
+            previous = self.previous_results.get(url_result.url)
+            self._classify_content(url_result, previous.content_hash if previous is not None else None)
+            if url_result.content_change and self._content_counted.add(url_result.url):
+                self.content_changes[url_result.content_change].append(url_result.url)
+        if self.retain_results or not url_result.is_valid or url_result.warnings:
+            result.url_results.append(url_result)
         
-        result = SitemapResult(segment=segment, total_urls=0, valid_urls=0, failed_urls=0, redirect_urls=0)
+        if url_result.is_valid:
+            result.valid_urls += 1
+        else:
+            result.failed_urls += 1
         
-        # Fetch sitemap
-        xml_content = await self.fetch_sitemap_xml(sitemap_url)
-        if not xml_content:
-            result.errors.append(f"Failed to fetch sitemap: {sitemap_url}")
-            return result
+        if url_result.redirect_chain:
+            result.redirect_urls += 1
+        result.total_bytes += url_result.content_length or 0
+        if url_result.size_source:
+            result.bytes_by_source[url_result.size_source] = (
+                result.bytes_by_source.get(url_result.size_source, 0) + (url_result.content_length or 0)
+            )
+        if url_result.asset_bytes:
+            result.asset_bytes += url_result.asset_bytes
+            self._record_page_weight(result, url_result)
         
-        # Parse URLs
-        urls = self.parse_sitemap_urls(xml_content)
-        result.total_urls = len(urls)
+        if url_result.cache_status:
+            self.result_counts[f'cache:{url_result.cache_status}'] += 1
+        if url_result.response_time is not None and url_result.cache_status not in ('hit', 'report'):
+            self._record_latency(result, url_result)
+        self.result_counts['retries'] += url_result.retries
         
-        if not urls:
-            result.errors.append("No URLs found in sitemap")
-            return result
+        for listener in self._result_listeners:
+            try:
+                listener(result.segment, url_result)
+            except Exception as e:
+                # One broken listener must not stop the run or starve the others
+                self._plugin_failed(getattr(listener, '__qualname__', repr(listener)), e)
+
+    def _plugin_errors(self) -> List[str]:
+        """Report lines for the listeners and reporters that failed during the run"""
+        return [
+            f"{name} failed {count} time(s), first: {self._listener_first_errors[name]}"
+            for name, count in self._listener_errors.items()
+        ]
+
+    def _plugin_failed(self, name: str, error: Exception):
+        """Count a failing listener or reporter call; its first failure is printed"""
+        self._listener_errors[name] += 1
+        if self._listener_errors[name] > 1:
+            return
+        self._listener_first_errors[name] = f"{type(error).__name__}: {error}"
+        message = f"{name} failed: {self._listener_first_errors[name]} (further failures only counted)"
+        if HAS_RICH and self.console:
+            self.console.print(f"[yellow]{escape(message)}[/yellow]")
+        else:
+            print(message, file=sys.stderr)
+
+    def _record_latency(self, result: SitemapResult, url_result: URLResult):
+        """Add a fetched URL's phase times to the segment histograms and the slowest-URL heap"""
+        phases = {
+            'total': url_result.response_time,
+            'connect': url_result.connect_time,
+            'ttfb': url_result.ttfb,
+            'body': url_result.body_time
+        }
+        for phase, seconds in phases.items():
+            if seconds is not None:
+                result.latency.setdefault(phase, LatencyHistogram()).record(seconds)
         
-        # Validate URLs in parallel batches
-        if HAS_RICH:
-            from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
-            
-            progress = Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(),
-                TaskProgressColumn(),
-                console=self.console
+        if self.budget.ttfb is not None and url_result.ttfb is not None and url_result.ttfb > self.budget.ttfb:
+            self._ttfb_violations.append(
+                f"{url_result.url}: TTFB {format_ms(url_result.ttfb)}ms exceeds the {format_ms(self.budget.ttfb)}ms budget"
             )
-            with progress:
-                task = progress.add_task(f"Checking {len(urls)} URLs...", total=len(urls))
-                
-                # Create all validation tasks
-                validation_tasks = [
-                    self.validate_url(url_data['loc']) 
-                    for url_data in urls
-                ]
-                
-                # Execute all validations in parallel
-                url_results = await asyncio.gather(*validation_tasks, return_exceptions=True)
-                
-                # Process results
-                for i, (url_data, url_result) in enumerate(zip(urls, url_results)):
-                    if isinstance(url_result, Exception):
-                        # Handle exceptions
-                        url_result = URLResult(url=url_data['loc'], error=str(url_result), is_valid=False)
-                    
-                    url_result.hreflang_links = url_data.get('alternates', [])
-                    result.url_results.append(url_result)
-                    
-                    if url_result.is_valid:
-                        result.valid_urls += 1
-                    else:
-                        result.failed_urls += 1
-                    
-                    if url_result.redirect_chain:
-                        result.redirect_urls += 1
-                    
-                    progress.update(task, advance=1)
+        
+        if self.slowest <= 0:
+            return
+        if len(self._slowest) >= self.slowest and url_result.response_time <= self._slowest[0][0]:
+            return
+        if any(url == url_result.url for _, url, _ in self._slowest):
+            # A URL listed in several segments is recorded once per segment but ranked once
+            return
+        entry = {
+            'url': url_result.url,
+            'segment': result.segment,
+            'status_code': url_result.status_code,
+            'response_time': url_result.response_time,
+            'connect_time': url_result.connect_time,
+            'ttfb': url_result.ttfb,
+            'body_time': url_result.body_time
+        }
+        item = (url_result.response_time, url_result.url, entry)
+        if len(self._slowest) < self.slowest:
+            heapq.heappush(self._slowest, item)
         else:
-            print(f"Checking {len(urls)} URLs in parallel (concurrency: {self.concurrency})...")
-            
-            # Create all validation tasks
-            validation_tasks = [
-                self.validate_url(url_data['loc']) 
-                for url_data in urls
-            ]
+            heapq.heapreplace(self._slowest, item)
+
+    def _record_page_weight(self, result: SitemapResult, url_result: URLResult):
+        """Keep the HEAVIEST_PAGES pages with the most asset bytes"""
+        if len(self._heaviest) >= HEAVIEST_PAGES and url_result.asset_bytes <= self._heaviest[0][0]:
+            return
+        if any(url == url_result.url for _, url, _ in self._heaviest):
+            # A page listed in several segments is listed once
+            return
+        entry = {
+            'url': url_result.url,
+            'segment': result.segment,
+            'asset_bytes': url_result.asset_bytes
+        }
+        item = (url_result.asset_bytes, url_result.url, entry)
+        if len(self._heaviest) < HEAVIEST_PAGES:
+            heapq.heappush(self._heaviest, item)
+        else:
+            heapq.heapreplace(self._heaviest, item)
+
+    def _check_performance(self, report: ValidationReport) -> List[str]:
+        """Compare segment p95 and bytes with the baseline report and collect TTFB budget violations
+        
+        Bytes are compared per size source (FULL_SIZE_SOURCES), so a run of
+        HEAD requests is never measured against one that read page bodies.
+        A bytes budget that cannot be evaluated is noted in the report.
+        """
+        regressions = []
+        baseline_segments = {}
+        if self.baseline is not None:
+            baseline_segments = {seg_result.segment: seg_result for seg_result in self.baseline.sitemap_results}
+        
+        for seg_result in report.sitemap_results:
+            previous = baseline_segments.get(seg_result.segment)
+            if previous is None:
+                continue
             
-            # Execute all validations in parallel
-            url_results = await asyncio.gather(*validation_tasks, return_exceptions=True)
+            current_total = seg_result.latency.get('total')
+            previous_total = previous.latency.get('total')
+            if self.budget.p95 is not None and current_total is not None and previous_total is not None:
+                current_p95 = current_total.percentile(95)
+                previous_p95 = previous_total.percentile(95)
+                if (current_p95 > previous_p95 * (1 + self.budget.p95)
+                        and current_p95 - previous_p95 >= LATENCY_REGRESSION_FLOOR):
+                    regressions.append(
+                        f"{seg_result.segment}: p95 response time {format_ms(current_p95)}ms vs "
+                        f"{format_ms(previous_p95)}ms in the baseline (budget +{self.budget.p95:.0%})"
+                    )
             
-            # Process results
-            for url_data, url_result in zip(urls, url_results):
-                if isinstance(url_result, Exception):
-                    # Handle exceptions
-                    url_result = URLResult(url=url_data['loc'], error=str(url_result), is_valid=False)
-                
-                url_result.hreflang_links = url_data.get('alternates', [])
-                result.url_results.append(url_result)
-                
-                if url_result.is_valid:
-                    result.valid_urls += 1
-                else:
-                    result.failed_urls += 1
-                
-                if url_result.redirect_chain:
-                    result.redirect_urls += 1
+            if self.budget.bytes is not None:
+                sources = [source for source in FULL_SIZE_SOURCES
+                           if seg_result.bytes_by_source.get(source) and previous.bytes_by_source.get(source)]
+                if not sources and seg_result.total_urls:
+                    report.performance_notes.append(
+                        f"{seg_result.segment}: bytes budget not evaluated, no full page sizes of the same source "
+                        f"in both runs (this run: {', '.join(sorted(seg_result.bytes_by_source)) or 'none'}; "
+                        f"baseline: {', '.join(sorted(previous.bytes_by_source)) or 'none'})"
+                    )
+                for source in sources:
+                    current_bytes = seg_result.bytes_by_source[source]
+                    previous_bytes = previous.bytes_by_source[source]
+                    if current_bytes > previous_bytes * (1 + self.budget.bytes):
+                        regressions.append(
+                            f"{seg_result.segment}: {current_bytes:,} bytes ({source} sizes) vs "
+                            f"{previous_bytes:,} in the baseline (budget +{self.budget.bytes:.0%})"
+                        )
         
-        return result
+        return regressions + self._ttfb_violations
 
     async def validate_all_sitemaps(self) -> ValidationReport:
         """Validate all sitemap segments (async)"""
         start_time = time.time()
         
+        if self.discover:
+            mode = "sitemaps discovered from index"
+        elif self.parallel_segments:
+            mode = "segments in parallel"
+        else:
+            mode = "segments in sequence"
+        if self.workers > 1:
+            mode += f", {self.workers} worker processes"
+        if self.crawl_depth > 0:
+            mode += f", crawling links {self.crawl_depth} levels deep"
+        if self.check_assets:
+            mode += ", checking page assets"
         if HAS_RICH and self.console:
             self.console.print(Panel.fit(
                 f"[bold]Sitemap Validation for:[/bold] [cyan]{self.base_url}[/cyan]\n"
-                f"[dim]Concurrency: {self.concurrency} parallel requests[/dim]",
+                f"[dim]Concurrency: {self.concurrency} parallel requests ({mode})[/dim]",
                 border_style="blue"
             ))
         else:
             print(f"\n{'='*70}")
             print(f"Sitemap Validation for: {self.base_url}")
-            print(f"Concurrency: {self.concurrency} parallel requests")
+            print(f"Concurrency: {self.concurrency} parallel requests ({mode})")
             print(f"{'='*70}")
         
         report = ValidationReport(
             base_url=self.base_url,
-            timestamp=datetime.now().isoformat(),
+            # A resumed run continues the report of the interrupted one
+            timestamp=(self.checkpoint.timestamp if self.checkpoint else None) or datetime.now().isoformat(),
             total_urls=0,
             valid_urls=0,
             failed_urls=0,
             redirect_urls=0
         )
         
+        telemetry_task = asyncio.create_task(self._run_telemetry()) if self.telemetry is not None else None
         try:
-            # Validate segments in parallel (but we can also do sequentially if preferred)
-            # For now, let's do them sequentially to avoid overwhelming the server
-            # but URLs within each segment are validated in parallel
-            for segment in SITEMAP_SEGMENTS:
-                segment_result = await self.validate_sitemap_segment(segment)
+            if self.discover or self.parallel_segments:
+                # All sitemaps share the semaphore and HTTP client, so the total
+                # number of in-flight requests stays capped at --concurrency
+                progress = self._create_progress()
+                with progress if progress is not None else contextlib.nullcontext():
+                    if self.discover:
+                        segment_results = await self.validate_discovered_sitemaps(progress)
+                    else:
+                        segment_results = await asyncio.gather(*(
+                            self.validate_sitemap_segment(segment, progress)
+                            for segment in SITEMAP_SEGMENTS
+                        ))
+            else:
+                # Segments run one after another, URLs within each segment in parallel
+                segment_results = []
+                for segment in SITEMAP_SEGMENTS:
+                    segment_results.append(await self.validate_sitemap_segment(segment))
+            
+            if self.crawl_depth > 0:
+                segment_results = [*segment_results, await self.validate_crawl()]
+
+            for segment_result in segment_results:
                 report.sitemap_results.append(segment_result)
                 report.total_urls += segment_result.total_urls
                 report.valid_urls += segment_result.valid_urls
                 report.failed_urls += segment_result.failed_urls
                 report.redirect_urls += segment_result.redirect_urls
             
-            # Build URL results map for hreflang validation
+            # Build URL results map (failures are always retained) for hreflang validation
             all_url_results = {}
             for segment_result in report.sitemap_results:
                 for url_result in segment_result.url_results:
@@ -485,29 +3439,45 @@ class SitemapValidator:
             else:
                 print("\nValidating hreflang links...")
             
-            for segment_result in report.sitemap_results:
-                for url_result in segment_result.url_results:
-                    # We need the original URL data with alternates
-                    # For now, we'll just check that alternates are accessible
-                    for alt in url_result.hreflang_links:
-                        alt_url = alt.get('href')
-                        if alt_url and alt_url in all_url_results:
-                            alt_result = all_url_results[alt_url]
-                            if not alt_result.is_valid:
-                                issue = f"{url_result.url}: Alternate [{alt.get('hreflang')}] {alt_url} is not accessible"
-                                report.hreflang_issues.append(issue)
+            # The graph was filled as results were recorded
+            report.hreflang_issues.extend(self.hreflang_graph.find_issues(all_url_results))
             
             # Check for redirect loops
             for url, result in all_url_results.items():
-                if result.redirect_chain and len(result.redirect_chain) > 5:
-                    report.redirect_loops.append(f"{url}: Long redirect chain ({len(result.redirect_chain)} redirects)")
+                if result.redirect_loop:
+                    report.redirect_loops.append(f"{url}: {result.error}")
+                elif result.redirect_chain and len(result.redirect_chain) - 1 > LONG_REDIRECT_CHAIN:
+                    report.redirect_loops.append(
+                        f"{url}: Long redirect chain ({len(result.redirect_chain) - 1} redirects)"
+                    )
         
         finally:
+            if telemetry_task is not None:
+                telemetry_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await telemetry_task
             # Always close the client
             await self._close_client()
+            await self._close_shards()
+            if self.cache is not None:
+                self.cache.close()
         
         report.execution_time = time.time() - start_time
+        report.slowest_urls = [entry for _, _, entry in sorted(self._slowest, reverse=True)]
+        report.heaviest_pages = [entry for _, _, entry in sorted(self._heaviest, reverse=True)]
+        report.performance_regressions = self._check_performance(report)
+        if self.content_hash:
+            report.content_changes = self.content_changes
         
+        self.report = report
+        report.plugin_errors = self._plugin_errors()
+        for reporter in self.reporters:
+            try:
+                reporter.finish(report)
+            except Exception as e:
+                self._plugin_failed(f"{type(reporter).__name__}.finish", e)
+        # Failures of the reporters themselves are added afterwards
+        report.plugin_errors = self._plugin_errors()
         return report
 
     def print_report(self, report: ValidationReport):
@@ -533,6 +3503,15 @@ class SitemapValidator:
         summary_table.add_row("URLs with Redirects", f"[yellow]{report.redirect_urls}[/yellow]" if report.redirect_urls > 0 else "0")
         summary_table.add_row("Success Rate", f"{(report.valid_urls/report.total_urls*100):.1f}%" if report.total_urls > 0 else "0%")
         summary_table.add_row("Execution Time", f"{report.execution_time:.2f}s")
+        if self.cache is not None:
+            summary_table.add_row("Served from Cache", str(self._count_cache_status('hit', 'revalidated')))
+        if self.previous_report is not None:
+            summary_table.add_row("Reused from Previous Report", str(self._count_cache_status('report')))
+        retries = self.result_counts['retries']
+        if retries:
+            summary_table.add_row("Retried Requests", f"[yellow]{retries}[/yellow]")
+        if self.adaptive:
+            summary_table.add_row("Final Adaptive Limit", str(self.semaphore.capacity))
         
         console.print(summary_table)
         
@@ -556,6 +3535,50 @@ class SitemapValidator:
         
         console.print(segment_table)
         
+        # Latency percentiles
+        if any(seg_result.latency for seg_result in report.sitemap_results):
+            console.print("\n")
+            latency_table = Table(title="Response Times (ms)", show_header=True, header_style="bold magenta")
+            latency_table.add_column("Segment", style="cyan")
+            latency_table.add_column("Requests", justify="right")
+            for column in ("p50", "p90", "p99", "Max", "TTFB p90", "Connect p90"):
+                latency_table.add_column(column, justify="right")
+            
+            for seg_result in report.sitemap_results:
+                total = seg_result.latency.get('total')
+                if total is None:
+                    continue
+                ttfb = seg_result.latency.get('ttfb', LatencyHistogram())
+                connect = seg_result.latency.get('connect', LatencyHistogram())
+                latency_table.add_row(
+                    seg_result.segment,
+                    str(total.count),
+                    format_ms(total.percentile(50)),
+                    format_ms(total.percentile(90)),
+                    format_ms(total.percentile(99)),
+                    format_ms(total.max),
+                    format_ms(ttfb.percentile(90)),
+                    format_ms(connect.percentile(90))
+                )
+            
+            console.print(latency_table)
+        
+        if report.slowest_urls:
+            console.print("\n[bold]Slowest URLs:[/bold]")
+            for entry in report.slowest_urls:
+                console.print(f"  {format_ms(entry['response_time']):>8}ms  {entry['url']} "
+                              f"[dim](ttfb {format_ms(entry['ttfb'])}ms, connect {format_ms(entry['connect_time'])}ms, "
+                              f"body {format_ms(entry['body_time'])}ms)[/dim]")
+        
+        if report.heaviest_pages:
+            segment_weights = ", ".join(
+                f"{seg_result.segment} {format_bytes(seg_result.asset_bytes)}"
+                for seg_result in report.sitemap_results if seg_result.asset_bytes
+            )
+            console.print(f"\n[bold]Heaviest Pages (asset bytes):[/bold] [dim]{segment_weights}[/dim]")
+            for entry in report.heaviest_pages:
+                console.print(f"  {format_bytes(entry['asset_bytes']):>10}  {entry['url']}")
+
         # Failed URLs
         failed_count = 0
         for seg_result in report.sitemap_results:
@@ -565,6 +3588,8 @@ class SitemapValidator:
                 for result in failed_urls[:10]:  # Limit to first 10
                     console.print(f"  [red]✗[/red] {result.url}")
                     console.print(f"    Error: {result.error}")
+                    if result.found_on:
+                        console.print(f"    [dim]Linked from: {result.found_on}[/dim]")
                     failed_count += 1
                 if len(failed_urls) > 10:
                     console.print(f"  ... and {len(failed_urls) - 10} more")
@@ -578,7 +3603,7 @@ class SitemapValidator:
                 for result in urls_with_warnings[:5]:  # Limit to first 5
                     console.print(f"  [yellow]⚠[/yellow] {result.url}")
                     for warning in result.warnings:
-                        console.print(f"    {warning}")
+                        console.print(f"    {escape(warning)}")
                     warning_count += 1
                 if len(urls_with_warnings) > 5:
                     console.print(f"  ... and {len(urls_with_warnings) - 5} more warnings")
@@ -587,7 +3612,7 @@ class SitemapValidator:
         if report.hreflang_issues:
             console.print(f"\n[bold yellow]Hreflang Issues ({len(report.hreflang_issues)}):[/bold yellow]")
             for issue in report.hreflang_issues[:10]:
-                console.print(f"  [yellow]⚠[/yellow] {issue}")
+                console.print(f"  [yellow]⚠[/yellow] {escape(issue)}")
             if len(report.hreflang_issues) > 10:
                 console.print(f"  ... and {len(report.hreflang_issues) - 10} more")
         
@@ -595,13 +3620,47 @@ class SitemapValidator:
         if report.redirect_loops:
             console.print(f"\n[bold red]Redirect Issues ({len(report.redirect_loops)}):[/bold red]")
             for loop in report.redirect_loops[:10]:
-                console.print(f"  [red]✗[/red] {loop}")
+                console.print(f"  [red]✗[/red] {escape(loop)}")
             if len(report.redirect_loops) > 10:
                 console.print(f"  ... and {len(report.redirect_loops) - 10} more")
         
+        # Content changes
+        if report.content_changes:
+            changes = report.content_changes
+            console.print(
+                f"\n[bold]Content Changes:[/bold] [yellow]{len(changes.get('changed', []))} changed[/yellow], "
+                f"{len(changes.get('unchanged', []))} unchanged, [cyan]{len(changes.get('new', []))} new[/cyan]"
+            )
+            for change, style in (('changed', 'yellow'), ('new', 'cyan')):
+                for url in changes.get(change, [])[:10]:
+                    console.print(f"  [{style}]{change}[/{style}] {url}")
+                if len(changes.get(change, [])) > 10:
+                    console.print(f"  ... and {len(changes[change]) - 10} more {change}")
+        
+        # Performance budgets
+        if report.performance_regressions:
+            console.print(f"\n[bold red]Performance Regressions ({len(report.performance_regressions)}):[/bold red]")
+            for regression in report.performance_regressions[:10]:
+                console.print(f"  [red]✗[/red] {escape(regression)}")
+            if len(report.performance_regressions) > 10:
+                console.print(f"  ... and {len(report.performance_regressions) - 10} more")
+        
+        for note in report.performance_notes:
+            console.print(f"[dim]Note: {escape(note)}[/dim]")
+        
+        if report.plugin_errors:
+            console.print(f"\n[bold yellow]Plugin Errors ({len(report.plugin_errors)}):[/bold yellow]")
+            for error in report.plugin_errors:
+                console.print(f"  [yellow]⚠[/yellow] {escape(error)}")
+        
         # Final status
         console.print("\n")
-        if report.failed_urls == 0 and not report.hreflang_issues and not report.redirect_loops:
+        if report.failed_urls == 0 and report.performance_regressions:
+            console.print(Panel.fit(
+                "[bold red]✗ All URLs are valid but performance budgets were exceeded.[/bold red]",
+                border_style="red"
+            ))
+        elif report.failed_urls == 0 and not report.hreflang_issues and not report.redirect_loops:
             console.print(Panel.fit(
                 "[bold green]✓ All sitemaps are VALID and ready for Google Search Console![/bold green]",
                 border_style="green"
@@ -617,6 +3676,10 @@ class SitemapValidator:
                 border_style="red"
             ))
 
+    def _count_cache_status(self, *statuses: str) -> int:
+        """Count URLs whose result was not freshly fetched, by cache status"""
+        return sum(self.result_counts[f'cache:{status}'] for status in statuses)
+
     def _print_plain_report(self, report: ValidationReport):
         """Print report without Rich formatting"""
         print(f"\n{'='*70}")
@@ -629,6 +3692,15 @@ class SitemapValidator:
         if report.total_urls > 0:
             print(f"Success Rate:      {(report.valid_urls/report.total_urls*100):.1f}%")
         print(f"Execution Time:    {report.execution_time:.2f}s")
+        if self.cache is not None:
+            print(f"Served from Cache: {self._count_cache_status('hit', 'revalidated')}")
+        if self.previous_report is not None:
+            print(f"Reused from Previous Report: {self._count_cache_status('report')}")
+        retries = self.result_counts['retries']
+        if retries:
+            print(f"Retried Requests:  {retries}")
+        if self.adaptive:
+            print(f"Final Adaptive Limit: {self.semaphore.capacity}")
         
         print(f"\n{'='*70}")
         print("SITEMAP SEGMENTS")
@@ -636,6 +3708,28 @@ class SitemapValidator:
         for seg_result in report.sitemap_results:
             print(f"{seg_result.segment:12} | Total: {seg_result.total_urls:4} | Valid: {seg_result.valid_urls:4} | Failed: {seg_result.failed_urls:4} | Redirects: {seg_result.redirect_urls:4}")
         
+        if any(seg_result.latency for seg_result in report.sitemap_results):
+            print(f"\n{'='*70}")
+            print("RESPONSE TIMES (ms)")
+            print(f"{'='*70}")
+            for seg_result in report.sitemap_results:
+                total = seg_result.latency.get('total')
+                if total is None:
+                    continue
+                ttfb = seg_result.latency.get('ttfb', LatencyHistogram())
+                print(f"{seg_result.segment:12} | p50: {format_ms(total.percentile(50)):>7} | p90: {format_ms(total.percentile(90)):>7} | "
+                      f"p99: {format_ms(total.percentile(99)):>7} | max: {format_ms(total.max):>7} | TTFB p90: {format_ms(ttfb.percentile(90)):>7}")
+        
+        if report.slowest_urls:
+            print("\nSlowest URLs:")
+            for entry in report.slowest_urls:
+                print(f"  {format_ms(entry['response_time']):>8}ms  {entry['url']} (ttfb {format_ms(entry['ttfb'])}ms)")
+        
+        if report.heaviest_pages:
+            print("\nHeaviest Pages (asset bytes):")
+            for entry in report.heaviest_pages:
+                print(f"  {format_bytes(entry['asset_bytes']):>10}  {entry['url']}")
+
         # Failed URLs
         for seg_result in report.sitemap_results:
             failed_urls = [r for r in seg_result.url_results if not r.is_valid]
@@ -644,12 +3738,41 @@ class SitemapValidator:
                 for result in failed_urls[:10]:
                     print(f"  ✗ {result.url}")
                     print(f"    Error: {result.error}")
+                    if result.found_on:
+                        print(f"    Linked from: {result.found_on}")
                 if len(failed_urls) > 10:
                     print(f"  ... and {len(failed_urls) - 10} more")
         
+        if report.content_changes:
+            changes = report.content_changes
+            print(f"\nContent Changes: {len(changes.get('changed', []))} changed, "
+                  f"{len(changes.get('unchanged', []))} unchanged, {len(changes.get('new', []))} new")
+            for change in ('changed', 'new'):
+                for url in changes.get(change, [])[:10]:
+                    print(f"  {change}: {url}")
+                if len(changes.get(change, [])) > 10:
+                    print(f"  ... and {len(changes[change]) - 10} more {change}")
+        
+        if report.performance_regressions:
+            print(f"\nPerformance Regressions ({len(report.performance_regressions)}):")
+            for regression in report.performance_regressions[:10]:
+                print(f"  ✗ {regression}")
+            if len(report.performance_regressions) > 10:
+                print(f"  ... and {len(report.performance_regressions) - 10} more")
+        
+        for note in report.performance_notes:
+            print(f"Note: {note}")
+        
+        if report.plugin_errors:
+            print(f"\nPlugin Errors ({len(report.plugin_errors)}):")
+            for error in report.plugin_errors:
+                print(f"  ⚠ {error}")
+        
         # Final status
         print(f"\n{'='*70}")
-        if report.failed_urls == 0:
+        if report.failed_urls == 0 and report.performance_regressions:
+            print("✗ Performance budgets exceeded - see regressions above")
+        elif report.failed_urls == 0:
             print("✓ All sitemaps are VALID!")
         else:
             print("✗ Validation FAILED - see errors above")
@@ -657,53 +3780,40 @@ class SitemapValidator:
 
     def save_report(self, report: ValidationReport, output_file: str):
         """Save report to JSON file"""
-        # Convert dataclasses to dict
-        report_dict = {
-            'base_url': report.base_url,
-            'timestamp': report.timestamp,
-            'total_urls': report.total_urls,
-            'valid_urls': report.valid_urls,
-            'failed_urls': report.failed_urls,
-            'redirect_urls': report.redirect_urls,
-            'execution_time': report.execution_time,
-            'sitemap_results': [],
-            'hreflang_issues': report.hreflang_issues,
-            'redirect_loops': report.redirect_loops
-        }
-        
-        for seg_result in report.sitemap_results:
-            seg_dict = {
-                'segment': seg_result.segment,
-                'total_urls': seg_result.total_urls,
-                'valid_urls': seg_result.valid_urls,
-                'failed_urls': seg_result.failed_urls,
-                'redirect_urls': seg_result.redirect_urls,
-                'errors': seg_result.errors,
-                'url_results': []
-            }
-            
-            for url_result in seg_result.url_results:
-                seg_dict['url_results'].append({
-                    'url': url_result.url,
-                    'status_code': url_result.status_code,
-                    'final_url': url_result.final_url,
-                    'redirect_chain': url_result.redirect_chain,
-                    'response_time': url_result.response_time,
-                    'error': url_result.error,
-                    'content_type': url_result.content_type,
-                    'is_valid': url_result.is_valid,
-                    'warnings': url_result.warnings,
-                    'hreflang_links': url_result.hreflang_links
-                })
-            
-            report_dict['sitemap_results'].append(seg_dict)
-        
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(report_dict, f, indent=2, ensure_ascii=False)
-        
+        JsonReportWriter(output_file).finish(report)
         print(f"\nReport saved to: {output_file}")
 
 
+# State of a --workers process: its own event loop and SitemapValidator, kept across batches
+_shard_worker: Dict = {}
+
+
+def _init_shard_worker(options: Dict):
+    """Process pool initializer for --workers"""
+    options = dict(options)
+    cache_dir = options.pop('cache_dir')
+    cache_ttl = options.pop('cache_ttl')
+    cache = ValidationCache(Path(cache_dir), ttl=cache_ttl, shared=True) if cache_dir else None
+    
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    _shard_worker['loop'] = loop
+    _shard_worker['validator'] = SitemapValidator(cache=cache, **options)
+
+
+def _validate_shard_batch(entries: List[Dict]) -> List[URLResult]:
+    """Validate one batch of a shard's sitemap entries in the worker process"""
+    return _shard_worker['loop'].run_until_complete(_shard_worker['validator'].validate_batch(entries))
+
+
+def _close_shard_worker():
+    """Close the worker process's HTTP client and flush its cache"""
+    validator = _shard_worker['validator']
+    _shard_worker['loop'].run_until_complete(validator._close_client())
+    if validator.cache is not None:
+        validator.cache.close()
+
+
 async def main_async():
     """Async main entry point"""
     parser = argparse.ArgumentParser(
@@ -716,6 +3826,25 @@ Examples:
   python scripts/validate_sitemap_urls.py --url https://yoursite.com --verbose
   python scripts/validate_sitemap_urls.py --url https://yoursite.com --output report.json
   python scripts/validate_sitemap_urls.py --url https://yoursite.com --concurrency 30
+  python scripts/validate_sitemap_urls.py --url https://yoursite.com --stream
+  python scripts/validate_sitemap_urls.py --url https://yoursite.com --parallel-segments
+  python scripts/validate_sitemap_urls.py --url https://yoursite.com --discover --stream
+  python scripts/validate_sitemap_urls.py --url https://yoursite.com --cache-dir .sitemap-cache --cache-ttl 3600
+  python scripts/validate_sitemap_urls.py --url https://yoursite.com --since-report previous.json --output report.json
+  python scripts/validate_sitemap_urls.py --url https://yoursite.com --http2 --concurrency 100
+  python scripts/validate_sitemap_urls.py --url https://yoursite.com --adaptive --concurrency 64 --max-retries 3
+  python scripts/validate_sitemap_urls.py --url https://yoursite.com --check-onpage
+  python scripts/validate_sitemap_urls.py --url https://yoursite.com --output report.jsonl --output-format jsonl
+  python scripts/validate_sitemap_urls.py --url https://yoursite.com --checkpoint run.ckpt --resume
+  python scripts/validate_sitemap_urls.py --url https://yoursite.com --slowest 25 --output report.json
+  python scripts/validate_sitemap_urls.py --url https://yoursite.com --baseline report.json --budget p95=15% --budget ttfb=800ms
+  python scripts/validate_sitemap_urls.py --url https://yoursite.com --workers 4 --concurrency 64
+  python scripts/validate_sitemap_urls.py --url https://yoursite.com --content-hash --cache-dir .sitemap-cache --cache-ttl 0
+  python scripts/validate_sitemap_urls.py --url https://yoursite.com --crawl --crawl-depth 2 --crawl-limit 5000
+  python scripts/validate_sitemap_urls.py --url https://yoursite.com --check-assets --max-image-kb 300
+  python scripts/validate_sitemap_urls.py --build-dir .next --sitemap-dir sitemaps/ --url https://yoursite.com
+  python scripts/validate_sitemap_urls.py --url https://yoursite.com --telemetry
+  python scripts/validate_sitemap_urls.py --url https://yoursite.com --telemetry-file /var/lib/node_exporter/sitemap.prom --telemetry-format prometheus
         """
     )
     
@@ -724,6 +3853,18 @@ Examples:
         default='http://localhost:3000',
         help='Base URL of the site (default: http://localhost:3000)'
     )
+    parser.add_argument(
+        '--build-dir',
+        metavar='DIR',
+        help='Validate offline against a Next.js build (.next) or static export (out/) instead of a '
+             'running server: URLs are resolved to prerendered files with no HTTP requests'
+    )
+    parser.add_argument(
+        '--sitemap-dir',
+        metavar='DIR',
+        help='Directory of sitemap XML files (sitemap.xml, sitemap-pages.xml, ...) for --build-dir, '
+             'needed when the sitemap routes are dynamic and not part of the build'
+    )
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
@@ -733,37 +3874,372 @@ Examples:
         '--output', '-o',
         help='Save detailed report to JSON file'
     )
+    parser.add_argument(
+        '--output-format',
+        choices=OUTPUT_FORMATS,
+        default='json',
+        help='json: one document written at the end; jsonl: one record per URL appended as it is '
+             'validated, plus a final summary (default: json)'
+    )
+    parser.add_argument(
+        '--slowest',
+        type=int,
+        default=DEFAULT_SLOWEST_URLS,
+        metavar='N',
+        help=f'List the N slowest URLs in the report (default: {DEFAULT_SLOWEST_URLS}, 0 to disable)'
+    )
+    parser.add_argument(
+        '--content-hash',
+        action='store_true',
+        help='Download page bodies and hash them (nonces and build IDs ignored) to report changed, '
+             'unchanged and new pages against --cache-dir or --since-report; with a cache, '
+             'use --cache-ttl 0 to re-check every page'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        metavar='N',
+        help='Validate in N processes, each with its own event loop and client and a hash shard of '
+             'the URLs; --concurrency is split between them (default: 1)'
+    )
+    parser.add_argument(
+        '--baseline',
+        metavar='REPORT',
+        help='Earlier JSON/JSONL report to compare segment p95 response times and bytes against'
+    )
+    parser.add_argument(
+        '--budget',
+        action='append',
+        type=parse_budget,
+        default=[],
+        metavar='KEY=VALUE',
+        help='Performance budget, repeatable: p95=PCT and bytes=PCT (allowed increase over --baseline, '
+             f'defaults p95=20%%, bytes=10%%), ttfb=MS (absolute per-URL limit). '
+             f'Exceeded budgets exit with code {EXIT_BUDGET_EXCEEDED}'
+    )
+    parser.add_argument(
+        '--checkpoint',
+        metavar='FILE',
+        help=f'Periodically checkpoint completed results and pending URLs to FILE '
+             f'(default with --resume: {DEFAULT_CHECKPOINT_FILE})'
+    )
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='Continue an interrupted run from its checkpoint, skipping already validated URLs'
+    )
     parser.add_argument(
         '--concurrency', '-c',
         type=int,
         default=DEFAULT_CONCURRENCY,
         help=f'Number of concurrent requests (default: {DEFAULT_CONCURRENCY})'
     )
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='Parse sitemaps incrementally and start validating URLs before the download finishes'
+    )
+    parser.add_argument(
+        '--parallel-segments',
+        action='store_true',
+        help='Validate all sitemap segments at the same time under the shared --concurrency budget'
+    )
+    parser.add_argument(
+        '--discover',
+        action='store_true',
+        help=f'Discover sitemaps recursively from {SITEMAP_INDEX_PATH} instead of the fixed segment list'
+    )
+    parser.add_argument(
+        '--cache-dir',
+        help='Directory for a persistent validation cache reused (with ETag/Last-Modified revalidation) across runs'
+    )
+    parser.add_argument(
+        '--cache-ttl',
+        type=float,
+        default=DEFAULT_CACHE_TTL,
+        help=f'Seconds a cached successful result is trusted without a request (default: {DEFAULT_CACHE_TTL})'
+    )
+    parser.add_argument(
+        '--since-report',
+        metavar='PREVIOUS_JSON',
+        help='Incremental mode: only re-check URLs that are new, changed lastmod or failed in this earlier report'
+    )
+    parser.add_argument(
+        '--resample',
+        type=float,
+        default=DEFAULT_RESAMPLE_RATE,
+        help=f'Fraction of unchanged URLs re-checked anyway in incremental mode (default: {DEFAULT_RESAMPLE_RATE})'
+    )
+    parser.add_argument(
+        '--request-strategy',
+        choices=REQUEST_STRATEGIES,
+        default=DEFAULT_REQUEST_STRATEGY,
+        help='head-first: HEAD with GET fallback on 405/501 or non-HTML content type; '
+             f'get: always GET, headers only (default: {DEFAULT_REQUEST_STRATEGY})'
+    )
+    parser.add_argument(
+        '--trace-redirects',
+        action='store_true',
+        help=f'Follow redirects hop by hop, recording status, Location and latency (max {MAX_REDIRECTS} hops)'
+    )
+    parser.add_argument(
+        '--http2',
+        action='store_true',
+        help='Multiplex requests over HTTP/2 connections (requires the h2 package)'
+    )
+    parser.add_argument(
+        '--max-connections',
+        type=int,
+        help='Connection pool size (default: --concurrency plus sitemap downloads)'
+    )
+    parser.add_argument(
+        '--max-keepalive',
+        type=int,
+        help='Idle connections kept in the pool (default: same as --max-connections)'
+    )
+    parser.add_argument(
+        '--keepalive-expiry',
+        type=float,
+        default=KEEPALIVE_EXPIRY,
+        help=f'Seconds an idle connection stays open (default: {KEEPALIVE_EXPIRY})'
+    )
+    parser.add_argument(
+        '--connect-timeout',
+        type=float,
+        default=CONNECT_TIMEOUT,
+        help=f'Connect timeout in seconds (default: {CONNECT_TIMEOUT})'
+    )
+    parser.add_argument(
+        '--read-timeout',
+        type=float,
+        default=TIMEOUT,
+        help=f'Read, write and pool timeout in seconds (default: {TIMEOUT})'
+    )
+    parser.add_argument(
+        '--adaptive',
+        action='store_true',
+        help='Adapt the number of in-flight requests (AIMD) to latency and errors, up to --concurrency'
+    )
+    parser.add_argument(
+        '--latency-target',
+        type=float,
+        help='Seconds above which a response counts as congestion in --adaptive mode '
+             f'(default: {ADAPTIVE_LATENCY_TOLERANCE:g}x the fastest response)'
+    )
+    parser.add_argument(
+        '--max-retries',
+        type=int,
+        default=DEFAULT_MAX_RETRIES,
+        help=f'Retries after timeouts or 429/502/503/504 responses (default: {DEFAULT_MAX_RETRIES})'
+    )
+    parser.add_argument(
+        '--retry-backoff',
+        type=float,
+        default=DEFAULT_RETRY_BACKOFF,
+        help=f'Base delay in seconds for exponential backoff with jitter (default: {DEFAULT_RETRY_BACKOFF})'
+    )
+    parser.add_argument(
+        '--check-onpage',
+        action='store_true',
+        help='Stream each page <head> and compare its hreflang/canonical links with the sitemap'
+    )
+    parser.add_argument(
+        '--crawl',
+        action='store_true',
+        help=f'Also validate the internal <a href> links found on the pages (reported as "{CRAWL_SEGMENT}")'
+    )
+    parser.add_argument(
+        '--crawl-depth',
+        type=int,
+        default=DEFAULT_CRAWL_DEPTH,
+        metavar='N',
+        help=f'Link levels followed beyond the sitemap pages with --crawl (default: {DEFAULT_CRAWL_DEPTH})'
+    )
+    parser.add_argument(
+        '--crawl-limit',
+        type=int,
+        default=DEFAULT_CRAWL_LIMIT,
+        metavar='N',
+        help=f'Maximum number of URLs checked beyond the sitemap entries with --crawl (default: {DEFAULT_CRAWL_LIMIT})'
+    )
+    parser.add_argument(
+        '--check-assets',
+        action='store_true',
+        help='Check the images (src/srcset), preloads and og:image of every page once per run with HEAD '
+             'requests and report the asset bytes per page'
+    )
+    parser.add_argument(
+        '--max-image-kb',
+        type=int,
+        default=DEFAULT_MAX_IMAGE_BYTES // 1024,
+        metavar='KB',
+        help=f'Warn about images larger than this with --check-assets (default: {DEFAULT_MAX_IMAGE_BYTES // 1024})'
+    )
+    parser.add_argument(
+        '--telemetry',
+        action='store_true',
+        help='Show live telemetry while validating: requests/s, in-flight requests, queue depth, '
+             'event-loop lag, error rate and bytes/s (a periodic line with plain output)'
+    )
+    parser.add_argument(
+        '--telemetry-file',
+        metavar='FILE',
+        help='Write telemetry samples to FILE every --telemetry-interval seconds'
+    )
+    parser.add_argument(
+        '--telemetry-format',
+        choices=TELEMETRY_FORMATS,
+        default='jsonl',
+        help='jsonl: one record per sample appended; prometheus: textfile-collector file replaced '
+             'with the latest sample (default: jsonl)'
+    )
+    parser.add_argument(
+        '--telemetry-interval',
+        type=float,
+        default=DEFAULT_TELEMETRY_INTERVAL,
+        metavar='SECONDS',
+        help=f'Seconds between telemetry file writes and plain-output lines (default: {DEFAULT_TELEMETRY_INTERVAL:g})'
+    )
     
     args = parser.parse_args()
     
     # Normalize URL
     base_url = args.url.rstrip('/')
     
+    build_index = None
+    if args.build_dir:
+        if not Path(args.build_dir).is_dir():
+            parser.error(f"--build-dir {args.build_dir} is not a directory")
+        if args.workers > 1:
+            parser.error("--build-dir validates in-process, drop --workers")
+        build_index = BuildIndex(Path(args.build_dir), Path(args.sitemap_dir) if args.sitemap_dir else None)
+        print(f"Offline mode: {len(build_index.pages)} prerendered pages, {len(build_index.dynamic_routes)} "
+              f"on-demand routes and {len(build_index.files)} files indexed from {args.build_dir}")
+    elif args.sitemap_dir:
+        parser.error("--sitemap-dir requires --build-dir")
+    
+    if args.telemetry_interval <= 0:
+        parser.error("--telemetry-interval must be positive")
+    telemetry = None
+    if args.telemetry or args.telemetry_file:
+        writers = []
+        if args.telemetry_file and args.telemetry_format == 'prometheus':
+            writers.append(PrometheusTextfileWriter(args.telemetry_file, base_url))
+        elif args.telemetry_file:
+            writers.append(JsonlTelemetryWriter(args.telemetry_file))
+        telemetry = RunTelemetry(interval=args.telemetry_interval, writers=writers, live=args.telemetry)
+
+    if args.http2:
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            print("Error: --http2 requires the 'h2' package.")
+            print("Please install it with: pip install h2")
+            return 1
+    
+    client_settings = ClientSettings(
+        http2=args.http2,
+        max_connections=args.max_connections,
+        max_keepalive_connections=args.max_keepalive,
+        keepalive_expiry=args.keepalive_expiry,
+        connect_timeout=args.connect_timeout,
+        read_timeout=args.read_timeout
+    )
+    
+    cache = ValidationCache(Path(args.cache_dir), ttl=args.cache_ttl) if args.cache_dir else None
+    previous_report = load_report(args.since_report) if args.since_report else None
+    
+    budgets = dict(args.budget)
+    if not args.baseline and ('p95' in budgets or 'bytes' in budgets):
+        parser.error("--budget p95/bytes compares against a report, add --baseline")
+    if args.baseline:
+        budgets = {**DEFAULT_BUDGETS, **budgets}
+    baseline = load_report(args.baseline) if args.baseline else None
+    
+    checkpoint = None
+    if args.checkpoint or args.resume:
+        checkpoint = ValidationCheckpoint(args.checkpoint or DEFAULT_CHECKPOINT_FILE)
+        try:
+            checkpoint.open(base_url, resume=args.resume)
+        except CheckpointError as e:
+            parser.error(str(e))
+        if args.resume:
+            print(f"Resuming from {checkpoint.path}: {len(checkpoint.completed)} URLs already validated, "
+                  f"{checkpoint.previously_pending} were pending")
+    
     # Create validator
-    validator = SitemapValidator(base_url, verbose=args.verbose, concurrency=args.concurrency)
+    options = ValidatorOptions(
+        verbose=args.verbose,
+        concurrency=args.concurrency,
+        stream=args.stream,
+        parallel_segments=args.parallel_segments,
+        discover=args.discover,
+        workers=max(1, args.workers),
+        request_strategy=args.request_strategy,
+        trace_redirects=args.trace_redirects,
+        client_settings=client_settings,
+        adaptive=args.adaptive,
+        latency_target=args.latency_target,
+        max_retries=args.max_retries,
+        retry_backoff=args.retry_backoff,
+        check_onpage=args.check_onpage,
+        content_hash=args.content_hash,
+        crawl_depth=max(0, args.crawl_depth) if args.crawl else 0,
+        crawl_limit=args.crawl_limit,
+        check_assets=args.check_assets,
+        max_image_bytes=args.max_image_kb * 1024,
+        resample_rate=args.resample,
+        retain_results=not (args.output and args.output_format == 'jsonl'),
+        slowest=args.slowest,
+        budget=PerformanceBudget(**budgets)
+    )
+    validator = SitemapValidator(
+        base_url,
+        options,
+        cache=cache,
+        previous_report=previous_report,
+        baseline=baseline,
+        checkpoint=checkpoint,
+        telemetry=telemetry,
+        transport=BuildDirTransport(build_index) if build_index is not None else None
+    )
+    
+    # Reporters are fed as results stream in and finish in this order
+    reporters: List[Reporter] = [ConsoleReporter(validator)]
+    if args.output and args.output_format == 'jsonl':
+        reporters.append(JsonlReportWriter(args.output, base_url))
+    elif args.output:
+        reporters.append(JsonReportWriter(args.output))
+    for reporter in reporters:
+        validator.add_reporter(reporter)
     
     # Run validation
     try:
         report = await validator.validate_all_sitemaps()
         
-        # Print report
-        validator.print_report(report)
-        
-        # Save to file if requested
+        if build_index is not None and build_index.on_demand:
+            print(f"\nNote: {len(build_index.on_demand)} URLs match on-demand (dynamic) routes with no "
+                  f"prerendered page; only their route was verified offline")
+
         if args.output:
-            validator.save_report(report, args.output)
+            print(f"\nReport saved to: {args.output}")
+        
+        if checkpoint is not None:
+            checkpoint.complete()
         
         # Exit with appropriate code
-        return 0 if report.failed_urls == 0 else 1
+        if report.failed_urls:
+            return 1
+        if report.performance_regressions:
+            return EXIT_BUDGET_EXCEEDED
+        return 0
         
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        # Under asyncio.run, Ctrl-C arrives here as the cancellation of this task
         print("\n\nValidation interrupted by user")
+        if checkpoint is not None:
+            print(f"Progress is checkpointed in {checkpoint.path}, continue with --resume")
         return 130
     except Exception as e:
         print(f"\nFATAL ERROR: {str(e)}", file=sys.stderr)
@@ -771,11 +4247,22 @@ Examples:
             import traceback
             traceback.print_exc()
         return 1
+    finally:
+        for reporter in reporters:
+            reporter.close()
+        if checkpoint is not None:
+            checkpoint.close()
+        if telemetry is not None:
+            telemetry.close()
 
 
 def main():
     """Main entry point wrapper for asyncio"""
-    exit_code = asyncio.run(main_async())
+    try:
+        exit_code = asyncio.run(main_async())
+    except KeyboardInterrupt:
+        # asyncio.run re-raises the interrupt once main_async has cleaned up
+        exit_code = 130
     sys.exit(exit_code)
 
 